@@ -1,25 +1,50 @@
 from __future__ import annotations
-import argparse, os, sys, traceback
+import time; _LAUNCH_T0 = time.perf_counter()  # Launch-to-tray timing (see ArcOverlayApp.__init__)
+import argparse, os, sys, traceback, threading
 import ctypes
 from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
+def get_tesseract_path():
+    """Bundled Tesseract-OCR/tesseract.exe (inside the frozen exe, or next to this script), or None."""
+    if getattr(sys, 'frozen', False):
+        return os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(sys.executable)), 'Tesseract-OCR', 'tesseract.exe')
+    local = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Tesseract-OCR', 'tesseract.exe')
+    return local if os.path.exists(local) else None
+
+# --- HEADLESS SUBCOMMANDS (before the Qt / input hook imports) ---
+if __name__ == '__main__':
+    import multiprocessing; multiprocessing.freeze_support()  # Batch scan workers of the frozen exe start (and end) here
+    if len(sys.argv) > 1 and sys.argv[1] == 'scan':
+        from modules.batch_scan import main as batch_scan_main
+        sys.exit(batch_scan_main(sys.argv[2:], default_tesseract=get_tesseract_path()))
+    if len(sys.argv) > 1 and sys.argv[1] == 'profile-imports':
+        from modules.import_profile import main as import_profile_main
+        sys.exit(import_profile_main(sys.argv[2:]))
+
 from pynput import keyboard as pynput_keyboard, mouse as pynput_mouse
 from PyQt6.QtWidgets import (QApplication, QSystemTrayIcon, QMenu,
                              QMessageBox, QProgressDialog)
 from PyQt6.QtGui import QIcon, QAction, QDesktopServices
-from PyQt6.QtCore import QObject, pyqtSignal, QThread, Qt, QUrl, QSharedMemory
+from PyQt6.QtCore import QObject, pyqtSignal, QThread, Qt, QUrl, QSharedMemory, QTimer
 
 from modules.constants import Constants
 from modules.overlay_ui import ItemOverlay, QuestOverlayUI
-from modules.progress_hub_window import ProgressHubWindow
 from modules.data_manager import ItemDatabase, DataManager
-from modules.scanner import ItemScanner
+from modules.scanner import ItemScanner, load_vision_modules
+from modules.scan_service import ScanService
 from modules.update_checker import UpdateChecker
+from modules.image_fetch_service import get_image_fetch_service, shutdown_image_fetch_service
+from modules.thumbnail_cache import generate_thumbnails
+from modules.ocr_vocabulary import ensure_ocr_vocabularies
+from modules.icon_cache import get_icon_cache
 # from modules.app_updater import AppUpdateChecker
 from modules.config_manager import ConfigManager
 
+# ProgressHubWindow (and every tab module behind it) is imported when the hub is first built;
+# pytesseract / cv2 / mss / numpy and requests on first use or by the pre-import thread (see _preimport_deferred).
+
 # --- SCIPY IMPORTS REMOVED HERE ---
 # (They used to be here, but we deleted them because we use OpenCV now)
 
@@ -115,31 +140,10 @@ class HotkeyListener(QObject):
     def _on_hub(self): self.hub_triggered.emit()
 
 # --- SCAN WORKER (THREADING) ---
-class ScanWorker(QObject):
-    """
-    Runs the screen scanning and OCR process in a separate thread.
-    """
-    finished = pyqtSignal(object)
-    error = pyqtSignal(str)
-
-    def __init__(self, scanner: ItemScanner, from_tray: bool):
-        super().__init__()
-        self.scanner = scanner
-        self.from_tray = from_tray
-
-    def run(self):
-        try:
-            # This calls the new OpenCV+MSS scanner
-            result = self.scanner.scan_screen(full_screen=self.from_tray)
-            self.finished.emit(result)
-        except Exception as e:
-            traceback.print_exc()
-            self.error.emit(str(e))
-            self.finished.emit(None)
-
 class ArcOverlayApp(QObject):
     start_data_download = pyqtSignal(list)
     start_lang_download = pyqtSignal(str)
+    HUB_IDLE_BUILD_MS = 5000  # Start minimized: pre-build the hidden hub this long after startup
 
     def __init__(self, config: Config):
         super().__init__()
@@ -155,31 +159,20 @@ class ArcOverlayApp(QObject):
         self.db = ItemDatabase()
         self.data_manager = DataManager(self.db.items)
         self.overlays = []
-        self.scan_thread = None
 
-        # 3. Initialize Scanner
+        # 3. Initialize Scanner (+ its long-lived worker thread)
         self.scanner = ItemScanner(self.cmd_config, self.data_manager)
+        self.scan_service = ScanService(self.scanner, debug=self.cmd_config.debug)
+        self.scan_service.result_ready.connect(self.handle_scan_result)
+        self.scan_service.scan_failed.connect(self.handle_scan_failed)
 
         self.reload_settings(is_initial_load=True)
 
-        # 4. Initialize Windows
-        self.progress_hub = ProgressHubWindow(
-            self.data_manager,
-            self.config_manager,
-            self.reload_settings,
-            APP_VERSION,
-            None, # lambda: self.check_for_app_updates(manual=True),
-            lang_code=self.json_lang_code
-        )
-        # NOTE: Do NOT connect to reload_progress here - it creates a new dict object
-        # which breaks references held by manager windows. The in-memory data is already correct.
+        # Pre-warmed item overlay: created hidden once and reused for every scan result
+        self.item_overlay = ItemOverlay.create_pooled(self.config_manager.parser, self.data_manager, lang_code=self.json_lang_code)
 
-        self.progress_hub.settings_tab.request_data_update.connect(self.run_manual_data_check)
-        self.progress_hub.settings_tab.request_lang_download.connect(self.run_lang_download)
-        # self.progress_hub.settings_tab.request_app_update.connect(lambda: self.check_for_app_updates(manual=True))
-        self.progress_hub.settings_tab.hotkeys_updated.connect(self.restart_hotkeys)
-
-        self.progress_hub.show()
+        # 4. Progress Hub: built on first use (self.progress_hub) so tray, hotkeys and scanner are ready first
+        self._progress_hub = None
 
         # 5. Tray & Hotkeys
         self.tray = QSystemTrayIcon()
@@ -187,12 +180,52 @@ class ArcOverlayApp(QObject):
         self._build_tray_menu()
         self.tray.activated.connect(self.on_tray_icon_activated)
         self.tray.show()
+        print(f"[INFO] Tray icon ready {(time.perf_counter() - _LAUNCH_T0) * 1000:.0f}ms after launch")
+        threading.Thread(target=self._preimport_deferred, name="PreImport", daemon=True).start()
 
         self.hotkey_thread = QThread()
         # 6. Startup Checks
         if self.ensure_data_exists():
             self.start_background_services()
 
+        # Hub once the event loop runs: shown right away, or pre-built hidden on an idle timer when starting minimized
+        if self.config_manager.get_start_minimized(): QTimer.singleShot(self.HUB_IDLE_BUILD_MS, lambda: self.progress_hub)
+        else: QTimer.singleShot(0, lambda: self.progress_hub.show())
+
+    @property
+    def progress_hub(self) -> ProgressHubWindow:
+        """The Progress Hub window; constructed (hidden) on first access."""
+        if self._progress_hub is None: self._build_progress_hub()
+        return self._progress_hub
+
+    def _build_progress_hub(self):
+        from modules.progress_hub_window import ProgressHubWindow
+        self._progress_hub = ProgressHubWindow(
+            self.data_manager,
+            self.config_manager,
+            self.reload_settings,
+            APP_VERSION,
+            None, # lambda: self.check_for_app_updates(manual=True),
+            lang_code=self.json_lang_code
+        )
+        # NOTE: Do NOT connect to reload_progress here - it creates a new dict object
+        # which breaks references held by manager windows. The in-memory data is already correct.
+
+        self._progress_hub.settings_tab.request_data_update.connect(self.run_manual_data_check)
+        self._progress_hub.settings_tab.request_lang_download.connect(self.run_lang_download)
+        # self._progress_hub.settings_tab.request_app_update.connect(lambda: self.check_for_app_updates(manual=True))
+        self._progress_hub.settings_tab.hotkeys_updated.connect(self.restart_hotkeys)
+
+    def _preimport_deferred(self):
+        """Imports the modules kept off the startup path, so the first scan / update check doesn't pay for them."""
+        t0 = time.perf_counter()
+        try:
+            load_vision_modules()
+            import requests  # noqa: F401 (first HttpClient)
+        except Exception as e:
+            print(f"[WARN] Background pre-import failed: {e}"); return
+        print(f"[INFO] Pre-imported scanner and network modules in {(time.perf_counter() - t0) * 1000:.0f}ms")
+
     def start_background_services(self):
         """Starts hotkeys and app update checks after data is verified."""
         self._start_hotkey_service()
@@ -201,6 +234,17 @@ class ArcOverlayApp(QObject):
         # Check for DATA updates on startup
         self.run_startup_data_check()
 
+        # Data synced by older versions has no pre-scaled icons yet (no-op when up to date)
+        threading.Thread(target=generate_thumbnails, name="ThumbnailGen", daemon=True).start()
+        # Same for the OCR vocabularies, so the first scan doesn't build them
+        threading.Thread(target=self._generate_ocr_vocabularies, name="OcrVocabGen", daemon=True).start()
+
+        # Quests / hideout / projects / trades load lazily; fetch them now so the first scan doesn't wait
+        threading.Thread(target=self.data_manager.warm_up, name="DataWarmUp", daemon=True).start()
+
+    def _generate_ocr_vocabularies(self):
+        if ensure_ocr_vocabularies(): self.scanner.reload_ocr_vocabulary()
+
     def run_startup_data_check(self):
         """Checks GitHub for data updates silently."""
         self.startup_updater = UpdateChecker()
@@ -294,16 +338,24 @@ class ArcOverlayApp(QObject):
         for _, (json_c, tess_c) in Constants.LANGUAGES.items():
             if tess_c == self.ocr_lang_code:
                 self.json_lang_code = json_c; break
+        self.data_manager.release_localized_views(keep_lang=self.json_lang_code)  # Language change: drop the other languages' views
 
         full_screen = self.config_manager.get_full_screen_scan()
         save_debug = self.config_manager.get_save_debug_images()
+        speculative = self.config_manager.get_speculative_scan()
+        adaptive_capture = self.config_manager.get_adaptive_capture()
 
-        self.scanner.update_settings(self.target_color, self.ocr_lang_code, self.json_lang_code, full_screen_mode=full_screen, save_debug_images=save_debug)
+        self.scanner.update_settings(self.target_color, self.ocr_lang_code, self.json_lang_code, full_screen_mode=full_screen, save_debug_images=save_debug,
+                                     speculative_scan=speculative, adaptive_capture=adaptive_capture,
+                                     preprocess_mode=self.config_manager.get_ocr_preprocess(), ocr_text_height=self.config_manager.get_ocr_text_height())
 
         # --- NEW: Trigger Live Overlay Update ---
         for overlay in self.overlays:
             if hasattr(overlay, 'refresh_ui'):
                 overlay.refresh_ui()
+        if getattr(self, 'item_overlay', None):
+            self.item_overlay.lang_code = self.json_lang_code
+            self.item_overlay.apply_settings(); self.item_overlay.refresh_ui()
         # ----------------------------------------
 
         if is_initial_load: print(f"[INFO] Settings Loaded. Lang: {self.ocr_lang_code}")
@@ -315,35 +367,22 @@ class ArcOverlayApp(QObject):
         for overlay in self.overlays:
             overlay.close()
         self.overlays.clear()
+        self.item_overlay.close() # Pooled: just hides it
 
-        # 2. Prevent overlapping scans (CRASH FIX)
-        if self.scan_thread:
-            try:
-                if self.scan_thread.isRunning():
-                    print("[INFO] Scan already in progress.")
-                    return
-            except RuntimeError:
-                # The C++ object was deleted, but Python reference exists.
-                # We catch the error and reset the variable so we can start fresh.
-                self.scan_thread = None
-
-        # 3. Setup Worker
-        self.scan_thread = QThread()
-        self.scan_worker = ScanWorker(self.scanner, from_tray)
-        self.scan_worker.moveToThread(self.scan_thread)
-
-        self.scan_thread.started.connect(self.scan_worker.run)
-        self.scan_worker.finished.connect(self.handle_scan_result)
-        self.scan_worker.finished.connect(self.scan_thread.quit)
-        self.scan_worker.finished.connect(self.scan_worker.deleteLater)
-        self.scan_thread.finished.connect(self.scan_thread.deleteLater)
+        # 2. Queue the scan: a newer press supersedes any queued or running one (latest wins)
+        seq = self.scan_service.request_scan(from_tray)
+        if self.cmd_config.debug: print(f"[DEBUG] Scan #{seq} requested.")
 
-        self.scan_thread.start()
-
-    def handle_scan_result(self, scan_result):
+    def handle_scan_result(self, seq, scan_result):
+        if not self.scan_service.is_current(seq): return # Stale: a newer press is pending
         if scan_result:
             self.display_item_overlay(scan_result)
 
+    def handle_scan_failed(self, seq, message):
+        if not self.scan_service.is_current(seq): return
+        print(f"[ERROR] Scan #{seq} failed: {message}")
+        self.tray.showMessage("Arc Overlay", f"Scan failed: {message}", QSystemTrayIcon.MessageIcon.Warning, 4000)
+
     def process_quest_log(self):
         try:
             tracked = self.data_manager.get_filtered_quests(tracked_only=True, lang_code=self.json_lang_code)
@@ -351,25 +390,24 @@ class ArcOverlayApp(QObject):
         except Exception as e: print(f"Error: {e}")
 
     def display_item_overlay(self, data):
-        # Use simple instantiation instead of factory
-        from modules.overlay_ui import ItemOverlay
-        ov = ItemOverlay(
+        # Reuse the pre-warmed overlay: content swap (only changed sections rebuilt) + move + fade-in
+        ov = self.item_overlay
+        ov.apply_settings()
+        ov.set_item(
             data['item'], 
-            self.config_manager.parser, 
             data['blueprint'], 
             data['hideout'], 
             data['project'], 
             data['trade'], 
-            self.data_manager, 
             data['note'], 
-            lang_code=self.json_lang_code, 
             stash_count=data['stash_count'], 
             is_collected_blueprint=data['is_collected_bp'],
             is_active_quest_item=data.get('is_active_quest_item', False),
-            quest_reqs=data.get('quests', [])
+            quest_reqs=data.get('quests', []),
+            data_manager=self.data_manager,
+            lang_code=self.json_lang_code
         )
         ov.show_smart()
-        self.overlays.append(ov)
 
     def display_quest_overlay(self, tracked):
         ov = QuestOverlayUI.create_window(tracked, self.config_manager.parser, self.data_manager, lang_code=self.json_lang_code)
@@ -377,7 +415,7 @@ class ArcOverlayApp(QObject):
 
     def ensure_data_exists(self):
         if not (os.path.exists(Constants.DATA_DIR) and os.path.exists(os.path.join(Constants.DATA_DIR, 'projects.json'))):
-            msg = QMessageBox(self.progress_hub if hasattr(self, 'progress_hub') else None)
+            msg = QMessageBox(self._progress_hub)
             msg.setWindowTitle("Missing Data"); msg.setText("Missing data. Download now?")
             msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             if msg.exec() == QMessageBox.StandardButton.Yes:
@@ -431,6 +469,7 @@ class ArcOverlayApp(QObject):
                     self.progress_hub.tabs.setCurrentIndex(current_tab_index)
 
                 QMessageBox.information(self.progress_hub, "Update Complete", "Data updated and reloaded successfully.")
+                if self.config_manager.get_prefetch_icons(): self.start_icon_prefetch()
             except Exception as e:
                 print(f"Error during hot reload: {e}")
                 QMessageBox.warning(self.progress_hub, "Reload Error", f"Data downloaded, but reload failed: {e}\nPlease restart the app manually.")
@@ -467,23 +506,32 @@ class ArcOverlayApp(QObject):
         if success:
             self.reload_data_subsystems()
             self.start_background_services()
+            if self.config_manager.get_prefetch_icons(): self.start_icon_prefetch()
         else: QMessageBox.critical(self.progress_hub, "Failed", message)
 
+    def start_icon_prefetch(self):
+        """Optional post-sync job: downloads every missing item icon at background priority."""
+        service = get_image_fetch_service()
+        if service.is_prefetching(): return
+        if not getattr(self, '_icon_prefetch_connected', False):
+            # Look up the hub at emit time - it is rebuilt on every data reload
+            service.prefetch_progress.connect(lambda d, t: self.progress_hub.settings_tab.set_update_status(f"Downloading item icons ({d}/{t})"))
+            service.prefetch_finished.connect(lambda ok, failed: self.progress_hub.settings_tab.set_update_status(f"Item icons ready ({ok} downloaded, {failed} failed)" if (ok or failed) else "All item icons already downloaded"))
+            self._icon_prefetch_connected = True
+        service.prefetch_all(self.data_manager.id_to_item_map.values() or self.db.items.values())
+
     def reload_data_subsystems(self):
+        get_icon_cache().clear() # Image files may have been replaced by the sync
         self.db = ItemDatabase(); self.data_manager = DataManager(self.db.items)
+        self.item_overlay.close(); self.item_overlay.set_item({}, data_manager=self.data_manager)
+        self.scan_service.cancel(); self.scanner.close()
         self.scanner = ItemScanner(self.cmd_config, self.data_manager)
-        self.progress_hub.cleanup()
-        self.progress_hub = ProgressHubWindow(self.data_manager, self.config_manager, self.reload_settings, APP_VERSION, None, lang_code=self.json_lang_code)
-
-        # --- RE-CONNECT SIGNALS ---
-        # Critical for hot reload: Re-attach buttons to their handlers
-        self.progress_hub.settings_tab.request_data_update.connect(self.run_manual_data_check)
-        self.progress_hub.settings_tab.request_lang_download.connect(self.run_lang_download)
-        # self.progress_hub.settings_tab.request_app_update.connect(lambda: self.check_for_app_updates(manual=True))
-        self.progress_hub.settings_tab.hotkeys_updated.connect(self.restart_hotkeys)
-        self.progress_hub.settings_tab.hotkeys_updated.connect(self.restart_hotkeys)
-        # --------------------------
-        self.progress_hub.show()
+        self.scan_service.set_scanner(self.scanner)
+        self.reload_settings() # The new scanner starts from defaults: re-apply colour, languages and scan options
+        # Rebuild the hub against the new data (signals are re-attached in _build_progress_hub); a never-opened hub stays lazy
+        if self._progress_hub is not None:
+            self._progress_hub.cleanup(); self._progress_hub = None
+            self.progress_hub.show()
         self._build_tray_menu()
 
 
@@ -522,14 +570,9 @@ class ArcOverlayApp(QObject):
                     self.hotkey_thread.wait()
                 except RuntimeError: pass
 
-            # Scan Thread (The one causing the error)
-            if hasattr(self, 'scan_thread') and self.scan_thread:
-                try:
-                    if self.scan_thread.isRunning():
-                        self.scan_thread.quit()
-                        self.scan_thread.wait()
-                except RuntimeError:
-                    pass # Thread was already deleted, which is fine
+            # Scan Service (waits briefly for a running OCR call to return)
+            if hasattr(self, 'scan_service'): self.scan_service.shutdown()
+            if hasattr(self, 'scanner'): self.scanner.close()
 
             # Data Update Thread
             if hasattr(self, 'data_update_thread') and self.data_update_thread:
@@ -539,11 +582,15 @@ class ArcOverlayApp(QObject):
                 except RuntimeError: pass
 
             # Progress Hub
-            if hasattr(self, 'progress_hub'):
+            if getattr(self, '_progress_hub', None) is not None:
                 try:
-                    self.progress_hub.cleanup()
+                    self._progress_hub.cleanup()
                 except RuntimeError: pass
 
+            # Image Fetch Pool
+            shutdown_image_fetch_service()
+            if self.cmd_config.debug: get_icon_cache().log_stats()
+
     def quit_app(self): self.app.quit()
     def run(self): sys.exit(self.app.exec())
 
@@ -563,22 +610,17 @@ class ArcOverlayApp(QObject):
 from modules.ui_components import set_dark_title_bar, DarkTitleBarProxy
 
 def main():
-    def get_tesseract_path():
-        if getattr(sys, 'frozen', False):
-            # Fix for Qt platform plugin error
-            base_path = getattr(sys, '_MEIPASS', os.path.dirname(sys.executable))
-            qt_plugins_path = os.path.join(base_path, 'PyQt6', 'Qt6', 'plugins')
-            if not os.path.exists(qt_plugins_path):
-                 # Alternative path for some PyInstaller versions
-                 qt_plugins_path = os.path.join(base_path, 'PyQt6', 'plugins')
-            
-            os.environ['QT_QPA_PLATFORM_PLUGIN_PATH'] = os.path.join(qt_plugins_path, 'platforms')
-            
-            return os.path.join(base_path, 'Tesseract-OCR', 'tesseract.exe')
-        local = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Tesseract-OCR', 'tesseract.exe')
-        return local if os.path.exists(local) else None
+    if getattr(sys, 'frozen', False):
+        # Fix for Qt platform plugin error
+        base_path = getattr(sys, '_MEIPASS', os.path.dirname(sys.executable))
+        qt_plugins_path = os.path.join(base_path, 'PyQt6', 'Qt6', 'plugins')
+        if not os.path.exists(qt_plugins_path):
+             # Alternative path for some PyInstaller versions
+             qt_plugins_path = os.path.join(base_path, 'PyQt6', 'plugins')
+        
+        os.environ['QT_QPA_PLATFORM_PLUGIN_PATH'] = os.path.join(qt_plugins_path, 'platforms')
 
-    parser = argparse.ArgumentParser(); parser.add_argument('--tesseract', default=get_tesseract_path()); parser.add_argument('--once', action='store_true'); parser.add_argument('--debug', action='store_true')
+    parser = argparse.ArgumentParser(epilog="Headless batch scan of saved screenshots: arcoverlay.py scan --help | Import-time report: arcoverlay.py profile-imports --help"); parser.add_argument('--tesseract', default=get_tesseract_path()); parser.add_argument('--once', action='store_true'); parser.add_argument('--debug', action='store_true')
     config = Config.from_args(parser.parse_args())
 
     if sys.platform == 'win32':
@@ -1,7 +1,7 @@
 from PyQt6.QtCore import QObject, pyqtSignal
-import requests
 import uuid
 import hashlib
+from .http_client import get_http_client
 
 class AppUpdateChecker(QObject):
     """
@@ -44,7 +44,7 @@ class AppUpdateChecker(QObject):
             }
             
             # The server will log: GET /app_version.json?uid=...&current_version=1.0.0
-            response = requests.get(self.version_url, params=params, timeout=5)
+            response = get_http_client().get(self.version_url, params=params, timeout=5)
             response.raise_for_status()
             data = response.json()
 
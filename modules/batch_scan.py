@@ -0,0 +1,156 @@
+"""
+Headless batch scan: runs tooltip detection, OCR, matching and data aggregation over image files
+in a process pool, without Qt. One JSON line per image (matched item, score, stage timings and the
+aggregated trade/hideout/project/quest data), then a throughput summary on stderr.
+
+Usage:
+    python arcoverlay.py scan IMAGES_OR_DIRS... [--workers N] [--output results.jsonl] [--lang en] [--cursor]
+    python -m modules.batch_scan ...
+
+Images are treated as screenshots: the whole image is searched for the tooltip (like the full-screen
+mode). With --cursor the scanner's normal cursor-centred search windows are replayed instead, with the
+cursor at the image centre (as in the *_raw.png debug captures).
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor
+
+from .constants import Constants
+from .ocr_vocabulary import ensure_ocr_vocabularies
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+# Per-process scanner (built once by _init_worker) and the pool start-up barrier (see _warm_up)
+_worker = None
+_barrier = None
+
+
+def collect_images(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.lower().endswith(IMAGE_EXTENSIONS))
+        elif os.path.isfile(path):
+            files.append(path)
+        else:
+            print(f"[WARN] Not found: {path}", file=sys.stderr)
+    return files
+
+
+def _init_worker(lang, tesseract_path, preprocess_mode, cursor_mode, state_dir, barrier=None):
+    global _worker, _barrier
+    _barrier = barrier
+    sys.stdout = sys.stderr  # Scanner logging must not end up between the JSON lines
+    from .data_manager import ItemDatabase, DataManager
+    from .scanner import ItemScanner
+    from .scan_stats import ScanSizeStats
+    from .capture_geometry import CaptureGeometry
+
+    scanner = ItemScanner(SimpleNamespace(tesseract_path=tesseract_path, once=False, debug=False), DataManager(ItemDatabase().items))
+    ocr_lang = next((tess for json_code, tess in Constants.LANGUAGES.values() if json_code == lang), 'eng')
+    scanner.update_settings(scanner.target_color, ocr_lang, lang, adaptive_capture=False, preprocess_mode=preprocess_mode)
+    # Keep the user's learned scan state untouched (state_dir is owned and removed by run())
+    scanner.size_stats = ScanSizeStats(os.path.join(state_dir, f"scan_stats_{os.getpid()}.json"))
+    scanner.capture_geometry = CaptureGeometry(os.path.join(state_dir, f"capture_geometry_{os.getpid()}.json"))
+    _worker = SimpleNamespace(scanner=scanner, lang=lang, full_screen=not cursor_mode)
+
+
+def _warm_up(_):
+    """One call per worker: holds its worker until all are started and initialised, so the timed run excludes start-up."""
+    if _barrier is not None: _barrier.wait(timeout=300)
+    return os.getpid()
+
+
+def _scan_one(path):
+    from .image_processor import ReplayCaptureSource
+    from .scan_metrics import ScanTrace
+
+    scanner = _worker.scanner
+    record = {'file': path, 'found': False, 'item_id': None, 'name': None, 'score': None}
+    try:
+        scanner.capture_source = ReplayCaptureSource.from_file(path)
+        trace = ScanTrace()
+        t0 = time.perf_counter(); result = scanner.scan_screen(full_screen=_worker.full_screen, trace=trace); ms = (time.perf_counter() - t0) * 1000
+    except Exception as e:
+        record['error'] = str(e)
+        return record
+
+    entry = trace.to_dict(result is not None)
+    record.update({'ms': round(ms, 2), 'stages': entry['stages'], 'flags': entry['flags'], 'score': entry['flags'].get('match_score')})
+    item = result.get('item') if result else None
+    if result:
+        record.update({'found': True, 'item_id': item.get('id') if item else None,
+                       'name': scanner.data_manager.get_localized_name(item, _worker.lang) if item else None,
+                       'trade': result.get('trade'), 'hideout': result.get('hideout'), 'project': result.get('project'), 'quests': result.get('quests'),
+                       'blueprint': result.get('blueprint')})
+    return record
+
+
+def run(paths, workers=None, output=None, lang="en", tesseract_path=None, preprocess_mode="pil", cursor_mode=False):
+    files = collect_images(paths)
+    if not files:
+        print("[ERROR] No images to scan.", file=sys.stderr); return None
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files)))
+    with contextlib.redirect_stdout(sys.stderr): ensure_ocr_vocabularies()  # Once here, not in every worker; keep stdout for the JSON lines
+
+    out = open(output, 'w', encoding='utf-8') if output else sys.stdout
+    found = errors = 0
+    with tempfile.TemporaryDirectory(prefix="arc_batch_scan_", ignore_cleanup_errors=True) as state_dir:
+        try:
+            # Start-up (data load + scanner build per worker) is timed separately in both modes
+            t_init = time.perf_counter()
+            if workers == 1:
+                _init_worker(lang, tesseract_path, preprocess_mode, cursor_mode, state_dir)
+                pool = None
+            else:
+                barrier = multiprocessing.Barrier(workers)
+                pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                           initargs=(lang, tesseract_path, preprocess_mode, cursor_mode, state_dir, barrier))
+                list(pool.map(_warm_up, range(workers)))
+            init_s = time.perf_counter() - t_init
+
+            t_start = time.perf_counter()
+            records = pool.map(_scan_one, files, chunksize=max(1, len(files) // (workers * 8))) if pool else map(_scan_one, files)
+            for record in records:
+                found += record['found']; errors += 'error' in record
+                out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n"); out.flush()
+            elapsed = time.perf_counter() - t_start
+        finally:
+            if output: out.close()
+            if pool: pool.shutdown()
+            elif _worker is not None: _worker.scanner.close()  # Flush the learned state before state_dir goes away
+
+    rate = len(files) / elapsed if elapsed > 0 else 0.0
+    summary = {'images': len(files), 'found': found, 'errors': errors, 'workers': workers, 'init_seconds': round(init_s, 2), 'seconds': round(elapsed, 2),
+               'images_per_second': round(rate, 2), 'images_per_second_per_core': round(rate / workers, 2)}
+    print(f"[INFO] Scanned {len(files)} images ({found} matched, {errors} errors) in {elapsed:.1f}s with {workers} worker(s): "
+          f"{rate:.2f} img/s, {rate / workers:.2f} img/s per core (start-up {init_s:.1f}s, not included)", file=sys.stderr)
+    return summary
+
+
+def main(argv=None, default_tesseract=None):
+    """default_tesseract: the bundled tesseract.exe found by arcoverlay.get_tesseract_path (None: use PATH)."""
+    multiprocessing.freeze_support()
+    parser = argparse.ArgumentParser(prog="arcoverlay.py scan", description="Scan saved screenshots headlessly and write one JSON line per image.")
+    parser.add_argument('paths', nargs='+', help="Image files or directories (searched recursively)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--output', default=None, help="JSON lines file (default: stdout)")
+    parser.add_argument('--lang', default="en", help="Data language code")
+    parser.add_argument('--preprocess', default="pil", choices=("pil", "cv2"), help="OCR preprocessing mode")
+    parser.add_argument('--cursor', action='store_true', help="Replay the cursor-centred search windows instead of searching the whole image")
+    parser.add_argument('--tesseract', default=default_tesseract, help="Path to the tesseract executable (default: the bundled one, else PATH)")
+    args = parser.parse_args(argv)
+
+    summary = run(args.paths, args.workers, args.output, args.lang, args.tesseract, args.preprocess, args.cursor)
+    return 0 if summary else 1
+
+
+if __name__ == '__main__': sys.exit(main())
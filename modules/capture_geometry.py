@@ -0,0 +1,101 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from .constants import Constants
+
+
+class CaptureGeometry:
+    """
+    Learns where tooltips appear relative to the cursor.
+
+    Every successful scan records the detected tooltip box as offsets from the cursor
+    (left, top, right, bottom), divided by the monitor's DPI scale so the history carries
+    over between 100% and 150% displays. Once enough scans are recorded, learned_rect()
+    returns the smallest cursor-relative rectangle covering COVERAGE of them, which the
+    scanner captures instead of the fixed 800/1200px squares.
+    """
+    HISTORY = 200       # Boxes remembered (persisted to capture_geometry.json)
+    MIN_SAMPLES = 20    # Fixed squares are used until this many tooltips were seen
+    COVERAGE = 0.99     # Fraction of recorded tooltips the learned rectangle must contain
+    MARGIN = 16         # Extra logical pixels on every side
+    SAVE_EVERY = 10     # Boxes between writes of capture_geometry.json...
+    SAVE_INTERVAL = 60.0  # ...or seconds since the last write
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(Constants.DATA_DIR, "capture_geometry.json")
+        self._lock = threading.Lock()
+        self._boxes = deque(maxlen=self.HISTORY)
+        self._learned = None  # Cached (left, top, right, bottom) in logical pixels
+        self._save_lock = threading.Lock()
+        self._unsaved = 0; self._last_save = time.monotonic()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f: data = json.load(f)
+            self._boxes.extend(tuple(float(v) for v in box) for box in data.get('boxes', []) if len(box) == 4)
+        except (OSError, ValueError, TypeError): pass
+
+    def save(self):
+        with self._lock: data = {'boxes': [list(b) for b in self._boxes]}
+        try:
+            tmp = self.path + ".tmp"
+            with open(tmp, 'w', encoding='utf-8') as f: json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[WARN] Could not save capture geometry: {e}")
+
+    def record(self, box, scale=1.0):
+        """
+        box: tooltip (left, top, right, bottom) in physical pixels relative to the cursor.
+        Kept in memory; the file is written on a background thread when a save is due (see flush).
+        """
+        scale = scale or 1.0
+        with self._lock:
+            self._boxes.append(tuple(round(v / scale, 1) for v in box))
+            self._learned = None; self._unsaved += 1
+            due = self._unsaved >= self.SAVE_EVERY or time.monotonic() - self._last_save >= self.SAVE_INTERVAL
+        if due: threading.Thread(target=self.flush, name="CaptureGeometrySave", daemon=True).start()
+
+    def flush(self):
+        """Writes unsaved boxes to disk (no-op when there are none)."""
+        with self._save_lock:
+            with self._lock:
+                if not self._unsaved: return
+                self._unsaved = 0; self._last_save = time.monotonic()
+            self.save()
+
+    def sample_count(self):
+        with self._lock: return len(self._boxes)
+
+    def learned_rect(self):
+        """Cursor-relative capture rectangle (left, top, right, bottom) in logical pixels, or None if not learned yet."""
+        with self._lock:
+            if len(self._boxes) < self.MIN_SAMPLES: return None
+            if self._learned is None: self._learned = self._cover(list(self._boxes))
+            left, top, right, bottom = self._learned
+        m = self.MARGIN
+        return (int(left - m), int(top - m), int(right + m), int(bottom + m))
+
+    def _cover(self, boxes):
+        """
+        Smallest rectangle containing all but the allowed (1 - COVERAGE) share of boxes:
+        greedily drops whichever box defining an edge shrinks the area the most.
+        """
+        drops = int(len(boxes) * (1.0 - self.COVERAGE))
+
+        def bounds(bs):
+            return (min(b[0] for b in bs), min(b[1] for b in bs), max(b[2] for b in bs), max(b[3] for b in bs))
+
+        for _ in range(drops):
+            best = None
+            for side, pick in ((0, min), (1, min), (2, max), (3, max)):
+                victim = pick(range(len(boxes)), key=lambda i: boxes[i][side])
+                rest = boxes[:victim] + boxes[victim + 1:]
+                l, t, r, b = bounds(rest)
+                area = (r - l) * (b - t)
+                if best is None or area < best[0]: best = (area, rest)
+            boxes = best[1]
+        return bounds(boxes)
@@ -12,11 +12,17 @@ class ConfigManager:
     DEFAULT_OCR_COLOR = "249, 238, 223"
     DEFAULT_FULL_SCREEN = False
     DEFAULT_DEBUG_SAVE = False
+    DEFAULT_SPECULATIVE_SCAN = False
+    DEFAULT_ADAPTIVE_CAPTURE = False
+    DEFAULT_OCR_PREPROCESS = "pil"  # "pil" (grayscale + contrast) or "cv2" (text-height normalisation + CLAHE/Otsu)
+    DEFAULT_OCR_TEXT_HEIGHT = 32
     DEFAULT_MOUSE_OCR_ENABLED = False
     DEFAULT_MOUSE_BUTTONS = "3,4,5"
 
     # General Defaults
     DEFAULT_LANG = "eng"
+    DEFAULT_PREFETCH_ICONS = False
+    DEFAULT_START_MINIMIZED = False
 
     # Item Overlay Defaults
     DEFAULT_ITEM_FONT = 12
@@ -28,6 +34,7 @@ class ConfigManager:
     DEFAULT_ANCHOR_MODE = "Mouse"
     DEFAULT_ITEM_OPACITY = 98
     DEFAULT_SECTION_ORDER = "price,storage,trader,notes,crafting,hideout,project,recycle,salvage"
+    DEFAULT_OVERLAY_RENDERER = "widgets"  # "widgets" or "painted"
 
     # Quest Overlay Defaults
     DEFAULT_QUEST_FONT = 12
@@ -96,6 +103,17 @@ class ConfigManager:
     def get_save_debug_images(self): return self.get_bool('OCR', 'save_debug_images', self.DEFAULT_DEBUG_SAVE)
     def set_save_debug_images(self, val): self.set('OCR', 'save_debug_images', val)
 
+    def get_speculative_scan(self): return self.get_bool('OCR', 'speculative_scan', self.DEFAULT_SPECULATIVE_SCAN)
+    def set_speculative_scan(self, val): self.set('OCR', 'speculative_scan', val)
+
+    def get_adaptive_capture(self): return self.get_bool('OCR', 'adaptive_capture', self.DEFAULT_ADAPTIVE_CAPTURE)
+    def set_adaptive_capture(self, val): self.set('OCR', 'adaptive_capture', val)
+
+    def get_ocr_preprocess(self): return self.get_str('OCR', 'preprocess', self.DEFAULT_OCR_PREPROCESS)
+    def set_ocr_preprocess(self, val): self.set('OCR', 'preprocess', val)
+
+    def get_ocr_text_height(self): return self.get_int('OCR', 'text_height', self.DEFAULT_OCR_TEXT_HEIGHT)
+
     def get_mouse_ocr_enabled(self): return self.get_bool('OCR', 'mouse_ocr_enabled', self.DEFAULT_MOUSE_OCR_ENABLED)
     def set_mouse_ocr_enabled(self, val): self.set('OCR', 'mouse_ocr_enabled', val)
 
@@ -106,6 +124,12 @@ class ConfigManager:
     def get_language(self): return self.get_str('General', 'language', self.DEFAULT_LANG)
     def set_language(self, val): self.set('General', 'language', val)
 
+    def get_prefetch_icons(self): return self.get_bool('General', 'prefetch_icons', self.DEFAULT_PREFETCH_ICONS)
+    def set_prefetch_icons(self, val): self.set('General', 'prefetch_icons', val)
+
+    def get_start_minimized(self): return self.get_bool('General', 'start_minimized', self.DEFAULT_START_MINIMIZED)
+    def set_start_minimized(self, val): self.set('General', 'start_minimized', val)
+
     # --- ITEM OVERLAY ---
     def get_item_font_size(self): return self.get_int('ItemOverlay', 'font_size', self.DEFAULT_ITEM_FONT)
     def get_item_duration(self): return self.get_float('ItemOverlay', 'duration_seconds', self.DEFAULT_ITEM_DURATION)
@@ -117,6 +141,8 @@ class ConfigManager:
     def get_item_anchor_mode(self): return self.get_str('ItemOverlay', 'anchor_mode', self.DEFAULT_ANCHOR_MODE)
     def get_item_opacity(self): return self.get_int('ItemOverlay', 'opacity', self.DEFAULT_ITEM_OPACITY)
     def get_overlay_section_order(self): return self.get_str('ItemOverlay', 'section_order', self.DEFAULT_SECTION_ORDER)
+    def get_overlay_renderer(self): return self.get_str('ItemOverlay', 'renderer', self.DEFAULT_OVERLAY_RENDERER)
+    def set_overlay_renderer(self, val): self.set('ItemOverlay', 'renderer', val)
 
     def set_item_overlay_settings(self, font_size, duration, show_hideout, show_project,
                                   offset_x, offset_y, anchor_mode, opacity, order_str, section_states):
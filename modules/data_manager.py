@@ -1,62 +1,64 @@
-import json
 import os
+import time
 import shutil
+import threading
 from typing import Optional
 from .constants import Constants
 from .database_manager import DatabaseManager
+from .data_snapshot import load_snapshot, save_snapshot, data_fingerprint
+from .json_loader import load_json_dir, load_json_file
+from .localization import LocalizedView, entity_name
 
 class ItemDatabase:
-    """Loads and holds all item data from the /data/items/ directory."""
-    def __init__(self): 
-        self.items = self._load_items_from_dir(Constants.ITEMS_DIR)
+    """Loads and holds all item data from the /data/items/ directory (or the compiled data snapshot)."""
+    def __init__(self, use_snapshot: bool = True): 
+        snapshot = load_snapshot() if use_snapshot else None
+        self.items = snapshot['items'] if snapshot else self._load_items_from_dir(Constants.ITEMS_DIR)
         
-    def _load_items_from_dir(self, directory: str):
+    @staticmethod
+    def _load_items_from_dir(directory: str):
         choices = {}
         if not os.path.exists(directory): 
             print(f"Warning: Items directory not found: {directory}. Using empty database.")
             return choices
             
-        for filename in os.listdir(directory):
-            if filename.endswith('.json'):
-                filepath = os.path.join(directory, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        item_object = json.load(f)
-                        name_obj = item_object.get('name')
-                        
-                        if isinstance(name_obj, dict):
-                            if 'en' in name_obj: item_object['name'] = str(name_obj['en']).strip()
-                            item_object['names'] = name_obj
-                            for lang_code, name_val in name_obj.items():
-                                if name_val: choices[str(name_val).strip()] = item_object
-                                    
-                        elif isinstance(name_obj, str): 
-                             item_name = str(name_obj).strip()
-                             item_object['name'] = item_name
-                             item_object['names'] = {'en': item_name}
-                             choices[item_name] = item_object
-
-                except Exception as e:
-                    print(f"Error loading item file {filename}: {e}")
+        # Files are read in parallel; normalisation stays in listing order so name collisions resolve as before
+        for filename, item_object in load_json_dir(directory, "item"):
+            if not isinstance(item_object, dict):
+                print(f"Error loading item file {filename}: not a JSON object"); continue
+            name_obj = item_object.get('name')
+
+            if isinstance(name_obj, dict):
+                if 'en' in name_obj: item_object['name'] = str(name_obj['en']).strip()
+                item_object['names'] = name_obj
+                for lang_code, name_val in name_obj.items():
+                    if name_val: choices[str(name_val).strip()] = item_object
+
+            elif isinstance(name_obj, str): 
+                 item_name = str(name_obj).strip()
+                 item_object['name'] = item_name
+                 item_object['names'] = {'en': item_name}
+                 choices[item_name] = item_object
         return choices
 
 class DataManager:
     def __init__(self, items):
         self.items = items
-        self.item_names_lower = [name.lower() for name in self.items.keys()]
-        
-        self.hideout_data = self._load_json_dir(Constants.HIDEOUT_DIR)
-        self.project_data = self._load_json(Constants.PROJECTS_FILE, [])
-        self.trade_data = self._load_json(Constants.TRADES_FILE, [])
-        self.item_to_trades_map = {}
-        for trade in self.trade_data:
-            item_id = trade.get('itemId')
-            if item_id: self.item_to_trades_map.setdefault(item_id, []).append(trade)
-        
-        self.maps_data = self._load_json(Constants.MAPS_FILE, [])
-        self.id_to_map = {m.get('id'): m for m in self.maps_data if m.get('id')}
-            
-        self.quest_data = self._load_json_dir(Constants.QUESTS_DIR)
+
+        # --- Static game data + derived indexes ---
+        # Item indexes (needed by the scanner) are built right away; quests/hideout/projects/trades/maps are
+        # loaded on first access (or by warm_up() in the background). A valid data snapshot provides everything in one read.
+        self._game_data = {}
+        self._localized_views = {}  # lang_code -> LocalizedView (see localized)
+        self._secondary_lock = threading.Lock()
+        self._fingerprint = data_fingerprint()
+        snapshot = load_snapshot(self._fingerprint)
+        self._snapshot_pending = not snapshot  # Nothing valid on disk: compile one once the secondary data is loaded
+        if snapshot and snapshot['items'] is items:
+            self._game_data = {key: snapshot[key] for key in self.GAME_DATA_KEYS}
+        else:
+            self._game_data = self._build_item_indexes(items)
+        for key in self.INDEX_KEYS: setattr(self, key, self._game_data[key])
         
         # --- NEW: SQL Database ---
         self.db = DatabaseManager()
@@ -68,13 +70,76 @@ class DataManager:
         if 'stash_inventory' not in self.user_progress:
             self.user_progress['stash_inventory'] = {}
         
-        self.id_to_item_map = {}
-        for item in self.items.values():
-            if item.get('id'): self.id_to_item_map[item['id']] = item
-        
-        self.id_to_name_map = {i_id: item.get('name', 'Unknown') for i_id, item in self.id_to_item_map.items()}
         self._backup_progress()
 
+    # Attributes compiled into the data snapshot (see _build_game_data)
+    INDEX_KEYS = ('item_names_lower', 'id_to_item_map', 'id_to_name_map')
+    SECONDARY_KEYS = ('hideout_data', 'project_data', 'trade_data', 'item_to_trades_map', 'maps_data', 'id_to_map', 'quest_data')
+    GAME_DATA_KEYS = INDEX_KEYS + SECONDARY_KEYS
+
+    def _lazy_game_data(key):
+        def getter(self):
+            try: return self._game_data[key]
+            except KeyError: self._ensure_secondary_data(); return self._game_data[key]
+        def setter(self, value): self._game_data[key] = value; self._localized_views.clear()
+        return property(getter, setter)
+
+    hideout_data = _lazy_game_data('hideout_data')
+    project_data = _lazy_game_data('project_data')
+    trade_data = _lazy_game_data('trade_data')
+    item_to_trades_map = _lazy_game_data('item_to_trades_map')
+    maps_data = _lazy_game_data('maps_data')
+    id_to_map = _lazy_game_data('id_to_map')
+    quest_data = _lazy_game_data('quest_data')
+    del _lazy_game_data
+
+    def _ensure_secondary_data(self):
+        with self._secondary_lock:
+            if all(key in self._game_data for key in self.SECONDARY_KEYS): return
+            t0 = time.perf_counter()
+            self._game_data.update(self._build_secondary_data())
+            print(f"[INFO] Secondary game data loaded in {(time.perf_counter() - t0) * 1000:.0f}ms")
+            if self._snapshot_pending:
+                self._snapshot_pending = False
+                save_snapshot({'items': self.items, **{key: self._game_data[key] for key in self.GAME_DATA_KEYS}}, self._fingerprint)
+
+    def warm_up(self):
+        """Loads the lazily loaded game data now (meant for a background thread right after startup)."""
+        try: self._ensure_secondary_data()
+        except Exception as e: print(f"[WARN] Background data load failed: {e}")
+
+    @staticmethod
+    def _build_item_indexes(items):
+        id_to_item_map = {}
+        for item in items.values():
+            if item.get('id'): id_to_item_map[item['id']] = item
+        return {'item_names_lower': [name.lower() for name in items.keys()],
+                'id_to_item_map': id_to_item_map,
+                'id_to_name_map': {i_id: item.get('name', 'Unknown') for i_id, item in id_to_item_map.items()}}
+
+    @staticmethod
+    def _build_secondary_data():
+        data = {}
+        data['hideout_data'] = DataManager._load_json_dir(Constants.HIDEOUT_DIR)
+        data['project_data'] = DataManager._load_json(Constants.PROJECTS_FILE, [])
+        data['trade_data'] = DataManager._load_json(Constants.TRADES_FILE, [])
+        item_to_trades_map = {}
+        for trade in data['trade_data']:
+            item_id = trade.get('itemId')
+            if item_id: item_to_trades_map.setdefault(item_id, []).append(trade)
+        data['item_to_trades_map'] = item_to_trades_map
+
+        data['maps_data'] = DataManager._load_json(Constants.MAPS_FILE, [])
+        data['id_to_map'] = {m.get('id'): m for m in data['maps_data'] if m.get('id')}
+
+        data['quest_data'] = DataManager._load_json_dir(Constants.QUESTS_DIR)
+        return data
+
+    @staticmethod
+    def _build_game_data(items):
+        """Loads the static JSON game data and builds the lookup maps. Returns {GAME_DATA_KEYS: value}."""
+        return {**DataManager._build_item_indexes(items), **DataManager._build_secondary_data()}
+
     def _load_user_progress(self):
         # 1. Check if we need to migrate
         is_migrated = self.db.get_state('is_migrated', False)
@@ -146,22 +211,15 @@ class DataManager:
         except: pass
         print("[INFO] Migration complete.")
 
-    def _load_json(self, filepath: str, default=None):
+    @staticmethod
+    def _load_json(filepath: str, default=None):
         if not os.path.exists(filepath): return default or {}
-        try: 
-            with open(filepath, 'r', encoding='utf-8') as f: return json.load(f)
+        try: return load_json_file(filepath)
         except: return default or {}
 
-    def _load_json_dir(self, directory: str):
-        data_list = []
-        if not os.path.exists(directory): return data_list
-        for filename in os.listdir(directory):
-            if filename.endswith('.json'):
-                filepath = os.path.join(directory, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f: data_list.append(json.load(f))
-                except Exception as e: print(f"Error loading data file {filename} from {directory}: {e}")
-        return data_list
+    @staticmethod
+    def _load_json_dir(directory: str):
+        return [data for _, data in load_json_dir(directory)]
 
     def _backup_progress(self):
         # We can still backup the DB file
@@ -248,16 +306,24 @@ class DataManager:
         self.user_progress['active_quest_id'] = quest_id
         self.save_user_progress()
 
+    # --- LOCALIZATION ---
+    def localized(self, lang_code='en') -> LocalizedView:
+        """Precomputed display strings for one language (built on first use, dropped by release_localized_views)."""
+        view = self._localized_views.get(lang_code)
+        if view is None: view = self._localized_views[lang_code] = LocalizedView(self, lang_code)
+        return view
+
+    def release_localized_views(self, keep_lang=None):
+        """Drops the cached views (all but keep_lang), e.g. after a language change."""
+        for lang in [l for l in self._localized_views if l != keep_lang]: del self._localized_views[lang]
+
     def get_localized_name(self, item_identifier, lang_code='en'):
-        item = None
-        if isinstance(item_identifier, dict): item = item_identifier
-        elif isinstance(item_identifier, str): item = self.id_to_item_map.get(item_identifier) or self.id_to_map.get(item_identifier)
-        if not item: return item_identifier.replace('_', ' ').title() if isinstance(item_identifier, str) else "Unknown"
-        names = item.get('names', {})
-        if isinstance(names, dict) and lang_code in names: return names[lang_code]
-        name_field = item.get('name')
-        if isinstance(name_field, dict): return name_field.get(lang_code, name_field.get('en', 'Unknown'))
-        elif isinstance(name_field, str): return name_field
+        if isinstance(item_identifier, str):
+            name = self.localized(lang_code).item_names.get(item_identifier)
+            if name is not None: return name
+            item = self.id_to_map.get(item_identifier)
+            return entity_name(item, lang_code) if item else item_identifier.replace('_', ' ').title()
+        if isinstance(item_identifier, dict): return entity_name(item_identifier, lang_code)
         return "Unknown"
 
     def get_tracked_items_data(self) -> dict:
@@ -287,39 +353,24 @@ class DataManager:
 
 
     def get_quest_map_names(self, quest_data, lang_code='en'):
-        map_ids = quest_data.get('map')
-        if not map_ids: return []
-        if isinstance(map_ids, str): map_ids = [map_ids]
-        names = []
-        for mid in map_ids:
-            map_obj = self.id_to_map.get(mid)
-            names.append(self.get_localized_name(map_obj, lang_code) if map_obj else mid.replace('_', ' ').title())
-        return names
+        if 'map_names' in quest_data: return list(quest_data['map_names'])  # Record from get_filtered_quests
+        return self.localized(lang_code).quest_map_names(quest_data)
 
     def get_filtered_quests(self, tracked_only: bool = False, lang_code='en'):
         if 'quests' not in self.user_progress: self.user_progress['quests'] = {}
         all_quest_info = []
-        for quest in self.quest_data:
-            q_id = quest.get('id')
-            if not q_id: continue
-            info = quest.copy()
-            if isinstance(info.get('name'), dict): info['name'] = info['name'].get(lang_code, info['name'].get('en', 'Unknown'))
-            original_objs, flat_objs = info.get('objectives', []), []
-            for obj in original_objs:
-                if isinstance(obj, dict): flat_objs.append(obj.get(lang_code, obj.get('en', 'Unknown')))
-                elif isinstance(obj, str): flat_objs.append(obj)
-            info['objectives'] = flat_objs
+        for record in self.localized(lang_code).quests:
+            q_id = record['id']
             progress = self.user_progress['quests'].get(q_id, {})
+            if tracked_only and (not progress.get('is_tracked', False) or progress.get('quest_completed', False)): continue
+            info = dict(record)
             info.update(is_completed=progress.get('quest_completed', False), is_tracked=progress.get('is_tracked', False), objectives_completed=progress.get('objectives_completed', []))
             all_quest_info.append(info)
         custom_order = self.user_progress.get('quest_order', [])
-        def sort_key(q):
-            q_id = q['id']
-            order_index = custom_order.index(q_id) if q_id in custom_order else len(custom_order)
-            return (not q['is_tracked'], order_index, q['is_completed'])
-        sorted_quests = sorted(all_quest_info, key=sort_key)
-        if tracked_only: return sorted([q for q in all_quest_info if q['is_tracked'] and not q['is_completed']], key=lambda q: custom_order.index(q['id']) if q['id'] in custom_order else 999)
-        else: return sorted_quests
+        order_pos = {}
+        for i, q_id in enumerate(custom_order): order_pos.setdefault(q_id, i)
+        if tracked_only: return sorted(all_quest_info, key=lambda q: order_pos.get(q['id'], 999))
+        return sorted(all_quest_info, key=lambda q: (not q['is_tracked'], order_pos.get(q['id'], len(custom_order)), q['is_completed']))
 
 
 
@@ -359,9 +410,10 @@ class DataManager:
         if not target_item or 'id' not in target_item: return []
         tid = target_item['id']
         h_inv = self.user_progress.get('hideout_inventory', {})
+        station_names = self.localized(lang_code).station_names
         for station in self.hideout_data:
             sid = station.get('id')
-            sname = self.get_localized_name(station, lang_code)
+            sname = station_names.get(sid) or self.get_localized_name(station, lang_code)
             cur_lvl = self.user_progress.get(station.get('id'), 0)
             for lvl_info in station.get('levels', []):
                 lvl = lvl_info.get('level', 0)
@@ -391,9 +443,10 @@ class DataManager:
         # DEBUG PRINT
         print(f"[DEBUG] Searching project reqs for {tid} ({item_name})")
 
+        project_names = self.localized(lang_code).project_names
         for proj in self.project_data:
             pid = proj.get('id')
-            pname = self.get_localized_name(proj, lang_code)
+            pname = project_names.get(pid) or self.get_localized_name(proj, lang_code)
             if 'Project' in pname: pname = pname.replace('Project', '').strip()
             # Filter inactive projects
             if proj.get('disabled', False): continue
@@ -438,9 +491,10 @@ class DataManager:
         tid = target_item['id']
         active_id = self.get_active_quest_id()
         
+        quest_names = self.localized(lang_code).quest_names
         for quest in self.quest_data:
             qid = quest.get('id')
-            qname = self.get_localized_name(quest, lang_code)
+            qname = quest_names.get(qid) or self.get_localized_name(quest, lang_code)
             
             # Check requirements
             reqs = quest.get('requiredItemIds', [])
@@ -453,4 +507,13 @@ class DataManager:
                     results.append((f"{qname}: x{needed}", is_active, is_complete))
         return results
 
-    def get_item_by_name(self, name: str): return self.items.get(name)
\ No newline at end of file
+    def get_item_by_name(self, name: str): return self.items.get(name)
+
+
+def build_game_data_snapshot():
+    """Compiles the JSON game data into the startup snapshot. Run after every data sync."""
+    fingerprint = data_fingerprint()
+    items = ItemDatabase(use_snapshot=False).items
+    ok = save_snapshot({'items': items, **DataManager._build_game_data(items)}, fingerprint)
+    if ok: print(f"[INFO] Game data snapshot written ({len(items)} item names).")
+    return ok
@@ -0,0 +1,70 @@
+import os
+import time
+import pickle
+import hashlib
+from .constants import Constants
+
+# Compiled game data (items, quests, hideout, projects, trades, maps + derived indexes) in one pickle,
+# written after every data sync so startup is a single read instead of one open per JSON file.
+SNAPSHOT_FILE = os.path.join(Constants.DATA_DIR, "game_data.snapshot")
+SNAPSHOT_VERSION = 1  # Bump when the snapshot layout or the loaders' normalisation changes
+
+_SOURCE_DIRS = (Constants.ITEMS_DIR, Constants.HIDEOUT_DIR, Constants.QUESTS_DIR)
+_SOURCE_FILES = (Constants.PROJECTS_FILE, Constants.TRADES_FILE, Constants.MAPS_FILE)
+
+# Last loaded snapshot, so ItemDatabase and DataManager share one read: (fingerprint, data)
+_loaded = (None, None)
+
+
+def data_fingerprint():
+    """Hash over name, size and mtime of every game data file (directory listings only, no file opens)."""
+    h = hashlib.sha1(f"v{SNAPSHOT_VERSION}".encode('utf-8'))
+    for directory in _SOURCE_DIRS:
+        try: entries = sorted((e.name, e.stat().st_size, e.stat().st_mtime_ns) for e in os.scandir(directory) if e.name.endswith('.json'))
+        except OSError: entries = None
+        h.update(repr((os.path.basename(directory), entries)).encode('utf-8'))
+    for path in _SOURCE_FILES:
+        try: st = os.stat(path); stamp = (st.st_size, st.st_mtime_ns)
+        except OSError: stamp = None
+        h.update(repr((os.path.basename(path), stamp)).encode('utf-8'))
+    return h.hexdigest()
+
+
+def load_snapshot(fingerprint=None):
+    """The snapshot data dict if it matches the current data files, else None (callers fall back to JSON)."""
+    global _loaded
+    fingerprint = fingerprint or data_fingerprint()
+    if _loaded[0] == fingerprint: return _loaded[1]
+    t0 = time.perf_counter()
+    try:
+        with open(SNAPSHOT_FILE, 'rb') as f:
+            header = pickle.load(f)
+            if not isinstance(header, dict) or header.get('fingerprint') != fingerprint: return None
+            data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # Truncated / written by an incompatible version
+        print(f"[WARN] Ignoring unreadable data snapshot: {e}")
+        return None
+    _loaded = (fingerprint, data)
+    print(f"[INFO] Loaded game data snapshot in {(time.perf_counter() - t0) * 1000:.0f}ms")
+    return data
+
+
+def save_snapshot(data, fingerprint=None):
+    """Writes the snapshot atomically. Returns True on success."""
+    global _loaded
+    fingerprint = fingerprint or data_fingerprint()
+    tmp = f"{SNAPSHOT_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            pickle.dump({'fingerprint': fingerprint, 'version': SNAPSHOT_VERSION, 'created': time.time()}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, SNAPSHOT_FILE)
+    except Exception as e:
+        print(f"[WARN] Could not write data snapshot: {e}")
+        try: os.remove(tmp)
+        except OSError: pass
+        return False
+    _loaded = (fingerprint, data)
+    return True
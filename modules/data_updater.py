@@ -1,8 +1,8 @@
 import os
-import requests
 import zipfile
 import shutil
 from PyQt6.QtCore import QObject, pyqtSignal
+from .http_client import get_http_client
 
 class DataUpdateWorker(QObject):
     progress = pyqtSignal(int)
@@ -18,20 +18,13 @@ class DataUpdateWorker(QObject):
         temp_zip = os.path.join(self.target_dir, "temp_data.zip")
         try:
             self.status.emit("Connecting...")
-            response = requests.get(self.download_url, stream=True, timeout=15)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
+
+            def on_progress(downloaded, total_size):
+                if total_size > 0:
+                    self.progress.emit(int((downloaded / total_size) * 100))
+
             self.status.emit("Downloading data...")
-            with open(temp_zip, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            self.progress.emit(int((downloaded / total_size) * 100))
+            get_http_client().download_to_file(self.download_url, temp_zip, timeout=15, progress_callback=on_progress)
             
             self.status.emit("Extracting files...")
             with zipfile.ZipFile(temp_zip, 'r') as zip_ref:
@@ -66,6 +59,21 @@ class DataUpdateWorker(QObject):
             from .database_fixer import DatabaseFixer
             self.status.emit("Applying fixes...")
             fix_count = DatabaseFixer.apply_fixes(self.target_dir)
+
+            # --- PRE-SCALE ITEM ICONS ---
+            from .thumbnail_cache import generate_thumbnails
+            self.status.emit("Generating thumbnails...")
+            generate_thumbnails(os.path.join(self.target_dir, "images", "items"))
+
+            # --- OCR VOCABULARIES ---
+            from .ocr_vocabulary import generate_ocr_vocabularies
+            self.status.emit("Building OCR vocabularies...")
+            generate_ocr_vocabularies(os.path.join(self.target_dir, "items"))
+
+            # --- COMPILE STARTUP SNAPSHOT ---
+            from .data_manager import build_game_data_snapshot
+            self.status.emit("Compiling game data...")
+            build_game_data_snapshot()
             
             self.finished.emit(True, f"Update successful! ({fix_count} fixes applied)")
             
@@ -13,6 +13,7 @@ class HideoutManagerWindow(BasePage):
         self.raw_hideout_data = hideout_data
         self.user_progress = user_progress
         self.lang_code = lang_code 
+        self.names = data_manager.localized(lang_code)  # Precomputed display strings
         
         # self.user_progress is now accessed directly via self.data_manager.user_progress
         # to ensure we always have the latest reference even if DataManager reloads it.
@@ -70,7 +71,7 @@ class HideoutManagerWindow(BasePage):
             
             header.addWidget(btn_up); header.addWidget(btn_down)
             
-            display_name = self.data_manager.get_localized_name(station, self.lang_code)
+            display_name = self.names.station_names[station_id]
             name_lbl = QLabel(display_name, objectName="Header")
             name_lbl.setStyleSheet("font-size: 16px; font-weight: bold; color: #4476ED; border: none;")
             header.addWidget(name_lbl); header.addStretch()
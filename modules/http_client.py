@@ -0,0 +1,163 @@
+import os
+import json
+import hashlib
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+from .constants import Constants
+
+
+class HttpClient:
+    """
+    Shared HTTP client for all network I/O (data sync, language packs, item images, app update check).
+
+    Owns a single pooled requests.Session with retry/backoff so connections are reused across
+    calls, and keeps an on-disk ETag / Last-Modified cache for JSON API responses so repeated
+    checks turn into cheap 304s.
+
+    The base URL can be overridden with the ARCOVERLAY_HTTP_BASE_URL environment variable
+    (e.g. "http://127.0.0.1:8000"). Every absolute URL then keeps its path but is sent to that host,
+    which allows running against a local server.
+    """
+    BASE_URL_ENV = "ARCOVERLAY_HTTP_BASE_URL"
+    DEFAULT_TIMEOUT = 10
+    USER_AGENT = "ArcOverlay"
+
+    def __init__(self, base_url=None, cache_dir=None, retries=3, backoff=0.5, pool_size=16):
+        self.base_url = (base_url if base_url is not None else os.environ.get(self.BASE_URL_ENV, "")).rstrip("/")
+        self.cache_dir = cache_dir or os.path.join(Constants.DATA_DIR, "http_cache")
+        self._cache_lock = threading.Lock()
+
+        # requests / urllib3 are imported here, on the first network call, to keep them off the startup path
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=retries, connect=retries, read=retries, status=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": self.USER_AGENT})
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    # --- URL HANDLING ---
+    def resolve(self, url):
+        """Applies the base URL override (if any) to an absolute URL."""
+        if not self.base_url: return url
+        parts = urlsplit(url)
+        base = urlsplit(self.base_url)
+        path = base.path.rstrip("/") + parts.path
+        return urlunsplit((base.scheme, base.netloc, path, parts.query, parts.fragment))
+
+    # --- PLAIN REQUESTS ---
+    def get(self, url, timeout=None, **kwargs):
+        """Pooled GET. Same signature as requests.get."""
+        return self.session.get(self.resolve(url), timeout=timeout or self.DEFAULT_TIMEOUT, **kwargs)
+
+    def head(self, url, timeout=None, **kwargs):
+        return self.session.head(self.resolve(url), timeout=timeout or self.DEFAULT_TIMEOUT, **kwargs)
+
+    def download_to_file(self, url, dest_path, timeout=None, chunk_size=8192, progress_callback=None, should_abort=None):
+        """
+        Streams a URL to disk. Writes to a .part file and renames on success so a failed
+        or aborted download never leaves a truncated file behind.
+        Returns True on success, False if aborted. Raises on HTTP / IO errors.
+        """
+        os.makedirs(os.path.dirname(dest_path) or ".", exist_ok=True)
+        tmp_path = dest_path + ".part"
+        try:
+            with self.get(url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                total_size = int(response.headers.get('content-length', 0))
+                downloaded = 0
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if should_abort and should_abort(): break
+                        if chunk:
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            if progress_callback: progress_callback(downloaded, total_size)
+                    else:
+                        f.close()
+                        os.replace(tmp_path, dest_path)
+                        return True
+            return False
+        finally:
+            if os.path.exists(tmp_path):
+                try: os.remove(tmp_path)
+                except OSError: pass
+
+    # --- CONDITIONAL (CACHED) JSON ---
+    def _cache_path(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_cache(self, url):
+        path = self._cache_path(url)
+        if not os.path.exists(path): return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f: return json.load(f)
+        except (OSError, json.JSONDecodeError): return None
+
+    def _write_cache(self, url, etag, last_modified, body):
+        entry = {'url': url, 'etag': etag, 'last_modified': last_modified, 'body': body}
+        path = self._cache_path(url)
+        with self._cache_lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f: json.dump(entry, f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"[WARN] Could not write HTTP cache for {url}: {e}")
+
+    def get_json(self, url, timeout=None, params=None, use_cache=True):
+        """
+        GETs a JSON document. When use_cache is set, sends If-None-Match / If-Modified-Since from the
+        previous response and serves the cached body on 304 Not Modified.
+        """
+        if not use_cache:
+            response = self.get(url, timeout=timeout, params=params)
+            response.raise_for_status()
+            return response.json()
+
+        cache_key = self.resolve(url) if not params else f"{self.resolve(url)}?{sorted(params.items())}"
+        cached = self._read_cache(cache_key)
+        headers = {}
+        if cached:
+            if cached.get('etag'): headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'): headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self.get(url, timeout=timeout, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached.get('body')
+
+        response.raise_for_status()
+        body = response.json()
+        etag = response.headers.get('ETag'); last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified: self._write_cache(cache_key, etag, last_modified, body)
+        return body
+
+    def close(self):
+        self.session.close()
+
+
+# --- SHARED INSTANCE ---
+_client = None
+_client_lock = threading.Lock()
+
+def get_http_client():
+    """Returns the process-wide HttpClient, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None: _client = HttpClient()
+    return _client
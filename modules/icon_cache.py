@@ -0,0 +1,114 @@
+import os
+from collections import OrderedDict
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+from .constants import Constants
+from .ui_components import load_item_pixmap
+
+
+class IconCache:
+    """
+    Process-wide LRU cache of ready-to-use QPixmaps, shared by the item overlay,
+    the settings preview and the Item Database.
+
+    Item icons are keyed by (item_id, size), static UI icons by (path, size). Entries are
+    evicted least-recently-used once the decoded size exceeds the memory budget.
+    GUI thread only (QPixmap is not thread-safe).
+    """
+    DEFAULT_BUDGET_BYTES = 24 * 1024 * 1024
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # key -> (pixmap, cost_bytes)
+        self._bytes = 0
+        self.hits = 0; self.misses = 0; self.evictions = 0
+
+    # --- LOOKUPS ---
+    def item_pixmap(self, item, size, data_manager=None):
+        """
+        Icon for an item dict (or item id, resolved through data_manager) at size x size.
+        Returns None if the image is not on disk yet.
+        """
+        if isinstance(item, dict): item_id = item.get('id') or item.get('imageFilename')
+        else:
+            item_id = item
+            item = (data_manager.id_to_item_map.get(item_id) if data_manager else None) or {'id': item_id}
+        key = ('item', item_id, size)
+        pix = self._get(key)
+        if pix is not None: return pix
+
+        path = self.resolve_item_image_path(item)
+        if not path: return None
+        pix = load_item_pixmap(path, size)
+        return self._put(key, pix)
+
+    def path_pixmap(self, path, size):
+        """Static UI icon (coin, hideout, project...) at size x size. Returns None if missing."""
+        if not path: return None
+        key = ('path', path, size)
+        pix = self._get(key)
+        if pix is not None: return pix
+        if not os.path.exists(path): return None
+        pix = QPixmap(path)
+        if not pix.isNull(): pix = pix.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        return self._put(key, pix)
+
+    @staticmethod
+    def resolve_item_image_path(item):
+        """Local file for an item's icon: basename of imageFilename, then <id>.png."""
+        items_dir = os.path.join(Constants.DATA_DIR, "images", "items")
+        candidates = []
+        img = item.get('imageFilename')
+        if img: candidates.append(os.path.join(items_dir, img.split('/')[-1]))
+        if item.get('id'): candidates.append(os.path.join(items_dir, f"{item['id']}.png"))
+        for path in candidates:
+            if os.path.exists(path): return path
+        return None
+
+    # --- LRU CORE ---
+    def _get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _put(self, key, pix):
+        if pix is None or pix.isNull(): return None
+        cost = pix.width() * pix.height() * max(1, pix.depth() // 8)
+        old = self._entries.pop(key, None)
+        if old: self._bytes -= old[1]
+        self._entries[key] = (pix, cost); self._bytes += cost
+        while self._bytes > self.budget_bytes and len(self._entries) > 1:
+            _, (_, evicted_cost) = self._entries.popitem(last=False)
+            self._bytes -= evicted_cost; self.evictions += 1
+        return pix
+
+    def clear(self):
+        """Drops all pixmaps (e.g. after a data sync replaced the image files). Counters are kept."""
+        self._entries.clear(); self._bytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries), 'bytes': self._bytes, 'budget_bytes': self.budget_bytes,
+            'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+            'hit_rate': (self.hits / total) if total else 0.0
+        }
+
+    def log_stats(self):
+        s = self.stats()
+        print(f"[INFO] Icon cache: {s['entries']} entries, {s['bytes'] / 1024:.0f} KiB / {s['budget_bytes'] / 1024:.0f} KiB, "
+              f"{s['hits']} hits, {s['misses']} misses ({s['hit_rate']:.0%}), {s['evictions']} evictions")
+
+
+# --- SHARED INSTANCE ---
+_cache = None
+
+def get_icon_cache():
+    """Returns the process-wide IconCache."""
+    global _cache
+    if _cache is None: _cache = IconCache()
+    return _cache
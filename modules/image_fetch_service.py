@@ -0,0 +1,156 @@
+import os
+import queue
+import threading
+import itertools
+from PyQt6.QtCore import QObject, pyqtSignal
+from .constants import Constants
+from .http_client import get_http_client
+from .thumbnail_cache import generate_for_file
+
+
+def get_item_image_target(item):
+    """Returns (url, local_path) for an item's icon. url is None if the item has no remote image."""
+    item_id = item.get('id'); img_url = item.get('imageFilename')
+    filename = img_url.split('/')[-1] if img_url else f"{item_id}.png"
+    path = os.path.join(Constants.DATA_DIR, "images", "items", filename)
+    return (img_url if img_url and img_url.startswith("http") else None), path
+
+
+class ImageFetchService(QObject):
+    """
+    Downloads item icons on a fixed pool of worker threads sharing the pooled HTTP session.
+
+    Requests go through a priority queue (lower value = sooner) and are de-duplicated by
+    target path, so scrolling the item grid never spawns more than MAX_WORKERS downloads
+    and the same icon is only fetched once. Re-requesting a queued path with a better
+    priority moves it ahead in the queue.
+    """
+    image_ready = pyqtSignal(bool, str)        # (success, save_path)
+    prefetch_progress = pyqtSignal(int, int)   # (done, total)
+    prefetch_finished = pyqtSignal(int, int)   # (downloaded, failed)
+
+    PRIORITY_URGENT = 0       # Inspector panel / overlay header
+    PRIORITY_VISIBLE = 10     # Grid cards on screen (+ index on page)
+    PRIORITY_PREFETCH = 1000  # Background "download all icons" job
+    MAX_WORKERS = 4
+
+    def __init__(self, max_workers=MAX_WORKERS, parent=None):
+        super().__init__(parent)
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._pending = {}    # path -> best priority currently queued
+        self._active = set()  # paths being downloaded right now
+        self._prefetch = None # {'paths': set, 'total': int, 'ok': int, 'failed': int}
+        self._stop = threading.Event()
+
+        self._workers = []
+        for i in range(max(1, max_workers)):
+            t = threading.Thread(target=self._worker_loop, name=f"ImageFetch-{i}", daemon=True)
+            t.start(); self._workers.append(t)
+
+    def request(self, url, save_path, priority=PRIORITY_VISIBLE):
+        """Queues a download. Returns False if the path is already queued (at an equal or better priority) or in flight."""
+        if self._stop.is_set() or not url: return False
+        with self._lock:
+            if save_path in self._active: return False
+            best = self._pending.get(save_path)
+            if best is not None and best <= priority: return False
+            self._pending[save_path] = priority
+        self._queue.put((priority, next(self._seq), url, save_path))
+        return True
+
+    def is_pending(self, save_path):
+        with self._lock: return save_path in self._pending or save_path in self._active
+
+    # --- BULK PREFETCH ---
+    def prefetch_all(self, items):
+        """Queues every missing item icon at background priority. Progress is reported via prefetch_progress."""
+        targets = {}
+        for item in items:
+            url, path = get_item_image_target(item)
+            if url and path not in targets and not os.path.exists(path): targets[path] = url
+
+        with self._lock:
+            self._prefetch = {'paths': set(targets), 'total': len(targets), 'ok': 0, 'failed': 0}
+        if not targets:
+            self._prefetch = None
+            self.prefetch_finished.emit(0, 0)
+            return 0
+
+        print(f"[INFO] Prefetching {len(targets)} item icons...")
+        self.prefetch_progress.emit(0, len(targets))
+        for path, url in targets.items(): self.request(url, path, self.PRIORITY_PREFETCH)
+        return len(targets)
+
+    def is_prefetching(self):
+        return self._prefetch is not None
+
+    def _record_prefetch(self, path, success):
+        with self._lock:
+            job = self._prefetch
+            if not job or path not in job['paths']: return
+            job['paths'].discard(path)
+            if success: job['ok'] += 1
+            else: job['failed'] += 1
+            done = job['ok'] + job['failed']; total = job['total']
+            finished = not job['paths']
+            if finished: self._prefetch = None
+        self.prefetch_progress.emit(done, total)
+        if finished:
+            print(f"[INFO] Icon prefetch finished: {job['ok']} downloaded, {job['failed']} failed.")
+            self.prefetch_finished.emit(job['ok'], job['failed'])
+
+    # --- WORKERS ---
+    def _worker_loop(self):
+        while not self._stop.is_set():
+            try: priority, _, url, path = self._queue.get(timeout=0.5)
+            except queue.Empty: continue
+            if url is None: break  # Shutdown sentinel
+
+            with self._lock:
+                # Stale entry: the path was re-queued at a better priority or already handled
+                if self._pending.get(path) != priority or path in self._active: continue
+                del self._pending[path]; self._active.add(path)
+
+            success = False
+            try:
+                if os.path.exists(path): success = True
+                else: success = get_http_client().download_to_file(url, path, timeout=10, chunk_size=1024, should_abort=self._stop.is_set)
+                # Late downloads get their pre-scaled variants right away (sync only covers what was on disk)
+                if success: generate_for_file(path)
+            except Exception as e:
+                print(f"[DEBUG] Image download failed ({url}): {e}")
+            finally:
+                with self._lock: self._active.discard(path)
+
+            if self._stop.is_set(): break
+            self.image_ready.emit(success, path)
+            self._record_prefetch(path, success)
+
+    def cancel_pending(self):
+        """Drops everything still queued (in-flight downloads finish normally)."""
+        with self._lock:
+            self._pending.clear(); self._prefetch = None
+        try:
+            while True: self._queue.get_nowait()
+        except queue.Empty: pass
+
+    def shutdown(self, timeout=0.5):
+        self._stop.set(); self.cancel_pending()
+        for _ in self._workers: self._queue.put((-1, next(self._seq), None, None))
+        for t in self._workers: t.join(timeout)
+
+
+# --- SHARED INSTANCE ---
+_service = None
+
+def get_image_fetch_service():
+    """Returns the process-wide ImageFetchService. Must first be called from the GUI thread."""
+    global _service
+    if _service is None: _service = ImageFetchService()
+    return _service
+
+def shutdown_image_fetch_service():
+    global _service
+    if _service is not None: _service.shutdown(); _service = None
@@ -6,6 +6,7 @@ from PIL import Image
 from typing import Optional, Tuple
 import os
 import sys
+import time
 
 class ImageProcessor:
     @staticmethod
@@ -53,47 +54,179 @@ class ImageProcessor:
         return (x1, y1, x2, y2)
 
     @staticmethod
-    def capture_and_process(target_color: Optional[Tuple[int, int, int]], full_screen: bool = False, debug_path: str = None, debug_prefix: str = None, search_area_size: int = 800):
-        # Platform check - Windows-only due to ctypes.windll usage
-        if sys.platform != 'win32':
+    def classify_accent(img_pil, palette: dict, band: int = 8, min_share: float = 0.12, max_hue_dist: float = 30.0) -> Optional[str]:
+        """
+        Classifies the coloured accent (border / header strip) of a tooltip crop against a palette.
+
+        Only the outer band of the crop is sampled (the detection padding includes the tooltip border).
+        Saturated pixels vote with their hue; the palette entry whose hue is nearest to the dominant hue wins.
+        Neutral palette colours (e.g. grey "Common") can't be told apart from the background and are never returned.
+
+        :param palette: {name: "#RRGGBB"}, e.g. Constants.RARITY_COLORS.
+        :return: The palette name, or None if no clear accent was found.
+        """
+        rgb = np.asarray(img_pil.convert("RGB"))
+        h, w = rgb.shape[:2]
+        if h < 2 * band or w < 2 * band: return None
+
+        mask = np.zeros((h, w), dtype=bool)
+        mask[:band, :] = True; mask[-band:, :] = True; mask[:, :band] = True; mask[:, -band:] = True
+        hsv = cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV)[mask]  # OpenCV: H 0-179, S/V 0-255
+        accent = hsv[(hsv[:, 1] >= 90) & (hsv[:, 2] >= 90)]
+        if len(accent) < max(20, min_share * len(hsv)): return None
+
+        hist = np.bincount(accent[:, 0], minlength=180)
+        hue = float(np.argmax(np.convolve(np.concatenate([hist[-5:], hist, hist[:5]]), np.ones(11), mode='valid'))) * 2.0
+
+        best, best_dist = None, max_hue_dist
+        for name, hex_color in palette.items():
+            c = hex_color.lstrip('#')
+            px = np.array([[[int(c[0:2], 16), int(c[2:4], 16), int(c[4:6], 16)]]], dtype=np.uint8)
+            ph, ps, _ = cv2.cvtColor(px, cv2.COLOR_RGB2HSV)[0, 0]
+            if ps < 64: continue
+            dist = abs(hue - float(ph) * 2.0); dist = min(dist, 360.0 - dist)
+            if dist <= best_dist: best, best_dist = name, dist
+        return best
+
+    @staticmethod
+    def find_title_lines(gray_img, max_lines: int = 2, ink_delta: int = 60, pad: int = 6) -> Optional[Tuple[Tuple[int, int, int, int], int]]:
+        """
+        Locates the item-name line(s) in a grayscale tooltip header with row/column projection profiles.
+        The name is the tallest text band (largest font); a directly following band of similar height
+        is treated as its second line.
+        Returns ((x1, y1, x2, y2), line_count) or None if no plausible text line was found.
+        """
+        arr = np.asarray(gray_img, dtype=np.int16)
+        if arr.ndim != 2 or arr.shape[0] < 8 or arr.shape[1] < 16: return None
+        h, w = arr.shape
+
+        # 1. Ink mask relative to the dominant background (dark-on-light and light-on-dark)
+        ink = np.abs(arr - int(np.median(arr))) > ink_delta
+
+        # 2. Row profile -> text bands
+        text_rows = ink.sum(axis=1) > max(2, w // 100)
+        edges = np.diff(np.concatenate(([0], text_rows.astype(np.int8), [0])))
+        bands = []
+        for start, end in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+            if bands and start - bands[-1][1] <= 2: bands[-1][1] = end  # Accents/dots of the same line
+            else: bands.append([int(start), int(end)])
+        # Drop separators/noise (too thin) and graphics (too tall to be a line of text)
+        bands = [b for b in bands if 6 <= b[1] - b[0] <= h * 0.6]
+        if not bands: return None
+
+        # 3. Title band(s)
+        first = last = max(range(len(bands)), key=lambda i: bands[i][1] - bands[i][0])
+        line_h = bands[first][1] - bands[first][0]
+        while last + 1 < len(bands) and last - first + 1 < max_lines:
+            nxt = bands[last + 1]
+            if nxt[1] - nxt[0] >= 0.75 * line_h and nxt[0] - bands[last][1] <= 0.8 * line_h: last += 1
+            else: break
+        y1, y2 = bands[first][0], bands[last][1]
+
+        # 4. Column profile inside the band -> horizontal extent
+        cols = np.flatnonzero(ink[y1:y2].any(axis=0))
+        if cols.size == 0: return None
+        x1, x2 = int(cols[0]), int(cols[-1]) + 1
+        return (max(0, x1 - pad), max(0, y1 - pad), min(w, x2 + pad), min(h, y2 + pad)), last - first + 1
+
+    @staticmethod
+    def preprocess_for_ocr(img_pil, target_text_height: int = 32, min_scale: float = 0.25, max_scale: float = 4.0):
+        """
+        OpenCV OCR preprocessing for a tooltip header (PIL RGB/L image -> binarised PIL 'L' image):
+          1. grayscale,
+          2. estimate the name's glyph height from the row projection profile and resize so it is
+             ~target_text_height px (4K headers shrink, small 1080p UI scales grow),
+          3. CLAHE + Otsu binarisation, in place on the numpy buffer,
+          4. normalise polarity to dark text on a light background (what Tesseract expects).
+        """
+        arr = np.asarray(img_pil)
+        gray = cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY) if arr.ndim == 3 else np.array(arr, dtype=np.uint8)
+
+        # 1. Text-height normalisation
+        title = ImageProcessor.find_title_lines(gray, pad=0)
+        if title:
+            (_, y1, _, y2), line_count = title
+            glyph_h = (y2 - y1) / max(1, line_count)
+            scale = min(max_scale, max(min_scale, target_text_height / max(1.0, glyph_h)))
+            if abs(scale - 1.0) > 0.15:
+                interp = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=interp)
+
+        # 2. Local contrast + global binarisation (in place)
+        cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(gray, gray)  # Per call: CLAHE objects are not shared across scan threads
+        cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU, dst=gray)
+
+        # 3. Background is the majority class -> make it white
+        if cv2.countNonZero(gray) < gray.size // 2: cv2.bitwise_not(gray, dst=gray)
+        return Image.fromarray(gray)
+
+    @staticmethod
+    def get_dpi_scale(x: int, y: int) -> float:
+        """DPI scale (1.0 = 96 DPI / 100%) of the monitor containing the point. Falls back to 1.0."""
+        try:
+            monitor = ctypes.windll.user32.MonitorFromPoint(ctypes.wintypes.POINT(x, y), 2)  # MONITOR_DEFAULTTONEAREST
+            dpi_x, dpi_y = ctypes.c_uint(), ctypes.c_uint()
+            if ctypes.windll.shcore.GetDpiForMonitor(monitor, 0, ctypes.byref(dpi_x), ctypes.byref(dpi_y)) == 0:
+                return dpi_x.value / 96.0
+        except (AttributeError, OSError): pass
+        return 1.0
+
+    @staticmethod
+    def capture_and_process(target_color: Optional[Tuple[int, int, int]], full_screen: bool = False, debug_path: str = None, debug_prefix: str = None, search_area_size: int = 800,
+                            capture_rect: Optional[Tuple[int, int, int, int]] = None, detection: Optional[dict] = None, source=None):
+        """
+        Captures the search area and crops it to the tooltip.
+
+        :param capture_rect: Optional (left, top, right, bottom) offsets from the cursor in logical pixels
+                             (scaled by the monitor DPI) to capture instead of the search_area_size square.
+        :param detection: Optional dict filled with the tooltip 'box' relative to the cursor,
+                          the monitor 'scale', 'edge' (box touches the capture border), 'pixels' captured
+                          and 'timings' ({'capture'|'detect'|'crop': ms}).
+        :param source: Where pixels and the cursor come from; defaults to the live screen (ScreenCaptureSource).
+                       A ReplayCaptureSource feeds a saved screenshot instead (works on any platform).
+        """
+        source = source or ScreenCaptureSource()
+        # Platform check - the live screen is Windows-only due to ctypes.windll usage
+        if not source.available:
             print("[ERROR] Screen capture is only supported on Windows.")
             return None
             
         try:
-            with mss.mss() as sct:
+            with source:
                 # --- 1. Determine Capture Region ---
+                cx, cy = source.cursor_pos()
                 if full_screen:
                     # Monitor 1 is usually the Primary Monitor (default fallback)
-                    monitor_region = sct.monitors[1]
+                    monitors = source.monitors()
+                    monitor_region = monitors[0]
 
-                    # Attempt to find which monitor the mouse is on
-                    pt = ctypes.wintypes.POINT()
-                    ctypes.windll.user32.GetCursorPos(ctypes.byref(pt))
-
-                    # Iterate over all monitors (skipping index 0 which is 'all monitors combined')
-                    for i, monitor in enumerate(sct.monitors[1:], start=1):
-                        # mss monitor dict keys: 'left', 'top', 'width', 'height'
+                    # Find which monitor the mouse is on ('left', 'top', 'width', 'height' like mss)
+                    for monitor in monitors:
                         m_left = monitor["left"]
                         m_top = monitor["top"]
                         m_right = m_left + monitor["width"]
                         m_bottom = m_top + monitor["height"]
 
-                        if m_left <= pt.x < m_right and m_top <= pt.y < m_bottom:
+                        if m_left <= cx < m_right and m_top <= cy < m_bottom:
                             monitor_region = monitor
                             break
+                elif capture_rect:
+                    # Learned cursor-relative rectangle, clamped to the virtual desktop
+                    desk = source.desktop(); scale = source.dpi_scale(cx, cy)
+                    l, t, r, b = (int(v * scale) for v in capture_rect)
+                    left = max(desk["left"], cx + l); top = max(desk["top"], cy + t)
+                    right = min(desk["left"] + desk["width"], cx + r); bottom = min(desk["top"] + desk["height"], cy + b)
+                    if right - left < 50 or bottom - top < 50: return None
+                    monitor_region = {"top": int(top), "left": int(left), "width": int(right - left), "height": int(bottom - top)}
                 else:
                     # Capture around cursor
-                    pt = ctypes.wintypes.POINT()
-                    ctypes.windll.user32.GetCursorPos(ctypes.byref(pt))
-
-                    # Fallback system metrics usually return primary screen size
                     # For multi-monitor "around cursor", we just need valid global coordinates
                     # mss handles global coordinates fine without needing specific monitor index
 
                     search_width, search_height = search_area_size, search_area_size
 
-                    left = int(max(0, pt.x - search_width // 2))
-                    top = int(max(0, pt.y - search_height // 2))
+                    left = int(max(0, cx - search_width // 2))
+                    top = int(max(0, cy - search_height // 2))
                     # Note: We can't easily clamp 'right'/'bottom' to a specific monitor without knowing which one,
                     # but mss handles out-of-bounds gracefully usually. 
                     # For safety, we can just define the rect without clamping to screen_width/height 
@@ -105,22 +238,16 @@ class ImageProcessor:
                         "width": search_width,
                         "height": search_height
                     }
+                monitor_region = source.clamp(monitor_region)
+                if monitor_region["width"] <= 0 or monitor_region["height"] <= 0: return None
 
-                # --- 2. Capture (Raw Bytes) ---
-                sct_img = sct.grab(monitor_region)
-
-                # --- 3. Prepare Formats ---
-                
-                # Format A: Numpy Array (for OpenCV detection)
-                # MSS returns BGRA. We drop the Alpha channel to get BGR.
-                img_np = np.array(sct_img)
-                img_bgr = cv2.cvtColor(img_np, cv2.COLOR_BGRA2BGR)
-
-                # Format B: PIL Image (for Output/Tesseract)
-                # We convert bytes directly to RGB for PIL
-                img_pil = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
+                # --- 2. Capture (BGR numpy array for OpenCV detection + RGB PIL image for Output/Tesseract) ---
+                t0 = time.perf_counter()
+                img_bgr, img_pil = source.grab(monitor_region)
+                timings = {'capture': (time.perf_counter() - t0) * 1000}
+                if detection is not None: detection['timings'] = timings
 
-                # --- 4. DEBUG SAVING (Raw) ---
+                # --- 3. DEBUG SAVING (Raw) ---
                 if debug_path and debug_prefix:
                     try:
                         raw_filename = f"{debug_prefix}_raw.png"
@@ -128,19 +255,109 @@ class ImageProcessor:
                     except Exception as e:
                         print(f"Failed to save debug raw image: {e}")
 
-                # --- 5. Detect & Crop ---
+                # --- 4. Detect & Crop ---
                 bbox = None
                 if target_color:
                     # Pass the BGR numpy array + RGB config color
+                    t0 = time.perf_counter()
                     bbox = ImageProcessor.find_color_region(img_bgr, target_color)
+                    timings['detect'] = (time.perf_counter() - t0) * 1000
                 
+                if detection is not None:
+                    detection['pixels'] = img_pil.size[0] * img_pil.size[1]
+                    if bbox:
+                        ox, oy = monitor_region["left"] - cx, monitor_region["top"] - cy
+                        x1, y1, x2, y2 = bbox
+                        detection['box'] = (ox + x1, oy + y1, ox + x2, oy + y2)
+                        detection['edge'] = x1 <= 0 or y1 <= 0 or x2 >= img_pil.size[0] or y2 >= img_pil.size[1]
+                        detection['scale'] = source.dpi_scale(cx, cy)
+
                 if bbox:
                     # Crop the PIL image using coordinates found by OpenCV
-                    return img_pil.crop(bbox)
+                    t0 = time.perf_counter()
+                    cropped = img_pil.crop(bbox)
+                    timings['crop'] = (time.perf_counter() - t0) * 1000
+                    return cropped
 
             # If no color found, return the full search area (fallback)
             return img_pil
             
         except Exception as e:
             print(f"Screen capture failed: {e}")
-            return None
\ No newline at end of file
+            return None
+
+
+class ScreenCaptureSource:
+    """Live screen through mss; cursor position and DPI come from user32/shcore (Windows only)."""
+    available = sys.platform == 'win32'
+
+    def __enter__(self):
+        self._sct = mss.mss()
+        return self
+
+    def __exit__(self, *exc):
+        self._sct.close(); self._sct = None
+
+    def cursor_pos(self) -> Tuple[int, int]:
+        pt = ctypes.wintypes.POINT()
+        ctypes.windll.user32.GetCursorPos(ctypes.byref(pt))
+        return pt.x, pt.y
+
+    def dpi_scale(self, x: int, y: int) -> float: return ImageProcessor.get_dpi_scale(x, y)
+
+    def desktop(self) -> dict: return self._sct.monitors[0]  # All monitors combined
+
+    def monitors(self) -> list: return self._sct.monitors[1:]
+
+    def clamp(self, region: dict) -> dict: return region  # mss handles out-of-bounds regions
+
+    def grab(self, region: dict):
+        sct_img = self._sct.grab(region)
+        # MSS returns BGRA. We drop the Alpha channel to get BGR.
+        img_bgr = cv2.cvtColor(np.array(sct_img), cv2.COLOR_BGRA2BGR)
+        # We convert bytes directly to RGB for PIL
+        img_pil = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
+        return img_bgr, img_pil
+
+
+class ReplayCaptureSource:
+    """
+    A saved screenshot acting as the whole desktop, e.g. the *_raw.png files written by
+    "Save Debug Images". The cursor defaults to the image centre, which is where it was
+    for the fixed-size captures.
+    """
+    available = True
+
+    def __init__(self, image, cursor: Optional[Tuple[int, int]] = None, scale: float = 1.0):
+        self.image = image.convert("RGB")
+        w, h = self.image.size
+        self.cursor = tuple(cursor) if cursor else (w // 2, h // 2)
+        self.scale = scale
+
+    @classmethod
+    def from_file(cls, path: str, cursor: Optional[Tuple[int, int]] = None, scale: float = 1.0) -> "ReplayCaptureSource":
+        with Image.open(path) as raw: return cls(raw, cursor, scale)
+
+    def __enter__(self): return self
+
+    def __exit__(self, *exc): pass
+
+    def cursor_pos(self) -> Tuple[int, int]: return self.cursor
+
+    def dpi_scale(self, x: int, y: int) -> float: return self.scale
+
+    def desktop(self) -> dict:
+        w, h = self.image.size
+        return {"left": 0, "top": 0, "width": w, "height": h}
+
+    def monitors(self) -> list: return [self.desktop()]
+
+    def clamp(self, region: dict) -> dict:
+        w, h = self.image.size
+        left = max(0, region["left"]); top = max(0, region["top"])
+        right = min(w, region["left"] + region["width"]); bottom = min(h, region["top"] + region["height"])
+        return {"left": left, "top": top, "width": right - left, "height": bottom - top}
+
+    def grab(self, region: dict):
+        img_pil = self.image.crop((region["left"], region["top"], region["left"] + region["width"], region["top"] + region["height"]))
+        return cv2.cvtColor(np.asarray(img_pil), cv2.COLOR_RGB2BGR), img_pil
@@ -0,0 +1,92 @@
+"""
+Import-time profile: runs `python -X importtime -c "import arcoverlay"` in a child process and turns
+the raw stderr dump into a short report (slowest modules by cumulative and self time, totals per package).
+Only module-level imports are measured - exactly what runs before the app can create the tray icon.
+
+Usage:
+    python arcoverlay.py profile-imports [--top 25] [--module arcoverlay] [--raw FILE] [--output FILE]
+    python -m modules.import_profile ...
+
+--raw reads a saved `-X importtime` dump instead of running the child process.
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S.*)$")
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(text):
+    """[{'module', 'self_us', 'cumulative_us', 'depth'}] in import-completion order."""
+    entries = []
+    for line in text.splitlines():
+        m = _LINE.match(line)
+        if not m: continue  # Header line and unrelated stderr output
+        entries.append({'module': m.group(4).strip(), 'self_us': int(m.group(1)), 'cumulative_us': int(m.group(2)), 'depth': (len(m.group(3)) - 1) // 2})
+    return entries
+
+
+def run_importtime(module="arcoverlay", python=None):
+    """Raw `-X importtime` output of importing `module` in a fresh interpreter (cwd: the repo root)."""
+    cmd = [python or sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    proc = subprocess.run(cmd, cwd=ROOT_DIR, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"'{' '.join(cmd)}' failed:\n{proc.stderr.strip()[-2000:]}")
+    return proc.stderr
+
+
+def summarize(entries, top=25):
+    by_package = {}
+    for e in entries: by_package[e['module'].split('.')[0]] = by_package.get(e['module'].split('.')[0], 0) + e['self_us']
+    return {
+        'total_ms': round(sum(e['self_us'] for e in entries) / 1000, 1),
+        'modules': len(entries),
+        'slowest_cumulative': sorted(entries, key=lambda e: e['cumulative_us'], reverse=True)[:top],
+        'slowest_self': sorted(entries, key=lambda e: e['self_us'], reverse=True)[:top],
+        'packages': sorted(({'package': k, 'self_us': v} for k, v in by_package.items()), key=lambda p: p['self_us'], reverse=True)[:top],
+    }
+
+
+def format_report(summary):
+    lines = [f"Import time: {summary['total_ms']:.1f}ms over {summary['modules']} modules", "",
+             f"{'cumulative':>12}  {'self':>10}  module (slowest, including what they import)"]
+    lines += [f"{e['cumulative_us'] / 1000:>10.1f}ms  {e['self_us'] / 1000:>8.1f}ms  {'  ' * min(e['depth'], 6)}{e['module']}" for e in summary['slowest_cumulative']]
+    lines += ["", f"{'self':>12}  module (slowest on their own)"]
+    lines += [f"{e['self_us'] / 1000:>10.1f}ms  {e['module']}" for e in summary['slowest_self']]
+    lines += ["", f"{'self':>12}  top-level package (sum of its modules)"]
+    lines += [f"{p['self_us'] / 1000:>10.1f}ms  {p['package']}" for p in summary['packages']]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="arcoverlay.py profile-imports", description="Profile module import times (python -X importtime) as a readable report.")
+    parser.add_argument('--module', default="arcoverlay", help="Module to import (default: the app entry point)")
+    parser.add_argument('--top', type=int, default=25, help="Rows per table")
+    parser.add_argument('--raw', default=None, help="Parse a saved -X importtime dump instead of running one")
+    parser.add_argument('--output', default=None, help="Write the summary as JSON")
+    args = parser.parse_args(argv)
+
+    if args.raw:
+        with open(args.raw, 'r', encoding='utf-8', errors='replace') as f: text = f.read()
+    elif getattr(sys, 'frozen', False):
+        print("[ERROR] Import profiling needs a Python interpreter; run it from source (or pass --raw)."); return 1
+    else:
+        try: text = run_importtime(args.module)
+        except RuntimeError as e: print(f"[ERROR] {e}"); return 1
+
+    entries = parse_importtime(text)
+    if not entries:
+        print("[ERROR] No '-X importtime' lines found."); return 1
+    summary = summarize(entries, max(1, args.top))
+    print(format_report(summary))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f: json.dump(summary, f, indent=2)
+        print(f"\n[INFO] Summary written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__': sys.exit(main())
@@ -3,12 +3,12 @@ from PyQt6.QtWidgets import (
     QScrollArea, QGridLayout, QLabel, QComboBox, QFrame, QSplitter, 
     QTextEdit, QSizePolicy, QProgressBar, QGraphicsOpacityEffect
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer, QObject
-from PyQt6.QtGui import QPixmap, QColor
-import os
-import requests
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QObject
+from PyQt6.QtGui import QColor
 from .constants import Constants
+from .image_fetch_service import ImageFetchService, get_image_fetch_service, get_item_image_target
 from .ui_components import InventoryControl, StashProgressBar
+from .icon_cache import get_icon_cache
 from .base_page import BasePage
 
 try:
@@ -17,68 +17,46 @@ except ImportError:
     import difflib; _HAS_RAPIDFUZZ = False
 
 # HELPER CLASSES
-class ImageDownloadWorker(QThread):
-    download_complete = pyqtSignal(bool, str) 
-    def __init__(self, url, save_path, parent=None):
-        super().__init__(parent); self.url = url; self.save_path = save_path
-    def run(self):
-        try:
-            os.makedirs(os.path.dirname(self.save_path), exist_ok=True)
-            response = requests.get(self.url, timeout=10, stream=True)
-            if response.status_code == 200:
-                with open(self.save_path, 'wb') as f:
-                    for chunk in response.iter_content(1024):
-                        if self.isInterruptionRequested(): f.close(); return
-                        f.write(chunk)
-                self.download_complete.emit(True, self.save_path)
-            else: self.download_complete.emit(False, self.save_path)
-        except Exception: self.download_complete.emit(False, self.save_path)
-
 class ItemImageLoader(QObject):
+    """Resolves item icons from the shared IconCache, queueing missing ones on the shared ImageFetchService."""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.image_cache = {}
-        self.active_downloads = {}
+        self.icon_cache = get_icon_cache()
         self.pending_labels = {} 
-    def load_image(self, item, label, size=64):
-        item_id = item.get('id'); img_url = item.get('imageFilename')
-        filename = img_url.split('/')[-1] if img_url else f"{item_id}.png"
-        path = os.path.join(Constants.DATA_DIR, "images", "items", filename)
-        if path in self.image_cache: self._set_pixmap(label, self.image_cache[path], size)
-        elif os.path.exists(path):
-            pix = QPixmap(path); self.image_cache[path] = pix; self._set_pixmap(label, pix, size)
-        elif img_url and img_url.startswith("http"):
-            label.setText("..."); self._start_download(img_url, path, label, size)
+        self.fetcher = get_image_fetch_service()
+        self.fetcher.image_ready.connect(self._on_download_complete)
+    def load_image(self, item, label, size=64, priority=ImageFetchService.PRIORITY_VISIBLE):
+        pix = self.icon_cache.item_pixmap(item, size)
+        if pix is not None: label.setPixmap(pix); return
+        img_url, path = get_item_image_target(item)
+        if img_url:
+            label.setText("..."); self._start_download(img_url, path, item, label, size, priority)
         else: label.setText("?")
-    def _set_pixmap(self, label, pixmap, size):
-        label.setPixmap(pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-    def _start_download(self, url, path, label, size):
+    def prioritize(self, item, priority):
+        """Moves a still-pending icon ahead in the fetch queue (e.g. its card scrolled into view)."""
+        img_url, path = get_item_image_target(item)
+        if img_url and path in self.pending_labels: self.fetcher.request(img_url, path, priority)
+    def _start_download(self, url, path, item, label, size, priority):
         if path not in self.pending_labels: self.pending_labels[path] = []
-        self.pending_labels[path].append((label, size))
-        if path in self.active_downloads: return
-        worker = ImageDownloadWorker(url, path, self)
-        worker.download_complete.connect(self._on_download_complete)
-        self.active_downloads[path] = worker; worker.start()
+        self.pending_labels[path].append((item, label, size))
+        self.fetcher.request(url, path, priority)
     def _on_download_complete(self, success, path):
-        if path in self.active_downloads: del self.active_downloads[path]
         waiting = self.pending_labels.pop(path, [])
-        if success and os.path.exists(path):
-            pix = QPixmap(path); self.image_cache[path] = pix
-            for label, size in waiting:
-                try: self._set_pixmap(label, pix, size)
-                except RuntimeError: pass 
-        else:
-            for label, _ in waiting:
-                try: label.setText("x")
-                except RuntimeError: pass
+        if not waiting: return
+        for item, label, size in waiting:
+            pix = self.icon_cache.item_pixmap(item, size) if success else None
+            try:
+                if pix is not None: label.setPixmap(pix)
+                else: label.setText("x")
+            except RuntimeError: pass 
     def cleanup(self):
-        for w in self.active_downloads.values(): w.requestInterruption(); w.quit(); w.wait(50)
-        self.active_downloads.clear()
+        # Downloads live on the shared service; just forget the labels waiting on them
+        self.pending_labels.clear()
 
 class ItemGridCard(QFrame):
     clicked = pyqtSignal(dict)
     double_clicked = pyqtSignal(dict) 
-    def __init__(self, item, localized_name, image_loader, stash_count=0, stack_size=1, is_collected=False, is_selected=False):
+    def __init__(self, item, localized_name, image_loader, stash_count=0, stack_size=1, is_collected=False, is_selected=False, image_priority=ImageFetchService.PRIORITY_VISIBLE):
         super().__init__()
         self.item = item; self.is_selected = is_selected; self.is_collected = is_collected
         self.setFixedSize(100, 130); self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -87,7 +65,7 @@ class ItemGridCard(QFrame):
         self._update_style()
         layout = QVBoxLayout(self); layout.setContentsMargins(5, 5, 5, 5); layout.setSpacing(4)
         img_lbl = QLabel(); img_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter); img_lbl.setFixedSize(40, 40); img_lbl.setStyleSheet("border: none; background: transparent;")
-        image_loader.load_image(item, img_lbl, size=40)
+        image_loader.load_image(item, img_lbl, size=40, priority=image_priority)
         layout.addWidget(img_lbl, alignment=Qt.AlignmentFlag.AlignCenter)
         name_lbl = QLabel(localized_name); name_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter); name_lbl.setWordWrap(True)
         name_lbl.setStyleSheet("color: #E0E0E0; font-size: 11px; font-weight: bold; border: none; background: transparent;")
@@ -209,7 +187,7 @@ class ItemInspectorPanel(QFrame):
     def set_item(self, item, req_details):
         self.current_item = item; self.placeholder.setVisible(False); self.content_container.setVisible(True)
         rarity_color = Constants.RARITY_COLORS.get(item.get('rarity', 'Common'), "#777"); self.header_lbl.setText(self.data_manager.get_localized_name(item, self.lang_code)); self.header_lbl.setStyleSheet(f"color: {rarity_color}; font-size: 20px; font-weight: bold; margin-bottom: 5px;")
-        self.image_loader.load_image(item, self.img_lbl, size=90)
+        self.image_loader.load_image(item, self.img_lbl, size=90, priority=ImageFetchService.PRIORITY_URGENT)
         item_type = item.get('type', 'Item'); is_bp = (item_type == "Blueprint") or ("Blueprint" in item.get('name', ''))
         current_stash = self.data_manager.get_stash_count(item.get('id'))
         try: stack_size = int(item.get('stackSize', 1))
@@ -223,8 +201,9 @@ class ItemInspectorPanel(QFrame):
             self.bp_toggle_btn.setVisible(False); self.storage_bar.update_status(current_stash, stack_size)
         self._update_track_btn_style()
         price_val = item.get('value', 0); val_lbl, icon_lbl = self.stat_labels["val"]; val_lbl.setText(f"{price_val:,}")
-        if Constants.COIN_ICON_PATH and os.path.exists(Constants.COIN_ICON_PATH):
-            pix = QPixmap(Constants.COIN_ICON_PATH); icon_lbl.setPixmap(pix.scaled(16, 16, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)); icon_lbl.setVisible(True)
+        coin_pix = get_icon_cache().path_pixmap(Constants.COIN_ICON_PATH, 16)
+        if coin_pix is not None:
+            icon_lbl.setPixmap(coin_pix); icon_lbl.setVisible(True)
         else: icon_lbl.setVisible(False); val_lbl.setText(f"£{price_val:,}")
         self.stat_labels["w"][0].setText(f"{item.get('weightKg', 0)}kg"); self.stat_labels["stack"][0].setText(str(stack_size)); self.stat_labels["type"][0].setText(item_type)
         self.note_edit.blockSignals(True); self.note_edit.setText(self.data_manager.get_item_note(item.get('id'))); self.note_edit.blockSignals(False)
@@ -288,6 +267,7 @@ class ItemDatabaseWindow(BasePage):
         
         self.search_timer = QTimer(); self.search_timer.setSingleShot(True); self.search_timer.setInterval(300); self.search_timer.timeout.connect(self.filter_items)
         self.resize_timer = QTimer(); self.resize_timer.setSingleShot(True); self.resize_timer.setInterval(200); self.resize_timer.timeout.connect(self.update_display)
+        self.scroll_timer = QTimer(); self.scroll_timer.setSingleShot(True); self.scroll_timer.setInterval(100); self.scroll_timer.timeout.connect(self._prioritize_visible_images)
         
         self.init_ui()
         self.filter_items(); self.update_blueprint_stats()
@@ -332,6 +312,7 @@ class ItemDatabaseWindow(BasePage):
         self.scroll_content = QWidget(); self.grid_layout = QGridLayout(self.scroll_content); self.grid_layout.setContentsMargins(5, 5, 5, 5); self.grid_layout.setSpacing(10); self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
         self.inner_scroll = QScrollArea(); self.inner_scroll.setWidgetResizable(True); self.inner_scroll.setWidget(self.scroll_content)
         self.inner_scroll.setStyleSheet("background: transparent; border: none;")
+        self.inner_scroll.verticalScrollBar().valueChanged.connect(self.scroll_timer.start)
         
         # --- Inspector Panel ---
         self.inspector = ItemInspectorPanel(self.data_manager, self.image_loader, self.lang_code)
@@ -453,13 +434,20 @@ class ItemDatabaseWindow(BasePage):
             if stack_size < 1: stack_size = 1
             stash_count = stash.get(item.get('id'), 0)
 
-            card = ItemGridCard(item, loc_name, self.image_loader, stash_count=stash_count, stack_size=stack_size, is_collected=is_collected, is_selected=is_selected)
+            # Earlier cards (top of the page) download first; scrolled-to cards get bumped ahead later
+            card = ItemGridCard(item, loc_name, self.image_loader, stash_count=stash_count, stack_size=stack_size, is_collected=is_collected, is_selected=is_selected, image_priority=ImageFetchService.PRIORITY_VISIBLE + 1 + count)
             card.clicked.connect(self.on_item_clicked)
             card.double_clicked.connect(self.on_blueprint_double_clicked)
             self.grid_layout.addWidget(card, row, col)
             col += 1; count += 1
             if col >= max_cols: col = 0; row += 1
 
+    def _prioritize_visible_images(self):
+        for i in range(self.grid_layout.count()):
+            w = self.grid_layout.itemAt(i).widget()
+            if isinstance(w, ItemGridCard) and not w.visibleRegion().isEmpty():
+                self.image_loader.prioritize(w.item, ImageFetchService.PRIORITY_VISIBLE)
+
     def on_item_clicked(self, item): 
         self.selected_item_id = item.get('id')
         for i in range(self.grid_layout.count()):
@@ -535,7 +523,7 @@ class ItemDatabaseWindow(BasePage):
 
     # --- NEW: Explicit Cleanup Method ---
     def cleanup(self):
-        """Called by parent when closing to stop image download threads."""
+        """Called by parent when closing to drop pending image requests."""
         if hasattr(self, 'image_loader'):
             self.image_loader.cleanup()
 
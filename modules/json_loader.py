@@ -0,0 +1,62 @@
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson parses several times faster; optional dependency
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Small-file open latency (antivirus hooks on Windows) dominates, so more threads than cores pays off
+MAX_WORKERS = 16
+
+# Last load result per directory: {directory: {'files', 'errors', 'ms', 'parser'}}
+LOAD_STATS = {}
+
+
+def parse_json_bytes(raw: bytes):
+    if _HAS_ORJSON:
+        try: return orjson.loads(raw)
+        except orjson.JSONDecodeError: pass  # e.g. a UTF-8 BOM, which json accepts
+    return json.loads(raw)
+
+
+def load_json_file(path: str):
+    with open(path, 'rb') as f: return parse_json_bytes(f.read())
+
+
+def _read(path):
+    try: return load_json_file(path), None
+    except Exception as e: return None, e
+
+
+def load_json_dir(directory: str, label: str = None):
+    """
+    Reads and parses every *.json file in a directory concurrently.
+    Returns [(filename, data)] in directory-listing order, skipping files that failed;
+    prints one summary line with timing and error count (details for the first few errors).
+    """
+    label = label or os.path.basename(directory)
+    if not os.path.isdir(directory): return []
+    t0 = time.perf_counter()
+    filenames = [f for f in os.listdir(directory) if f.endswith('.json')]
+    paths = [os.path.join(directory, f) for f in filenames]
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(paths)), thread_name_prefix="JsonLoad") as pool: results = list(pool.map(_read, paths))
+    else:
+        results = [_read(p) for p in paths]
+
+    loaded, errors = [], []
+    for filename, (data, error) in zip(filenames, results):
+        if error is None: loaded.append((filename, data))
+        else: errors.append((filename, error))
+
+    ms = (time.perf_counter() - t0) * 1000
+    LOAD_STATS[directory] = {'files': len(filenames), 'errors': len(errors), 'ms': round(ms, 1), 'parser': 'orjson' if _HAS_ORJSON else 'json'}
+    print(f"[INFO] Loaded {len(loaded)}/{len(filenames)} {label} files in {ms:.0f}ms" + (f" ({len(errors)} errors)" if errors else ""))
+    for filename, error in errors[:5]: print(f"[WARN]   {label}/{filename}: {error}")
+    if len(errors) > 5: print(f"[WARN]   ... and {len(errors) - 5} more")
+    return loaded
@@ -0,0 +1,64 @@
+from types import MappingProxyType
+from functools import cached_property
+
+
+def localize(field, lang_code='en', default='Unknown'):
+    """Text of a {lang: text} field in lang_code (English fallback); plain strings pass through."""
+    if isinstance(field, dict): return field.get(lang_code, field.get('en', default))
+    if isinstance(field, str): return field
+    return default
+
+
+def entity_name(entity, lang_code='en'):
+    """Display name of an item / map / station / project / quest dict ('names' wins over 'name')."""
+    names = entity.get('names', {})
+    if isinstance(names, dict) and lang_code in names: return names[lang_code]
+    return localize(entity.get('name'), lang_code)
+
+
+def _index_names(entities, lang_code):
+    return MappingProxyType({e['id']: entity_name(e, lang_code) for e in entities if isinstance(e, dict) and e.get('id')})
+
+
+class LocalizedView:
+    """
+    Display strings of the static game data for one language, resolved once and read-only afterwards.
+    Item names are built up front (the scan overlay needs them); the quest / hideout / project / map parts
+    on first access, so they don't force the lazily loaded game data in early.
+    Owned by DataManager (see DataManager.localized), which drops it on data reload or language change.
+    """
+    def __init__(self, data_manager, lang_code='en'):
+        self.data_manager = data_manager
+        self.lang_code = lang_code
+        self.item_names = _index_names(data_manager.id_to_item_map.values(), lang_code)
+
+    @cached_property
+    def map_names(self): return _index_names(self.data_manager.maps_data, self.lang_code)
+
+    @cached_property
+    def station_names(self): return _index_names(self.data_manager.hideout_data, self.lang_code)
+
+    @cached_property
+    def project_names(self): return _index_names(self.data_manager.project_data, self.lang_code)
+
+    @cached_property
+    def quest_names(self): return MappingProxyType({q['id']: q['name'] for q in self.quests})
+
+    @cached_property
+    def quests(self):
+        """Quest records: the source quest with 'name' and 'objectives' flattened to this language and 'map_names' added."""
+        records = []
+        for quest in self.data_manager.quest_data:
+            if not quest.get('id'): continue
+            record = dict(quest)
+            record['name'] = entity_name(quest, self.lang_code)
+            record['objectives'] = tuple(localize(obj, self.lang_code) for obj in quest.get('objectives', []) if isinstance(obj, (dict, str)))
+            record['map_names'] = tuple(self.quest_map_names(quest))
+            records.append(MappingProxyType(record))
+        return tuple(records)
+
+    def quest_map_names(self, quest):
+        map_ids = quest.get('map')
+        if not map_ids: return []
+        if isinstance(map_ids, str): map_ids = [map_ids]
+        return [self.map_names.get(mid) or mid.replace('_', ' ').title() for mid in map_ids]
@@ -0,0 +1,138 @@
+"""
+OCR preprocessing benchmark over a corpus of tooltip images.
+
+Runs ItemScanner.recognize_tooltip (header crop -> preprocessing -> title-line OCR -> matching)
+on every image for each preprocessing mode and reports latency and accuracy.
+
+Usage:
+    python -m modules.ocr_benchmark [CORPUS_DIR] [--modes pil,cv2] [--labels labels.json] [--catalog-scale 10] [--output FILE]
+
+CORPUS_DIR defaults to the debug image folder (*_tooltip_result.png files written by
+"Save Debug Images"). Accuracy needs ground truth: either a labels JSON {"file.png": "Item Name"},
+or a manifest.json in the corpus directory with {"entries": [{"file": ..., "name": ...}]}.
+Without labels, agreement between the modes is reported instead.
+--catalog-scale N matches against the item list padded with synthetic distractors to N times its size.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from types import SimpleNamespace
+
+from PIL import Image
+
+from .constants import Constants
+from .data_manager import ItemDatabase, DataManager
+from .scanner import ItemScanner
+from .ocr_vocabulary import ensure_ocr_vocabularies
+from .tooltip_synth import inflate_catalog
+
+
+def load_labels(corpus_dir, labels_path=None):
+    """{filename: expected item name} from an explicit labels file or the corpus manifest.json."""
+    path = labels_path or os.path.join(corpus_dir, "manifest.json")
+    if not os.path.exists(path): return {}
+    with open(path, 'r', encoding='utf-8') as f: data = json.load(f)
+    if isinstance(data, dict) and 'entries' in data:
+        return {e['file']: e['name'] for e in data['entries'] if e.get('file') and e.get('name')}
+    return {k: v for k, v in data.items() if isinstance(v, str)}
+
+
+def list_corpus(corpus_dir, labels):
+    if labels: return sorted(f for f in labels if os.path.exists(os.path.join(corpus_dir, f)))
+    files = sorted(f for f in os.listdir(corpus_dir) if f.lower().endswith('.png'))
+    tooltips = [f for f in files if f.endswith("_tooltip_result.png")]
+    return tooltips or files
+
+
+def _stats(values):
+    if not values: return {'mean': 0.0, 'p50': 0.0, 'p95': 0.0}
+    ordered = sorted(values)
+    return {'mean': statistics.fmean(ordered), 'p50': ordered[len(ordered) // 2], 'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]}
+
+
+def run_benchmark(corpus_dir, modes=("pil", "cv2"), labels=None, lang="en", tesseract_path=None, text_height=32, catalog_scale=1.0):
+    data_manager = DataManager(ItemDatabase().items)
+    config = SimpleNamespace(tesseract_path=tesseract_path, once=False, debug=False)
+    scanner = ItemScanner(config, data_manager); ensure_ocr_vocabularies()
+    ocr_lang = next((tess for json_code, tess in Constants.LANGUAGES.values() if json_code == lang), 'eng')
+
+    labels = labels or {}
+    files = list_corpus(corpus_dir, labels)
+    if not files:
+        print(f"[WARN] No tooltip images found in {corpus_dir}")
+        return None
+
+    results = {'meta': {'corpus': os.path.abspath(corpus_dir), 'images': len(files), 'labelled': sum(1 for f in files if f in labels),
+                        'lang': lang, 'text_height': text_height, 'catalog_scale': catalog_scale}, 'modes': {}, 'items': {f: {} for f in files}}
+    for mode in modes:
+        scanner.update_settings(scanner.target_color, ocr_lang, lang, preprocess_mode=mode, ocr_text_height=text_height)
+        inflate_catalog(scanner, catalog_scale)  # Same seed every mode: identical distractors
+        results['meta']['catalog_items'] = len(scanner._get_language_filtered_items())
+        prep_ms, total_ms, correct, recognised = [], [], 0, 0
+        for filename in files:
+            with Image.open(os.path.join(corpus_dir, filename)) as raw: img = raw.convert("RGB")
+            scanner._ocr_cache.clear()  # Measure real OCR work, not cache hits
+
+            t0 = time.perf_counter(); scanner.prepare_for_ocr(img); prep_ms.append((time.perf_counter() - t0) * 1000)
+            t0 = time.perf_counter(); name = scanner.recognize_tooltip(img); total_ms.append((time.perf_counter() - t0) * 1000)
+
+            expected = labels.get(filename)
+            if name: recognised += 1
+            if expected and name and name.lower() == expected.lower(): correct += 1
+            results['items'][filename][mode] = {'name': name, 'expected': expected, 'ms': round(total_ms[-1], 2)}
+
+        labelled = results['meta']['labelled']
+        results['modes'][mode] = {
+            'preprocess_ms': _stats(prep_ms), 'total_ms': _stats(total_ms),
+            'recognised': recognised, 'correct': correct,
+            'accuracy': (correct / labelled) if labelled else None,
+        }
+    scanner.close()
+    return results
+
+
+def print_report(results):
+    meta = results['meta']
+    print(f"\n=== OCR preprocessing benchmark: {meta['images']} images ({meta['labelled']} labelled), lang={meta['lang']}, catalog={meta['catalog_items']} items (x{meta['catalog_scale']:g}) ===")
+    print(f"{'mode':<6}{'prep p50':>10}{'prep p95':>10}{'total p50':>11}{'total p95':>11}{'found':>8}{'accuracy':>10}")
+    for mode, r in results['modes'].items():
+        acc = f"{r['accuracy']:.1%}" if r['accuracy'] is not None else "-"
+        print(f"{mode:<6}{r['preprocess_ms']['p50']:>10.2f}{r['preprocess_ms']['p95']:>10.2f}{r['total_ms']['p50']:>11.2f}{r['total_ms']['p95']:>11.2f}"
+              f"{r['recognised']:>8}{acc:>10}")
+
+    modes = list(results['modes'])
+    if len(modes) > 1:
+        disagreements = [(f, r) for f, r in results['items'].items() if len({(r.get(m) or {}).get('name') for m in modes}) > 1]
+        print(f"\nModes disagree on {len(disagreements)} image(s)")
+        for filename, r in disagreements[:15]:
+            print(f"  {filename}: " + ", ".join(f"{m}={r[m]['name']!r}" for m in modes) + (f" (expected {r[modes[0]]['expected']!r})" if r[modes[0]]['expected'] else ""))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark OCR preprocessing modes on a corpus of tooltip images.")
+    parser.add_argument('corpus', nargs='?', default=os.path.join(Constants.DATA_DIR, "debug_images"))
+    parser.add_argument('--modes', default="pil,cv2", help="Comma separated preprocessing modes")
+    parser.add_argument('--labels', default=None, help="JSON {filename: item name}; defaults to CORPUS/manifest.json")
+    parser.add_argument('--lang', default="en", help="Data language code")
+    parser.add_argument('--text-height', type=int, default=32, help="Target text height for the cv2 mode")
+    parser.add_argument('--catalog-scale', type=float, default=1.0, help="Pad the item catalog with synthetic distractors to N times its size (1-100)")
+    parser.add_argument('--tesseract', default=None, help="Path to the tesseract executable")
+    parser.add_argument('--output', default=None, help="Write the full results as JSON")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.corpus):
+        print(f"[ERROR] Corpus directory not found: {args.corpus}"); return 1
+    results = run_benchmark(args.corpus, [m.strip() for m in args.modes.split(',') if m.strip()], load_labels(args.corpus, args.labels),
+                            args.lang, args.tesseract, args.text_height, max(1.0, args.catalog_scale))
+    if results is None: return 1
+    print_report(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f: json.dump(results, f, indent=2)
+        print(f"\n[INFO] Results written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__': sys.exit(main())
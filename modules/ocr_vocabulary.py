@@ -0,0 +1,108 @@
+import os
+import re
+import sys
+import json
+from .constants import Constants
+
+# Per-language Tesseract vocabulary derived from the item names in data/items/*.json:
+#   ocr_vocab/<lang>.json          {'chars': ..., 'words': N, 'patterns': N}
+#   ocr_vocab/<lang>.user-words    one word per line (--user-words)
+#   ocr_vocab/<lang>.user-patterns digit patterns like "Mk.\d" (--user-patterns)
+VOCAB_DIR = os.path.join(Constants.DATA_DIR, "ocr_vocab")
+
+# Never whitelisted: whitespace separates words, quotes/backslashes would break the argument parsing
+_EXCLUDED_CHARS = set("\"'\\`")
+
+
+def _iter_item_names(items_dir):
+    for filename in os.listdir(items_dir):
+        if not filename.endswith('.json'): continue
+        try:
+            with open(os.path.join(items_dir, filename), 'r', encoding='utf-8') as f: name_obj = json.load(f).get('name')
+        except (OSError, ValueError, AttributeError): continue
+        if isinstance(name_obj, dict):
+            for lang, name in name_obj.items():
+                if name: yield lang, str(name).strip()
+        elif isinstance(name_obj, str) and name_obj.strip():
+            yield 'en', name_obj.strip()
+
+
+def generate_ocr_vocabularies(items_dir=None, out_dir=None):
+    """Writes the character set, user-words and user-patterns for every language found in the item names. Returns the language count."""
+    items_dir = items_dir or Constants.ITEMS_DIR; out_dir = out_dir or VOCAB_DIR
+    if not os.path.isdir(items_dir): return 0
+
+    chars, words = {}, {}
+    for lang, name in _iter_item_names(items_dir):
+        lang_chars = chars.setdefault(lang, set()); lang_words = words.setdefault(lang, set())
+        for ch in name:
+            if ch.isspace() or ch in _EXCLUDED_CHARS: continue
+            # Tooltips may render names in upper case
+            lang_chars.update((ch, ch.upper(), ch.lower()))
+        lang_words.update(w for w in name.split() if w)
+
+    os.makedirs(out_dir, exist_ok=True)
+    for lang, lang_chars in chars.items():
+        lang_chars = {c for c in lang_chars if len(c) == 1 and not c.isspace() and c not in _EXCLUDED_CHARS}
+        lang_words = sorted(words[lang])
+        patterns = sorted({re.sub(r'\d', r'\\d', w.replace('\\', '\\\\')) for w in lang_words if any(c.isdigit() for c in w)})
+        base = os.path.join(out_dir, lang)
+        with open(base + ".user-words", 'w', encoding='utf-8') as f: f.write("\n".join(lang_words) + "\n")
+        with open(base + ".user-patterns", 'w', encoding='utf-8') as f: f.write("\n".join(patterns) + "\n")
+        with open(base + ".json", 'w', encoding='utf-8') as f:
+            json.dump({'chars': "".join(sorted(lang_chars)), 'words': len(lang_words), 'patterns': len(patterns)}, f, ensure_ascii=False)
+
+    print(f"[INFO] Generated OCR vocabularies for {len(chars)} languages.")
+    return len(chars)
+
+
+def ensure_ocr_vocabularies(items_dir=None, out_dir=None):
+    """Generates the vocabularies only if none exist yet (data synced by older versions). Returns the language count written."""
+    out_dir = out_dir or VOCAB_DIR
+    if os.path.isdir(out_dir) and any(f.endswith('.json') for f in os.listdir(out_dir)): return 0
+    try: return generate_ocr_vocabularies(items_dir, out_dir)
+    except OSError as e: print(f"[WARN] Could not generate OCR vocabularies: {e}"); return 0
+
+
+def _arg_safe_path(path):
+    """Path usable inside a Tesseract -c argument (no spaces). Uses the 8.3 short name on Windows."""
+    if ' ' not in path: return path
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            buf = ctypes.create_unicode_buffer(1024)
+            if ctypes.windll.kernel32.GetShortPathNameW(path, buf, len(buf)) and ' ' not in buf.value: return buf.value
+        except (AttributeError, OSError): pass
+    return None
+
+
+class OcrVocabulary:
+    """Loaded vocabulary of one language: Tesseract arguments plus the matching OCR line filter."""
+    def __init__(self, lang, chars, words_file=None, patterns_file=None):
+        self.lang = lang
+        self.chars = chars
+        self.words_file = words_file
+        self.patterns_file = patterns_file
+        # Keep only characters that exist in this language's item names (plus whitespace)
+        self._strip = re.compile("[^" + "".join(re.escape(c) for c in chars) + r"\s]") if chars else None
+
+    @classmethod
+    def load(cls, lang, vocab_dir=None):
+        base = os.path.join(vocab_dir or VOCAB_DIR, lang)
+        try:
+            with open(base + ".json", 'r', encoding='utf-8') as f: data = json.load(f)
+        except (OSError, ValueError): return None
+        words = base + ".user-words"; patterns = base + ".user-patterns"
+        return cls(lang, data.get('chars', ""), words if os.path.exists(words) else None, patterns if os.path.exists(patterns) else None)
+
+    def tesseract_args(self):
+        """Extra tesseract config: character whitelist + user words/patterns (skipped if their path can't be passed safely)."""
+        args = []
+        if self.chars: args.append(f"-c tessedit_char_whitelist={self.chars}")
+        for key, path in (('user_words_file', self.words_file), ('user_patterns_file', self.patterns_file)):
+            safe = _arg_safe_path(path) if path else None
+            if safe: args.append(f"-c {key}={safe}")
+        return " ".join(args)
+
+    def clean_line(self, line):
+        return self._strip.sub('', line).strip() if self._strip else line.strip()
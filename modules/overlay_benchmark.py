@@ -0,0 +1,229 @@
+"""
+Headless item overlay render benchmark.
+
+Renders the item overlay for every item in the dataset (or a random sample) on Qt's
+'offscreen' platform and records per item:
+    construct - OverlayRenderer.build_blocks + block widget creation (ItemOverlay.refresh_ui)
+    layout    - layout activation + adjustSize
+    paint     - rendering the whole overlay into a QImage
+    show      - ItemOverlay.show_smart (positioning + animation start)
+
+Usage:
+    python -m modules.overlay_benchmark [--sample N] [--renderer widgets|painted] [--output FILE] [--baseline OLD.json]
+
+The JSON written to --output can be passed as --baseline on a later run to diff per-phase
+percentiles and per-item regressions between versions.
+"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # Must be set before the QApplication exists
+
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+from datetime import datetime
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QCoreApplication, QEvent, PYQT_VERSION_STR, QT_VERSION_STR
+from PyQt6.QtGui import QImage
+
+from .config_manager import ConfigManager
+from .data_manager import ItemDatabase, DataManager
+from .overlay_ui import ItemOverlay, OverlayRenderer
+
+PHASES = ("construct", "layout", "paint", "show")
+
+
+def _percentile(values, pct):
+    if not values: return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _summarize(values):
+    return {
+        'mean': statistics.fmean(values) if values else 0.0,
+        'p50': _percentile(values, 50), 'p95': _percentile(values, 95), 'p99': _percentile(values, 99),
+        'max': max(values) if values else 0.0
+    }
+
+
+def build_overlay_packet(data_manager, item, lang_code="en"):
+    """Same data packet ItemScanner._aggregate_item_data produces for a matched item (without the OCR part)."""
+    item_name = item.get('name', '')
+    item_id = item.get('id')
+    stash_count = data_manager.get_stash_count(item_id) if item_id else 0
+    is_bp = (item.get('type') == "Blueprint") or ("Blueprint" in item_name)
+    return {
+        "item": item,
+        "trade": data_manager.find_trades_for_item(item_name),
+        "hideout": data_manager.find_hideout_requirements(item_name, lang_code=lang_code),
+        "project": data_manager.find_project_requirements(item_name, lang_code=lang_code),
+        "quests": data_manager.find_quest_requirements(item_name, lang_code=lang_code),
+        "blueprint": is_bp,
+        "note": data_manager.get_item_note(item_id) if item_id else "",
+        "stash_count": stash_count,
+        "is_collected_bp": is_bp and stash_count > 0,
+    }
+
+
+def _flush_deletes():
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    QApplication.processEvents()
+
+
+def render_once(overlay, packet, data_manager, lang_code, warm=False, image_dir=None):
+    """Runs one full show cycle and returns {phase: milliseconds}."""
+    if not warm:
+        overlay.clear_blocks(); _flush_deletes()
+
+    timings = {}
+    overlay.apply_settings()
+    overlay.set_item(packet['item'], packet['blueprint'], packet['hideout'], packet['project'], packet['trade'], packet['note'],
+                     stash_count=packet['stash_count'], is_collected_blueprint=packet['is_collected_bp'],
+                     quest_reqs=packet['quests'], data_manager=data_manager, lang_code=lang_code, timings=timings)
+
+    t0 = time.perf_counter()
+    img = QImage(overlay.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    img.fill(Qt.GlobalColor.transparent)
+    overlay.render(img)
+    timings['paint'] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    overlay.show_smart()
+    timings['show'] = time.perf_counter() - t0
+    overlay.close()
+    QApplication.processEvents()
+
+    if image_dir:
+        img.save(os.path.join(image_dir, f"{packet['item'].get('id', 'unknown')}.png"))
+    return {phase: timings.get(phase, 0.0) * 1000.0 for phase in PHASES}
+
+
+def run_benchmark(sample=None, seed=0, repeat=3, renderer=None, lang_code="en", warm=False, image_dir=None, outlier_factor=2.0):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    cfg = ConfigManager()
+    settings = cfg.parser
+    if not settings.has_section('ItemOverlay'): settings.add_section('ItemOverlay')
+    if renderer: settings.set('ItemOverlay', 'renderer', renderer)  # In-memory only, config is never saved
+
+    t0 = time.perf_counter()
+    data_manager = DataManager(ItemDatabase().items)
+    print(f"[INFO] Data loaded in {time.perf_counter() - t0:.2f}s")
+
+    items = sorted(data_manager.id_to_item_map.values(), key=lambda i: i.get('id', ''))
+    if sample and sample < len(items): items = random.Random(seed).sample(items, sample)
+    if not items:
+        print("[WARN] No items found. Run a data sync first.")
+        return None
+    if image_dir: os.makedirs(image_dir, exist_ok=True)
+
+    overlay = ItemOverlay.create_pooled(settings, data_manager, lang_code=lang_code)
+    # Warm-up (first use pays for style sheet parsing, font loading, native window creation)
+    render_once(overlay, build_overlay_packet(data_manager, items[0], lang_code), data_manager, lang_code)
+
+    results = {}
+    for idx, item in enumerate(items, start=1):
+        packet = build_overlay_packet(data_manager, item, lang_code)
+        runs = [render_once(overlay, packet, data_manager, lang_code, warm=warm, image_dir=image_dir if r == 0 else None) for r in range(max(1, repeat))]
+        entry = {phase: statistics.median(run[phase] for run in runs) for phase in PHASES}
+        entry['total'] = sum(entry[phase] for phase in PHASES)
+        entry.update({
+            'name': item.get('name', ''),
+            'width': overlay.width(), 'height': overlay.height(),
+            'cards': len(item.get('recyclesInto') or {}) + len(item.get('salvagesInto') or {}),
+            'req_lines': len(packet['hideout']) + len(packet['project']) + len(packet['quests']) + len(packet['trade']),
+        })
+        results[item.get('id', item.get('name'))] = entry
+        if idx % 50 == 0 or idx == len(items): print(f"[INFO] Rendered {idx}/{len(items)} overlays...")
+
+    summary = {phase: _summarize([e[phase] for e in results.values()]) for phase in PHASES + ('total',)}
+    median_total = summary['total']['p50']
+    outliers = sorted((iid for iid, e in results.items() if median_total and e['total'] > outlier_factor * median_total),
+                      key=lambda iid: results[iid]['total'], reverse=True)
+
+    overlay.deleteLater(); _flush_deletes()
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'renderer': OverlayRenderer.get_renderer_mode(settings),
+            'font_size': settings.getint('ItemOverlay', 'font_size', fallback=12),
+            'lang': lang_code, 'items': len(results), 'repeat': repeat, 'warm': warm, 'seed': seed if sample else None,
+            'outlier_factor': outlier_factor,
+            'qt': QT_VERSION_STR, 'pyqt': PYQT_VERSION_STR, 'python': platform.python_version(),
+            'platform': f"{platform.system()} {platform.release()} ({app.platformName()})",
+        },
+        'summary': summary,
+        'outliers': outliers,
+        'items': results,
+    }
+
+
+# --- REPORTING ---
+def print_report(report, top=10):
+    meta = report['meta']
+    print(f"\n=== Overlay render benchmark: {meta['items']} items, renderer={meta['renderer']}, font={meta['font_size']}pt, "
+          f"{'warm' if meta['warm'] else 'cold'}, median of {meta['repeat']} ===")
+    print(f"{'phase':<10}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+    for phase, s in report['summary'].items():
+        print(f"{phase:<10}{s['mean']:>9.2f}{s['p50']:>9.2f}{s['p95']:>9.2f}{s['p99']:>9.2f}{s['max']:>9.2f}")
+
+    items = report['items']
+    if report['outliers']:
+        print(f"\nOutliers (> {meta['outlier_factor']}x median total): {len(report['outliers'])}")
+        for iid in report['outliers'][:top]:
+            e = items[iid]
+            print(f"  {e['total']:8.2f} ms  {e['name'][:40]:<40} cards={e['cards']:<3} req_lines={e['req_lines']:<3} {e['width']}x{e['height']}")
+
+
+def print_comparison(report, baseline, threshold=0.25, top=10):
+    print(f"\n=== Compared to baseline ({baseline['meta'].get('timestamp')}, renderer={baseline['meta'].get('renderer')}) ===")
+    for phase, s in report['summary'].items():
+        old = baseline.get('summary', {}).get(phase)
+        if not old: continue
+        d50 = s['p50'] - old['p50']; d95 = s['p95'] - old['p95']
+        print(f"{phase:<10} p50 {old['p50']:7.2f} -> {s['p50']:7.2f} ({d50:+.2f})   p95 {old['p95']:7.2f} -> {s['p95']:7.2f} ({d95:+.2f})")
+
+    regressions = []
+    for iid, e in report['items'].items():
+        old = baseline.get('items', {}).get(iid)
+        if old and old.get('total') and e['total'] > old['total'] * (1 + threshold): regressions.append((e['total'] / old['total'], iid))
+    if regressions:
+        print(f"\nItems slower by more than {threshold:.0%}: {len(regressions)}")
+        for ratio, iid in sorted(regressions, reverse=True)[:top]:
+            print(f"  x{ratio:.2f}  {report['items'][iid]['name']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless item overlay render benchmark (Qt offscreen platform).")
+    parser.add_argument('--sample', type=int, default=None, help="Render a random sample of N items instead of all")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for --sample")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per item (median is reported)")
+    parser.add_argument('--renderer', choices=("widgets", "painted"), default=None, help="Override [ItemOverlay] renderer")
+    parser.add_argument('--lang', default="en", help="Data language code")
+    parser.add_argument('--warm', action='store_true', help="Keep blocks between items (diffing path) instead of cold rebuilds")
+    parser.add_argument('--outlier-factor', type=float, default=2.0, help="Flag items slower than FACTOR x median total")
+    parser.add_argument('--output', default="overlay_benchmark.json", help="Where to write the JSON report")
+    parser.add_argument('--baseline', default=None, help="Previous JSON report to compare against")
+    parser.add_argument('--images', default=None, help="Directory to save the rendered overlays as PNG")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.sample, args.seed, args.repeat, args.renderer, args.lang, args.warm, args.images, args.outlier_factor)
+    if report is None: return 1
+
+    with open(args.output, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2)
+    print_report(report)
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r', encoding='utf-8') as f: print_comparison(report, json.load(f))
+        except (OSError, json.JSONDecodeError) as e: print(f"[WARN] Could not read baseline {args.baseline}: {e}")
+    print(f"\n[INFO] Report written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__': sys.exit(main())
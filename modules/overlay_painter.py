@@ -0,0 +1,235 @@
+from PyQt6.QtWidgets import QWidget, QApplication, QSizePolicy
+from PyQt6.QtCore import Qt, QRect, QSize, QPoint
+from PyQt6.QtGui import QPainter, QColor, QFont, QFontMetrics, QPen
+from .constants import Constants
+from .icon_cache import get_icon_cache
+
+# =============================================================================
+# CUSTOM-PAINTED ITEM OVERLAY (Alternative to the QLabel/QFrame renderer)
+# =============================================================================
+# Turns the section specs from OverlayRenderer.plan_sections into a display list
+# (text runs, icons, fills, separators) with a precomputed size, then paints it in a
+# single paintEvent. No style sheets, no nested layouts, no graphics effects.
+
+BLOCK_SPACING = 6      # Matches the overlay container layout spacing
+SECTION_MARGIN = 4     # Matches the 4px section frame margins
+TEXT_COLOR = "#E0E6ED"
+MUTED_COLOR = QColor(255, 255, 255, 102)   # rgba(255, 255, 255, 0.4)
+SEPARATOR_COLOR = QColor(255, 255, 255, 128)
+
+_FONT_CACHE = {}
+
+def get_font(point_size, weight=QFont.Weight.Normal, italic=False, strike=False, letter_spacing=0.0):
+    """Cached (QFont, QFontMetrics) pair. Fonts are created once per style for the whole process."""
+    key = (point_size, weight, italic, strike, letter_spacing)
+    entry = _FONT_CACHE.get(key)
+    if entry is None:
+        font = QFont(QApplication.font())
+        font.setPointSize(max(1, int(point_size))); font.setWeight(weight); font.setItalic(italic); font.setStrikeOut(strike)
+        if letter_spacing: font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, letter_spacing)
+        entry = (font, QFontMetrics(font)); _FONT_CACHE[key] = entry
+    return entry
+
+
+class DisplayListBuilder:
+    """Lays out section specs at a fixed content width and records paint ops."""
+    def __init__(self, width):
+        self.width = width; self.y = 0
+        self.ops = []        # ('text', rect, text, font, color, flags, glow) | ('pixmap', point, pixmap) | ('fill', rect, color, radius) | ('line', y)
+        self.hit_rects = []  # (rect, callback)
+
+    # --- MEASUREMENT (natural width, before wrapping) ---
+    @staticmethod
+    def natural_width(specs):
+        width = 0
+        for _, _, kind, kw in specs:
+            fs = kw.get('font_size', 12)
+            if kind == 'header':
+                name = kw['data_manager'].get_localized_name(kw['item_data'], kw['lang_code']).upper()
+                _, fm = get_font(fs + 4, QFont.Weight.Black, letter_spacing=0.5)
+                width = max(width, 72 + fm.horizontalAdvance(name) + 36)
+            elif kind == 'requirements':
+                _, fm = get_font(fs)
+                for req in kw['req_list']: width = max(width, SECTION_MARGIN * 2 + 24 + fm.horizontalAdvance(f"- {req[0]}"))
+            elif kind == 'glass':
+                _, fm = get_font(fs, italic=kw.get('is_italic', False))
+                width = max(width, SECTION_MARGIN * 2 + 24 + fm.horizontalAdvance(str(kw['title'])))
+            elif kind == 'item_cards':
+                _, fm = get_font(fs, QFont.Weight.Bold)
+                for iid, qty in kw['id_qty_map'].items():
+                    name = kw['data_manager'].get_localized_name(iid, kw['lang_code'])
+                    width = max(width, SECTION_MARGIN * 2 + 4 + 10 + 32 + 10 + fm.horizontalAdvance(name) + 20 + fm.horizontalAdvance(f"×{qty}") + 12)
+        return width
+
+    # --- BLOCKS ---
+    def add(self, kind, kw):
+        if self.y > 0: self.y += BLOCK_SPACING
+        getattr(self, f"_add_{kind}")(**kw)
+
+    def _text(self, rect, text, font_metrics, color, flags=Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, glow=None):
+        self.ops.append(('text', rect, text, font_metrics[0], QColor(color), flags, glow))
+
+    def _add_separator(self):
+        # QFrame HLine with "margin: 2px 0px; max-height: 1px"
+        self.ops.append(('line', self.y + 2)); self.y += 5
+
+    def _add_header(self, item_data, stash_count, is_tracked, toggle_track_callback, font_size, show_storage, data_manager, lang_code):
+        rarity = item_data.get('rarity', 'Common')
+        rarity_color = Constants.RARITY_COLORS.get(rarity, "#FFFFFF")
+        top = self.y; x = 0
+
+        pix = get_icon_cache().item_pixmap(item_data, 56) if item_data.get('imageFilename') else None
+        if pix is not None:
+            self.ops.append(('pixmap', QPoint(x + (60 - pix.width()) // 2, top + (60 - pix.height()) // 2), pix)); x += 60 + 12
+
+        text_w = max(40, self.width - x - 12 - 24)
+        name_fm = get_font(font_size + 4, QFont.Weight.Black, letter_spacing=0.5)
+        name = data_manager.get_localized_name(item_data, lang_code).upper()
+        name_h = name_fm[1].boundingRect(QRect(0, 0, text_w, 10000), Qt.TextFlag.TextWordWrap, name).height()
+
+        meta_fm = get_font(8, QFont.Weight.Bold, letter_spacing=1.0)
+        meta_h = meta_fm[1].height()
+        block_h = name_h + meta_h
+        total_h = max(60 if pix is not None else 0, block_h, 24)
+        ty = top + (total_h - block_h) // 2
+
+        glow = QColor(rarity_color).lighter(120) if rarity in ["Legendary", "Epic"] else None
+        self._text(QRect(x, ty, text_w, name_h), name, name_fm, rarity_color, Qt.AlignmentFlag.AlignLeft | Qt.TextFlag.TextWordWrap, glow)
+
+        # Metadata (Rarity | Stash | Price)
+        meta_str = rarity.upper()
+        if stash_count > 0 and show_storage: meta_str += f"  |  STASH: {stash_count}"
+        my = ty + name_h; mx = x
+        w = meta_fm[1].horizontalAdvance(meta_str); self._text(QRect(mx, my, w, meta_h), meta_str, meta_fm, MUTED_COLOR); mx += w + 6
+        val = item_data.get('value', 0)
+        if val > 0:
+            w = meta_fm[1].horizontalAdvance("|"); self._text(QRect(mx, my, w, meta_h), "|", meta_fm, MUTED_COLOR); mx += w + 6
+            price = f"{int(val):,}"; w = meta_fm[1].horizontalAdvance(price); self._text(QRect(mx, my, w, meta_h), price, meta_fm, "#E5C07B")
+
+        # Track star (top right)
+        star_rect = QRect(self.width - 24, top, 24, 24)
+        self._text(star_rect, "★" if is_tracked else "☆", get_font(15), "#FFD700" if is_tracked else QColor(255, 255, 255, 77), Qt.AlignmentFlag.AlignCenter)
+        if toggle_track_callback: self.hit_rects.append((star_rect, toggle_track_callback))
+
+        self.y = top + total_h
+
+    def _add_glass(self, icon_path, title, title_color, font_size, lines=None, custom_widgets=None, is_italic=False, bold_title=False, item_cards=None):
+        top = self.y + SECTION_MARGIN; x = SECTION_MARGIN
+        fm = get_font(font_size, QFont.Weight.Bold if bold_title else QFont.Weight.Normal, italic=is_italic)
+        row_h = max(fm[1].height(), 16)
+        icon = get_icon_cache().path_pixmap(icon_path, 16) if icon_path else None
+        if icon is not None:
+            self.ops.append(('pixmap', QPoint(x, top + (row_h - icon.height()) // 2), icon)); x += 16 + 8
+        avail = self.width - SECTION_MARGIN - x
+        self._text(QRect(x, top, avail, row_h), fm[1].elidedText(str(title), Qt.TextElideMode.ElideRight, avail), fm, title_color)
+        y = top + row_h
+
+        if lines:
+            lfm = get_font(font_size - 1)
+            for line in lines:
+                y += 2; self._text(QRect(SECTION_MARGIN + 24, y, avail, lfm[1].height()), line, lfm, "#ABB2BF"); y += lfm[1].height()
+
+        for card in (item_cards or []):
+            y += 2; y = self._item_card(y, *card)
+        self.y = y + SECTION_MARGIN
+
+    def _item_card(self, y, item_id, name, qty, font_size, data_manager, accent_color):
+        fm = get_font(font_size, QFont.Weight.Bold)
+        h = max(32, fm[1].height()); x = SECTION_MARGIN
+        self.ops.append(('fill', QRect(x, y, 4, h), QColor(accent_color), 3)); x += 4 + 10
+        pix = get_icon_cache().item_pixmap(item_id, 32, data_manager)
+        if pix is not None: self.ops.append(('pixmap', QPoint(x + (32 - pix.width()) // 2, y + (32 - pix.height()) // 2), pix))
+        else: self._text(QRect(x, y, 32, 32), "?", get_font(font_size, QFont.Weight.Bold), "#555", Qt.AlignmentFlag.AlignCenter)
+        x += 32 + 10
+        qty_txt = f"×{qty}"; qty_w = fm[1].horizontalAdvance(qty_txt); right = self.width - SECTION_MARGIN - 12
+        self._text(QRect(right - qty_w, y, qty_w, h), qty_txt, fm, accent_color)
+        name_w = max(10, right - qty_w - 10 - x)
+        self._text(QRect(x, y, name_w, h), fm[1].elidedText(name, Qt.TextElideMode.ElideRight, name_w), fm, TEXT_COLOR)
+        return y + h
+
+    def _add_item_cards(self, id_qty_map, icon_path, title, title_color, accent_color, font_size, data_manager, lang_code):
+        cards = [(iid, data_manager.get_localized_name(iid, lang_code), qty, font_size, data_manager, accent_color) for iid, qty in id_qty_map.items()]
+        self._add_glass(icon_path, title, title_color, font_size - 1, item_cards=cards)
+
+    def _add_requirements(self, header_text, icon_path, req_list, font_size, is_quest=False):
+        top = self.y + SECTION_MARGIN + 2; x = SECTION_MARGIN  # +2: "margin-top: 2px" on the section frame
+        hfm = get_font(8, QFont.Weight.Bold, letter_spacing=1.0)
+        row_h = max(hfm[1].height(), 18)
+        icon = get_icon_cache().path_pixmap(icon_path, 18) if icon_path else None
+        if icon is not None:
+            self.ops.append(('pixmap', QPoint(x, top + (row_h - icon.height()) // 2), icon)); x += 18 + 6
+        self._text(QRect(x, top, self.width - x, row_h), header_text, hfm, MUTED_COLOR)
+        y = top + row_h
+
+        for req in req_list:
+            if is_quest:
+                txt, active, done = req[0], req[1], req[2]
+                color = "#5C6370" if done else ("#FFD700" if active else "#ABB2BF")
+            else:
+                txt, rtype, done = req[0], req[1], req[2]
+                color = "#5C6370" if done else ("#98C379" if rtype == 'next' else "#D19A66")
+            fm = get_font(font_size, strike=bool(done))
+            avail = self.width - SECTION_MARGIN - 24 - SECTION_MARGIN
+            y += 2; self._text(QRect(SECTION_MARGIN + 24, y, avail, fm[1].height()), fm[1].elidedText(f"- {txt}", Qt.TextElideMode.ElideRight, avail), fm, color)
+            y += fm[1].height()
+        self.y = y + SECTION_MARGIN
+
+
+class PaintedOverlayView(QWidget):
+    """
+    Paints the whole item overlay content in one paintEvent.
+    Selected with [ItemOverlay] renderer = painted; the surrounding frame, border and shadow
+    still come from BaseOverlay.
+    """
+    def __init__(self, specs, font_size=12, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        self.setMouseTracking(True)  # Hand cursor over the track star
+        min_w = max(340, font_size * 25) - 30; max_w = max(450, font_size * 35) - 30  # Container width minus 15px side margins
+        width = min(max_w, max(min_w, DisplayListBuilder.natural_width(specs)))
+
+        builder = DisplayListBuilder(width)
+        for _, _, kind, kw in specs: builder.add(kind, kw)
+        self.ops = builder.ops; self.hit_rects = builder.hit_rects
+        self._size = QSize(width, builder.y)
+        self.setFixedSize(self._size)
+
+    def sizeHint(self): return self._size
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing); painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        for op in self.ops:
+            kind = op[0]
+            if kind == 'text':
+                _, rect, text, font, color, flags, glow = op
+                painter.setFont(font)
+                if glow is not None:
+                    # Cheap stand-in for the QGraphicsDropShadowEffect glow on Epic/Legendary names
+                    halo = QColor(glow); halo.setAlpha(45); painter.setPen(halo)
+                    for dx, dy in ((-2, 0), (2, 0), (0, -2), (0, 2), (-1, -1), (1, 1), (-1, 1), (1, -1)):
+                        painter.drawText(rect.translated(dx, dy), int(flags), text)
+                painter.setPen(color); painter.drawText(rect, int(flags), text)
+            elif kind == 'pixmap':
+                painter.drawPixmap(op[1], op[2])
+            elif kind == 'fill':
+                _, rect, color, radius = op
+                painter.setPen(Qt.PenStyle.NoPen); painter.setBrush(color); painter.drawRoundedRect(rect, radius, radius)
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+            elif kind == 'line':
+                painter.setPen(QPen(SEPARATOR_COLOR, 1)); painter.drawLine(0, op[1], self.width(), op[1])
+        painter.end()
+
+    def mousePressEvent(self, event):
+        pos = event.position().toPoint()
+        for rect, callback in self.hit_rects:
+            if rect.contains(pos): callback(); return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        pos = event.position().toPoint()
+        over = any(rect.contains(pos) for rect, _ in self.hit_rects)
+        self.setCursor(Qt.CursorShape.PointingHandCursor if over else Qt.CursorShape.ArrowCursor)
+        super().mouseMoveEvent(event)
@@ -1,9 +1,10 @@
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QFrame, QGraphicsDropShadowEffect, QSizePolicy, QPushButton, QHBoxLayout
 from PyQt6.QtCore import Qt, QTimer, QPoint, QSize, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont, QCursor, QColor, QPixmap
-import os
+from PyQt6.QtGui import QFont, QCursor, QColor
 import math
+import time
 from .constants import Constants
+from .icon_cache import get_icon_cache
 
 # =============================================================================
 # SHARED RENDERER (Used by Overlay & Settings Preview)
@@ -27,6 +28,47 @@ class OverlayRenderer:
             data_manager: Reference to DataManager.
             lang_code (str): Language code.
         """
+        for _, _, build in OverlayRenderer.build_blocks(data_context, user_settings, data_manager, lang_code):
+            container_layout.addWidget(build())
+
+    @staticmethod
+    def build_blocks(data_context, user_settings, data_manager, lang_code="en"):
+        """
+        Plans the overlay as an ordered list of (key, signature, build) blocks.
+        build() creates the block's widget; signature captures every input it depends on,
+        so a reused overlay only rebuilds blocks whose signature changed (see ItemOverlay.refresh_ui).
+        """
+        if OverlayRenderer.get_renderer_mode(user_settings) == "painted":
+            # Single custom-painted widget fed from the same section plan
+            from .overlay_painter import PaintedOverlayView
+            specs = OverlayRenderer.plan_sections(data_context, user_settings, data_manager, lang_code)
+            font_size = user_settings.getint('ItemOverlay', 'font_size', fallback=12)
+            signature = tuple((key, sig) for key, sig, _, _ in specs)
+            return [('painted', signature, lambda: PaintedOverlayView(specs, font_size))]
+
+        builders = {
+            'header': OverlayRenderer._build_header,
+            'separator': OverlayRenderer._make_separator,
+            'glass': OverlayRenderer._make_glass_section,
+            'requirements': OverlayRenderer._make_requirement_section,
+            'item_cards': OverlayRenderer._make_item_card_section,
+        }
+        blocks = []
+        for key, signature, kind, kwargs in OverlayRenderer.plan_sections(data_context, user_settings, data_manager, lang_code):
+            blocks.append((key, signature, lambda f=builders[kind], kw=kwargs: f(**kw)))
+        return blocks
+
+    @staticmethod
+    def get_renderer_mode(user_settings):
+        """'widgets' (QLabel/QFrame per element) or 'painted' (single custom-painted widget)."""
+        return user_settings.get('ItemOverlay', 'renderer', fallback="widgets")
+
+    @staticmethod
+    def plan_sections(data_context, user_settings, data_manager, lang_code="en"):
+        """
+        Resolves visibility, order and filtering into renderer-agnostic specs:
+        (key, signature, kind, kwargs) with kind in header/separator/glass/requirements/item_cards.
+        """
         # Unpack Context
         item_data = data_context.get('item_data', {})
         hideout_reqs = data_context.get('hideout_reqs', [])
@@ -41,20 +83,121 @@ class OverlayRenderer:
         
         # Settings
         font_size = user_settings.getint('ItemOverlay', 'font_size', fallback=12)
+        show_storage = user_settings.getboolean('ItemOverlay', 'show_storage_info', fallback=True)
+        specs = []
+
+        # 1. Item Info Row (Image + Name + Track Button)
+        header_sig = (lang_code, font_size, show_storage, item_data.get('id'), item_data.get('rarity'), item_data.get('value'),
+                      item_data.get('imageFilename'), data_manager.get_localized_name(item_data, lang_code), stash_count, is_tracked)
+        specs.append(('header', header_sig, 'header', dict(item_data=item_data, stash_count=stash_count, is_tracked=is_tracked, toggle_track_callback=toggle_track_callback,
+                                                           font_size=font_size, show_storage=show_storage, data_manager=data_manager, lang_code=lang_code)))
+        specs.append(('sep:header', None, 'separator', {}))
+
+        # 3. Sections
+        section_order = user_settings.get('ItemOverlay', 'section_order', fallback="price,storage,trader,crafting,hideout,project,recycle,salvage").split(',')
+
+        # Config mapping for visibility
+        SECTION_CONFIG_MAP = {
+            'storage': 'show_storage_info',
+            'trader': 'show_trader_info',
+            'notes': 'show_notes',
+            'crafting': 'show_crafting_info',
+            'hideout': 'show_hideout_reqs',
+            'project': 'show_project_reqs',
+            'recycle': 'show_recycles_into',
+            'salvage': 'show_salvages_into'
+        }
+
+        show_completed_hideout = user_settings.getboolean('ItemOverlay', 'show_completed_hideout_reqs', fallback=False)
+        show_completed_project = user_settings.getboolean('ItemOverlay', 'show_completed_project_reqs', fallback=False)
+
+        for section_id in section_order:
+            kind = None; kwargs = None; sig = None
+            
+            # Check visibility
+            cfg_key = SECTION_CONFIG_MAP.get(section_id)
+            if cfg_key and not user_settings.getboolean('ItemOverlay', cfg_key, fallback=True):
+                continue
+            
+            if section_id == "price":
+                # Removed (Moved to header)
+                pass
+
+            elif section_id == "storage":
+                # Storage is already handled in the header based on 'show_storage_info'
+                # If we want a separate section, we could add it here.
+                pass
+
+            elif section_id == "notes":
+                if user_note:
+                    sig = user_note
+                    kind, kwargs = 'glass', dict(icon_path=None, title=user_note, title_color="#61AFEF", font_size=font_size-1, is_italic=True)
+
+            elif section_id == "trader":
+                # Mock or real trade info
+                if trade_info:
+                    sig = repr(trade_info)
+                    if isinstance(trade_info, str):
+                        kind, kwargs = 'glass', dict(icon_path=Constants.TRADER_ICON_PATH, title=trade_info, title_color="#E5C07B", font_size=font_size-1)
+                    elif isinstance(trade_info, list):
+                        kind, kwargs = 'requirements', dict(header_text="TRADER OFFERS", icon_path=Constants.TRADER_ICON_PATH, req_list=trade_info, font_size=font_size)
+
+            elif section_id == "crafting":
+                if crafting_info:
+                    sig = repr(crafting_info)
+                    kind, kwargs = 'requirements', dict(header_text="CRAFTING", icon_path=Constants.CRAFT_ICON_PATH, req_list=crafting_info, font_size=font_size)
+            
+            elif section_id == "hideout":
+                # Filter completed
+                filtered_h = [r for r in hideout_reqs if not r[2] or show_completed_hideout]
+                if filtered_h:
+                    sig = repr(filtered_h)
+                    kind, kwargs = 'requirements', dict(header_text="HIDEOUT REQUIREMENTS", icon_path=Constants.HIDEOUT_ICON_PATH, req_list=filtered_h, font_size=font_size)
+                
+            elif section_id == "project":
+                # Filter completed
+                filtered_p = [r for r in project_reqs if not r[2] or show_completed_project]
+                if filtered_p:
+                    sig = repr(filtered_p)
+                    kind, kwargs = 'requirements', dict(header_text="PROJECT REQUESTS", icon_path=Constants.PROJECT_ICON_PATH, req_list=filtered_p, font_size=font_size)
+            
+            elif section_id == "recycle" and isinstance(item_data.get('recyclesInto'), dict) and item_data['recyclesInto']:
+                # Using #61AFEF (Blue) as the card accent; section title keeps the current #ABB2BF
+                sig = repr(item_data['recyclesInto'])
+                kind, kwargs = 'item_cards', dict(id_qty_map=item_data['recyclesInto'], icon_path=Constants.RECYCLE_ICON_PATH, title="RECYCLES INTO", title_color="#ABB2BF",
+                                                  accent_color="#61AFEF", font_size=font_size, data_manager=data_manager, lang_code=lang_code)
+
+            elif section_id == "salvage" and isinstance(item_data.get('salvagesInto'), dict) and item_data['salvagesInto']:
+                # Reuse Item Card Logic - Orange for Salvage vs Blue for Recycle
+                sig = repr(item_data['salvagesInto'])
+                kind, kwargs = 'item_cards', dict(id_qty_map=item_data['salvagesInto'], icon_path=Constants.SALVAGE_ICON_PATH, title="SALVAGES INTO", title_color="#D19A66",
+                                                  accent_color="#D19A66", font_size=font_size, data_manager=data_manager, lang_code=lang_code)
+
+            elif section_id == "quest" and quest_reqs:
+                sig = repr(quest_reqs)
+                kind, kwargs = 'requirements', dict(header_text="QUEST REQUIREMENTS", icon_path=Constants.QUEST_ICON_PATH, req_list=quest_reqs, font_size=font_size, is_quest=True)
+
+            if kind:
+                specs.append((section_id, (lang_code, font_size, sig), kind, kwargs))
+                specs.append((f"sep:{section_id}", None, 'separator', {}))
+
+        return specs
+
+    @staticmethod
+    def _build_header(item_data, stash_count, is_tracked, toggle_track_callback, font_size, show_storage, data_manager, lang_code):
         rarity = item_data.get('rarity', 'Common')
         rarity_color = Constants.RARITY_COLORS.get(rarity, "#FFFFFF")
 
-        # 1. Item Info Row (Image + Name + Track Button)
-        info_row = QHBoxLayout()
+        header = QWidget()
+        info_row = QHBoxLayout(header)
+        info_row.setContentsMargins(0, 0, 0, 0)
         info_row.setSpacing(12)
         
-        # Item Image
-        img_filename = item_data.get('imageFilename')
-        if img_filename:
-            img_path = os.path.join(Constants.DATA_DIR, "images", "items", img_filename)
-            if os.path.exists(img_path):
+        # Item Image (shared icon cache: no disk read after the first scan of this item)
+        if item_data.get('imageFilename'):
+            pix = get_icon_cache().item_pixmap(item_data, 56)
+            if pix is not None:
                 img_lbl = QLabel()
-                pix = QPixmap(img_path).scaled(56, 56, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
                 img_lbl.setPixmap(pix)
                 # Fixed size to prevent expansion and removed backdrop/border
                 img_lbl.setFixedSize(60, 60)
@@ -83,7 +226,6 @@ class OverlayRenderer:
         meta_row.setSpacing(6)
 
         meta_str = f"{rarity.upper()}"
-        show_storage = user_settings.getboolean('ItemOverlay', 'show_storage_info', fallback=True)
         if stash_count > 0 and show_storage: meta_str += f"  |  STASH: {stash_count}"
         
         meta_lbl = QLabel(meta_str)
@@ -123,131 +265,27 @@ class OverlayRenderer:
         right_vbox.addStretch()
         info_row.addLayout(right_vbox)
 
-        container_layout.addLayout(info_row)
-
-        OverlayRenderer._add_separator(container_layout)
-
-        # 3. Sections
-        section_order = user_settings.get('ItemOverlay', 'section_order', fallback="price,storage,trader,crafting,hideout,project,recycle,salvage").split(',')
-        has_previous_section = True 
-
-        # Config mapping for visibility
-        SECTION_CONFIG_MAP = {
-            'storage': 'show_storage_info',
-            'trader': 'show_trader_info',
-            'notes': 'show_notes',
-            'crafting': 'show_crafting_info',
-            'hideout': 'show_hideout_reqs',
-            'project': 'show_project_reqs',
-            'recycle': 'show_recycles_into',
-            'salvage': 'show_salvages_into'
-        }
-
-        show_completed_hideout = user_settings.getboolean('ItemOverlay', 'show_completed_hideout_reqs', fallback=False)
-        show_completed_project = user_settings.getboolean('ItemOverlay', 'show_completed_project_reqs', fallback=False)
-
-        for section_id in section_order:
-            section_added = False
-            
-            # Check visibility
-            cfg_key = SECTION_CONFIG_MAP.get(section_id)
-            if cfg_key and not user_settings.getboolean('ItemOverlay', cfg_key, fallback=True):
-                continue
-            
-            if section_id == "price":
-                # Removed (Moved to header)
-                pass
-
-            elif section_id == "storage":
-                # Storage is already handled in the header based on 'show_storage_info'
-                # If we want a separate section, we could add it here.
-                pass
-
-            elif section_id == "notes":
-                if user_note:
-                    OverlayRenderer._add_glass_section(container_layout, None, user_note, "#61AFEF", font_size-1, is_italic=True)
-                    section_added = True
-
-            elif section_id == "trader":
-                # Mock or real trade info
-                if trade_info:
-                    if isinstance(trade_info, str):
-                        OverlayRenderer._add_glass_section(container_layout, Constants.TRADER_ICON_PATH, trade_info, "#E5C07B", font_size-1)
-                        section_added = True
-                    elif isinstance(trade_info, list):
-                        OverlayRenderer._add_requirement_section(container_layout, "TRADER OFFERS", Constants.TRADER_ICON_PATH, trade_info, font_size)
-                        section_added = True
-
-            elif section_id == "crafting":
-                if crafting_info:
-                    OverlayRenderer._add_requirement_section(container_layout, "CRAFTING", Constants.CRAFT_ICON_PATH, crafting_info, font_size)
-                    section_added = True
-            
-            elif section_id == "hideout":
-                # Filter completed
-                filtered_h = [r for r in hideout_reqs if not r[2] or show_completed_hideout]
-                if filtered_h:
-                    OverlayRenderer._add_requirement_section(container_layout, "HIDEOUT REQUIREMENTS", Constants.HIDEOUT_ICON_PATH, filtered_h, font_size)
-                    section_added = True
-                
-            elif section_id == "project":
-                # Filter completed
-                filtered_p = [r for r in project_reqs if not r[2] or show_completed_project]
-                if filtered_p:
-                    OverlayRenderer._add_requirement_section(container_layout, "PROJECT REQUESTS", Constants.PROJECT_ICON_PATH, filtered_p, font_size)
-                    section_added = True
-            
-            elif section_id == "recycle" and item_data.get('recyclesInto'):
-                recycles = item_data['recyclesInto']
-                content_widgets = []
-                if isinstance(recycles, dict):
-                    for iid, qty in recycles.items():
-                        iname = data_manager.get_localized_name(iid, lang_code)
-                        # BIG CARD LOGIC
-                        # Using #4CBF87 (Arc Green-ish) for recycle accent if we want specific, or keep #ABB2BF
-                        # User said "keep our current color". Current title color is #ABB2BF.
-                        # Let's bump it slightly to #61AFEF (Blue) or #98C379 (Green) for better visibility?
-                        # Actually, let's Stick to the requested "current color" but maybe use the item rarity? 
-                        # Or just the section color passed in.
-                        card_w = OverlayRenderer._create_item_card(iid, iname, qty, font_size, data_manager, "#61AFEF") 
-                        content_widgets.append(card_w)
-                
-                if content_widgets:
-                    OverlayRenderer._add_glass_section(container_layout, Constants.RECYCLE_ICON_PATH, "RECYCLES INTO", "#ABB2BF", font_size-1, custom_widgets=content_widgets)
-                    section_added = True
-
-            elif section_id == "salvage" and item_data.get('salvagesInto'):
-                salvages = item_data['salvagesInto']
-                content_widgets = []
-                if isinstance(salvages, dict):
-                    for iid, qty in salvages.items():
-                        iname = data_manager.get_localized_name(iid, lang_code)
-                        # Reuse Item Card Logic
-                        # accent_color="#E06C75" (Red/Orangeish for salvage?) or "#D19A66" (Orange)
-                        # Let's use a distinct color, maybe Orange for Salvage vs Blue for Recycle
-                        card_w = OverlayRenderer._create_item_card(iid, iname, qty, font_size, data_manager, "#D19A66") 
-                        content_widgets.append(card_w)
-                
-                if content_widgets:
-                    OverlayRenderer._add_glass_section(container_layout, Constants.SALVAGE_ICON_PATH, "SALVAGES INTO", "#D19A66", font_size-1, custom_widgets=content_widgets)
-                    section_added = True
-
-            elif section_id == "quest" and quest_reqs:
-                OverlayRenderer._add_requirement_section(container_layout, "QUEST REQUIREMENTS", Constants.QUEST_ICON_PATH, quest_reqs, font_size, is_quest=True)
-                section_added = True
-
-
-                    
-            if section_added:
-                OverlayRenderer._add_separator(container_layout)
+        return header
 
     @staticmethod
-    def _add_separator(layout):
+    def _make_separator():
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
         line.setFrameShadow(QFrame.Shadow.Plain)
         line.setStyleSheet("background-color: rgba(255, 255, 255, 0.5); max-height: 1px; margin: 2px 0px;")
-        layout.addWidget(line)
+        return line
+
+    @staticmethod
+    def _add_separator(layout):
+        layout.addWidget(OverlayRenderer._make_separator())
+
+    @staticmethod
+    def _make_item_card_section(id_qty_map, icon_path, title, title_color, accent_color, font_size, data_manager, lang_code):
+        content_widgets = []
+        for iid, qty in id_qty_map.items():
+            iname = data_manager.get_localized_name(iid, lang_code)
+            content_widgets.append(OverlayRenderer._create_item_card(iid, iname, qty, font_size, data_manager, accent_color))
+        return OverlayRenderer._make_glass_section(icon_path, title, title_color, font_size-1, custom_widgets=content_widgets)
 
     @staticmethod
     def _create_item_card(item_id, name, qty, font_size, data_manager, accent_color="#ABB2BF"):
@@ -266,16 +304,10 @@ class OverlayRenderer:
         layout.addWidget(bar)
         
         # Icon
-        icon_path = os.path.join(Constants.DATA_DIR, "images", "items", f"{item_id}.png")
-        if not os.path.exists(icon_path):
-             item = data_manager.id_to_item_map.get(item_id)
-             if item and item.get('imageFilename'):
-                 icon_path = os.path.join(Constants.DATA_DIR, "images", "items", item.get('imageFilename'))
-
         icon_lbl = QLabel()
         icon_lbl.setFixedSize(32, 32) # Big Icon
-        if os.path.exists(icon_path):
-            pix = QPixmap(icon_path).scaled(32, 32, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        pix = get_icon_cache().item_pixmap(item_id, 32, data_manager)
+        if pix is not None:
             icon_lbl.setPixmap(pix)
         else:
             icon_lbl.setText("?")
@@ -299,7 +331,7 @@ class OverlayRenderer:
         return container
 
     @staticmethod
-    def _add_glass_section(parent_layout, icon_path, title, title_color, font_size, lines=None, custom_widgets=None, is_italic=False, bold_title=False):
+    def _make_glass_section(icon_path, title, title_color, font_size, lines=None, custom_widgets=None, is_italic=False, bold_title=False):
         frame = QFrame()
         frame.setStyleSheet("background: transparent; border: none; margin: 0px;")
         layout = QVBoxLayout(frame)
@@ -309,9 +341,10 @@ class OverlayRenderer:
         title_row = QHBoxLayout()
         title_row.setSpacing(8)
         
-        if icon_path and os.path.exists(icon_path):
+        icon_pix = get_icon_cache().path_pixmap(icon_path, 16)
+        if icon_pix is not None:
             ic = QLabel()
-            ic.setPixmap(QPixmap(icon_path).scaled(16, 16, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            ic.setPixmap(icon_pix)
             title_row.addWidget(ic)
             
         title_lbl = QLabel(title)
@@ -332,10 +365,10 @@ class OverlayRenderer:
             for w in custom_widgets:
                 layout.addWidget(w)
                 
-        parent_layout.addWidget(frame)
+        return frame
 
     @staticmethod
-    def _add_requirement_section(parent_layout, header_text, icon_path, req_list, font_size, is_quest=False):
+    def _make_requirement_section(header_text, icon_path, req_list, font_size, is_quest=False):
         frame = QFrame()
         frame.setStyleSheet("background: transparent; border: none; margin-top: 2px;")
         layout = QVBoxLayout(frame)
@@ -343,8 +376,9 @@ class OverlayRenderer:
         layout.setSpacing(2)
         
         h_row = QHBoxLayout()
-        if icon_path and os.path.exists(icon_path):
-            ic = QLabel(); ic.setPixmap(QPixmap(icon_path).scaled(18, 18))
+        icon_pix = get_icon_cache().path_pixmap(icon_path, 18)
+        if icon_pix is not None:
+            ic = QLabel(); ic.setPixmap(icon_pix)
             h_row.addWidget(ic)
         h_lbl = QLabel(header_text)
         h_lbl.setStyleSheet("color: rgba(255, 255, 255, 0.4); font-weight: bold; font-size: 8pt; letter-spacing: 1px;")
@@ -369,7 +403,7 @@ class OverlayRenderer:
             lbl.setStyleSheet(style)
             layout.addWidget(lbl)
             
-        parent_layout.addWidget(frame)
+        return frame
 
 
 class BaseOverlay(QWidget):
@@ -423,15 +457,35 @@ class BaseOverlay(QWidget):
         self.duration_timer.timeout.connect(self.close)
         self.target_duration = duration_ms
 
-        if enable_distance_close:
-            self.mouse_monitor_timer = QTimer(self)
-            self.mouse_monitor_timer.timeout.connect(self.check_mouse_distance)
-            self.mouse_monitor_timer.start(100)
+        self.mouse_monitor_timer = None
+        self.set_distance_close(enable_distance_close)
 
         self.target_opacity = opacity
         self.close_threshold = close_threshold
 
+    def set_distance_close(self, enabled):
+        """Enables/disables the 'leash' that closes the overlay when the mouse moves away."""
+        if enabled and self.mouse_monitor_timer is None:
+            self.mouse_monitor_timer = QTimer(self); self.mouse_monitor_timer.setInterval(100)
+            self.mouse_monitor_timer.timeout.connect(self.check_mouse_distance)
+            if self.isVisible(): self.mouse_monitor_timer.start()
+        elif not enabled and self.mouse_monitor_timer is not None:
+            self.mouse_monitor_timer.stop(); self.mouse_monitor_timer.deleteLater()
+            self.mouse_monitor_timer = None
+
+    # The leash only polls while the overlay is on screen (the pooled item overlay is hidden, not destroyed, between scans)
+    def showEvent(self, event):
+        if self.mouse_monitor_timer is not None: self.mouse_monitor_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        if self.mouse_monitor_timer is not None: self.mouse_monitor_timer.stop()
+        super().hideEvent(event)
+
     def show_animated(self, start_pos, end_pos):
+        # A reused overlay may still be mid-animation from its previous showing
+        for anim in (getattr(self, 'fade_anim', None), getattr(self, 'pos_anim', None)):
+            if anim is not None: anim.stop()
         self.move(start_pos)
         self.show()
         
@@ -478,6 +532,7 @@ class BaseOverlay(QWidget):
         self.resize(self.container.sizeHint())
 
     def check_mouse_distance(self):
+        if not self.isVisible(): return
         mouse_pos = QCursor.pos()
         rect = self.frameGeometry()
 
@@ -534,32 +589,55 @@ class ItemOverlay(BaseOverlay):
         min_w = max(340, font_size * 25)
         max_w = max(450, font_size * 35)
 
-        offset_x = user_settings.getint('ItemOverlay', 'offset_x', fallback=0)
-        offset_y = user_settings.getint('ItemOverlay', 'offset_y', fallback=0)
-        anchor_mode = user_settings.get('ItemOverlay', 'anchor_mode', fallback="Mouse")
-        opacity_val = user_settings.getint('ItemOverlay', 'opacity', fallback=98) / 100.0
-
-        # Auto-disable leash if custom offsets are used OR if anchor is not Mouse
-        enable_leash = (offset_x == 0 and offset_y == 0 and anchor_mode == "Mouse")
-
-        super().__init__(duration, min_width=min_w, max_width=max_w, opacity=opacity_val, enable_distance_close=enable_leash)
+        super().__init__(duration, min_width=min_w, max_width=max_w, enable_distance_close=False)
 
         # Storage
-        self.item_data = item_data
         self.user_settings = user_settings
-        self.blueprint_required = blueprint_required
-        self.hideout_reqs = hideout_reqs
-        self.project_reqs = project_reqs
-        self.trade_info = trade_info
         self.data_manager = data_manager
-        self.user_note = user_note
         self.lang_code = lang_code
+        self._blocks = {} # key -> (signature, widget), reused across refreshes
+        self.apply_settings()
+        self.set_item(item_data, blueprint_required, hideout_reqs, project_reqs, trade_info, user_note, stash_count, is_collected_blueprint, is_active_quest_item, quest_reqs)
+
+    @classmethod
+    def create_pooled(cls, user_settings, data_manager, lang_code="en"):
+        """
+        Builds the reusable overlay hidden at startup: the native window, style sheet and
+        drop-shadow are created once, so showing a scan result is only a content swap,
+        a move and the fade-in.
+        """
+        overlay = cls({}, user_settings, False, [], [], [], data_manager, lang_code=lang_code)
+        overlay.ensurePolished(); overlay.container.ensurePolished()
+        overlay.winId() # Force native window creation while hidden
+        return overlay
+
+    def apply_settings(self):
+        """(Re-)reads duration, opacity and leash settings. Called before every showing of a pooled overlay."""
+        self.target_duration = self.user_settings.getfloat('ItemOverlay', 'duration_seconds', fallback=3.0) * 1000
+        self.target_opacity = self.user_settings.getint('ItemOverlay', 'opacity', fallback=98) / 100.0
+        offset_x = self.user_settings.getint('ItemOverlay', 'offset_x', fallback=0)
+        offset_y = self.user_settings.getint('ItemOverlay', 'offset_y', fallback=0)
+        anchor_mode = self.user_settings.get('ItemOverlay', 'anchor_mode', fallback="Mouse")
+        # Auto-disable leash if custom offsets are used OR if anchor is not Mouse
+        self.set_distance_close(offset_x == 0 and offset_y == 0 and anchor_mode == "Mouse")
+
+    def set_item(self, item_data, blueprint_required=False, hideout_reqs=None, project_reqs=None, trade_info=None, user_note="", stash_count=0, is_collected_blueprint=False, is_active_quest_item=False, quest_reqs=None, data_manager=None, lang_code=None, timings=None):
+        """Swaps the displayed item in place. Only sections whose inputs changed are rebuilt."""
+        if data_manager is not None and data_manager is not self.data_manager:
+            self.data_manager = data_manager; self.clear_blocks()
+        if lang_code is not None: self.lang_code = lang_code
+        self.item_data = item_data or {}
+        self.blueprint_required = blueprint_required
+        self.hideout_reqs = hideout_reqs or []
+        self.project_reqs = project_reqs or []
+        self.trade_info = trade_info or []
+        self.user_note = user_note
         self.stash_count = stash_count
         self.is_collected_blueprint = is_collected_blueprint
         self.is_active_quest_item = is_active_quest_item
         self.quest_reqs = quest_reqs or []
 
-        self.refresh_ui()
+        self.refresh_ui(timings)
 
     def toggle_track(self):
         item_id = self.item_data.get('id')
@@ -567,29 +645,30 @@ class ItemOverlay(BaseOverlay):
         self.data_manager.toggle_item_track(item_id)
         self.refresh_ui()
 
-    def refresh_ui(self):
-        # 1. Clear existing layout
-        while self.container_layout.count():
-            item = self.container_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-            elif item.layout():
-                while item.layout().count():
-                    si = item.layout().takeAt(0)
-                    if si.widget(): si.widget().deleteLater()
+    def clear_blocks(self):
+        while self.container_layout.count(): self.container_layout.takeAt(0)
+        for _, widget in self._blocks.values(): widget.deleteLater()
+        self._blocks.clear()
 
-        # 2. Re-read settings
+    def refresh_ui(self, timings=None):
+        """Rebuilds changed blocks and re-lays out. If a timings dict is given, 'construct' and 'layout' seconds are stored in it."""
+        # 1. Re-read settings
         font_size = self.user_settings.getint('ItemOverlay', 'font_size', fallback=12)
         min_w = max(340, font_size * 25)
         max_w = max(450, font_size * 35)
         self.container.setMinimumWidth(min_w)
         self.container.setMaximumWidth(max_w)
 
-        # 3. Apply Border Color
+        if not self.item_data:
+            self.clear_blocks(); return
+
+        # 2. Apply Border Color
         rarity = self.item_data.get('rarity', 'Common')
         rarity_color = Constants.RARITY_COLORS.get(rarity, "#FFFFFF")
-        self.set_border_color(rarity_color)
+        if getattr(self, '_border_color', None) != rarity_color:
+            self.set_border_color(rarity_color); self._border_color = rarity_color
         
-        # 4. Build Context
+        # 3. Build Context
         data_context = {
             'item_data': self.item_data,
             'hideout_reqs': self.hideout_reqs,
@@ -603,10 +682,30 @@ class ItemOverlay(BaseOverlay):
             'toggle_track_callback': self.toggle_track
         }
 
-        # 5. Delegate to Renderer
-        OverlayRenderer.populate(self.container_layout, data_context, self.user_settings, self.data_manager, self.lang_code)
+        # 4. Diff against the previous content: reuse unchanged blocks, rebuild the rest
+        t_start = time.perf_counter()
+        blocks = OverlayRenderer.build_blocks(data_context, self.user_settings, self.data_manager, self.lang_code)
+        while self.container_layout.count(): self.container_layout.takeAt(0) # Detach only, widgets stay alive
+
+        wanted = set()
+        for key, signature, build in blocks:
+            wanted.add(key)
+            cached = self._blocks.get(key)
+            if cached and cached[0] == signature: widget = cached[1]
+            else:
+                if cached: cached[1].deleteLater()
+                widget = build(); self._blocks[key] = (signature, widget)
+            self.container_layout.addWidget(widget)
+            widget.show()
+
+        for key in [k for k in self._blocks if k not in wanted]:
+            self._blocks.pop(key)[1].deleteLater()
 
+        t_built = time.perf_counter()
+        self.container_layout.activate()
         self.adjustSize()
+        if timings is not None:
+            timings['construct'] = t_built - t_start; timings['layout'] = time.perf_counter() - t_built
 
     def show_smart(self, x=None, y=None):
         from PyQt6.QtGui import QGuiApplication
@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTa
 from PyQt6.QtCore import pyqtSignal, Qt
 from PyQt6.QtGui import QIcon, QFont
 import os
+import time
 from .constants import Constants
 from .hideout_manager_window import HideoutManagerWindow
 from .quest_manager_window import QuestManagerWindow
@@ -12,6 +13,26 @@ from .settings_window import SettingsWindow
 from .ui_components import set_dark_title_bar, ensure_window_within_screen
 import random
 
+
+class _LazyTab(QWidget):
+    """Tab page that shows a placeholder until first activated, then builds the real tab widget inside itself."""
+    def __init__(self, title, factory):
+        super().__init__()
+        self.title = title; self.factory = factory; self.widget = None
+        self._layout = QVBoxLayout(self); self._layout.setContentsMargins(0, 0, 0, 0)
+        self._placeholder = QLabel("Loading..."); self._placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._layout.addWidget(self._placeholder)
+
+    def build(self):
+        if self.widget is None:
+            t0 = time.perf_counter()
+            self.widget = self.factory()
+            self._layout.removeWidget(self._placeholder); self._placeholder.deleteLater(); self._placeholder = None
+            self._layout.addWidget(self.widget)
+            print(f"[INFO] Progress Hub: built {self.title} tab in {(time.perf_counter() - t0) * 1000:.0f}ms")
+        return self.widget
+
+
 class ProgressHubWindow(QWidget):
     # This signal bubbles up auto-saves from children tabs to the main app
     progress_saved = pyqtSignal()
@@ -59,28 +80,23 @@ class ProgressHubWindow(QWidget):
         main_layout.addWidget(self.tabs)
 
         # Initialize Tabs
-        self.hideout_tab = HideoutManagerWindow(self.data_manager.hideout_data, self.data_manager.user_progress, self.data_manager, Constants.RARITY_COLORS, lang_code=self.lang_code)
-        self.quest_tab = QuestManagerWindow(self.data_manager, self.data_manager.user_progress, lang_code=self.lang_code)
-        self.project_tab = ProjectManagerWindow(self.data_manager.project_data, self.data_manager.user_progress, self.data_manager, Constants.RARITY_COLORS, lang_code=self.lang_code)
-        self.item_db_tab = ItemDatabaseWindow(self.data_manager, lang_code=self.lang_code)
+        # Data tabs are built on first activation (see _LazyTab); until then their attribute is None.
+        # Settings is built right away: the app connects to its signals and reports update status through it.
+        self.hideout_tab = self.quest_tab = self.project_tab = self.item_db_tab = None
         self.settings_tab = SettingsWindow(self.config_manager, data_manager=self.data_manager, on_save_callback=settings_callback, app_version=app_version, update_callback=app_update_checker_func)
 
         # Add Tabs
-        self.tabs.addTab(self.quest_tab, "Quests")
-        self.tabs.addTab(self.hideout_tab, "Hideout")
-        self.tabs.addTab(self.project_tab, "Projects")
-        self.tabs.addTab(self.item_db_tab, "Item Database")
+        self.tabs.addTab(_LazyTab("Quests", lambda: self._init_tab('quest_tab', QuestManagerWindow(self.data_manager, self.data_manager.user_progress, lang_code=self.lang_code))), "Quests")
+        self.tabs.addTab(_LazyTab("Hideout", lambda: self._init_tab('hideout_tab', HideoutManagerWindow(self.data_manager.hideout_data, self.data_manager.user_progress, self.data_manager, Constants.RARITY_COLORS, lang_code=self.lang_code))), "Hideout")
+        self.tabs.addTab(_LazyTab("Projects", lambda: self._init_tab('project_tab', ProjectManagerWindow(self.data_manager.project_data, self.data_manager.user_progress, self.data_manager, Constants.RARITY_COLORS, lang_code=self.lang_code))), "Projects")
+        self.tabs.addTab(_LazyTab("Item Database", lambda: self._init_tab('item_db_tab', ItemDatabaseWindow(self.data_manager, lang_code=self.lang_code))), "Item Database")
         self.tabs.addTab(self.settings_tab, "Settings")
         
         # Connect signals
         self.settings_tab.data_restored.connect(self.on_data_restored)
 
         # --- CONNECT SIGNALS FOR AUTO-SAVE ---
-        # When any tab triggers an auto-save, we emit our own signal
-        self.hideout_tab.progress_saved.connect(self.progress_saved.emit)
-        self.quest_tab.progress_saved.connect(self.progress_saved.emit)
-        self.project_tab.progress_saved.connect(self.progress_saved.emit)
-        self.item_db_tab.progress_saved.connect(self.progress_saved.emit)
+        # When any tab triggers an auto-save, we emit our own signal (data tabs: in _init_tab)
         self.settings_tab.progress_saved.connect(self.progress_saved.emit)
 
         bottom_layout = QHBoxLayout(); main_layout.addLayout(bottom_layout)
@@ -89,26 +105,49 @@ class ProgressHubWindow(QWidget):
         self.close_btn = QPushButton("Close"); self.close_btn.clicked.connect(self.close)
         bottom_layout.addWidget(self.close_btn)
 
+        self.tabs.currentChanged.connect(self._build_tab)
         self.tabs.currentChanged.connect(self.update_reset_button)
         self.update_reset_button(self.tabs.currentIndex())
         self.hide()
 
+    def _init_tab(self, attr, tab):
+        setattr(self, attr, tab)
+        tab.progress_saved.connect(self.progress_saved.emit)
+        return tab
+
+    def _build_tab(self, index):
+        page = self.tabs.widget(index)
+        if isinstance(page, _LazyTab): page.build()
+
+    def _page_widget(self, page):
+        """The real tab widget behind a tab page (None while a lazy tab is unbuilt)."""
+        return page.widget if isinstance(page, _LazyTab) else page
+
+    def _built_tabs(self):
+        return [tab for tab in (self.hideout_tab, self.quest_tab, self.project_tab, self.item_db_tab) if tab is not None]
+
+    def showEvent(self, event):
+        # currentChanged doesn't fire for the initial tab
+        index = self.tabs.currentIndex()
+        self._build_tab(index); self.update_reset_button(index)
+        super().showEvent(event)
+
     def on_data_restored(self):
-        """Called when data is restored from backup. Reloads all tabs."""
-        self.hideout_tab.reload_data()
-        self.quest_tab.reload_data()
-        self.project_tab.reload_data()
+        """Called when data is restored from backup. Reloads all tabs (unbuilt tabs read the restored data when built)."""
+        for tab in (self.hideout_tab, self.quest_tab, self.project_tab):
+            if tab is not None: tab.reload_data()
 
     def update_reset_button(self, index):
-        current_widget = self.tabs.widget(index)
-        if current_widget == self.hideout_tab: self.reset_btn.setText("Reset Hideout"); self.reset_btn.setVisible(True)
+        current_widget = self._page_widget(self.tabs.widget(index))
+        if current_widget is None: self.reset_btn.setVisible(False)
+        elif current_widget == self.hideout_tab: self.reset_btn.setText("Reset Hideout"); self.reset_btn.setVisible(True)
         elif current_widget == self.quest_tab: self.reset_btn.setText("Reset Quests"); self.reset_btn.setVisible(True)
         elif current_widget == self.project_tab: self.reset_btn.setText("Reset Projects"); self.reset_btn.setVisible(True)
         elif current_widget == self.item_db_tab: self.reset_btn.setText("Reset Item Data"); self.reset_btn.setVisible(True)
         else: self.reset_btn.setVisible(False)
 
     def handle_reset(self):
-        current_widget = self.tabs.currentWidget()
+        current_widget = self._page_widget(self.tabs.currentWidget())
         if hasattr(current_widget, 'confirm_reset'):
             current_widget.confirm_reset()
         elif hasattr(current_widget, 'reset_state'):
@@ -120,11 +159,11 @@ class ProgressHubWindow(QWidget):
         self.config_manager.save()
 
         # Force a final save on all tabs before closing
-        for tab in [self.hideout_tab, self.quest_tab, self.project_tab, self.item_db_tab]:
+        for tab in self._built_tabs():
             if hasattr(tab, 'save_state'): tab.save_state()
         super().closeEvent(event)
 
 
     def cleanup(self):
-        if hasattr(self, 'item_db_tab'):
+        if self.item_db_tab is not None:
             self.item_db_tab.cleanup()
\ No newline at end of file
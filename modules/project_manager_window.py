@@ -113,6 +113,7 @@ class ProjectManagerWindow(BasePage):
         self.rarity_colors = rarity_colors
         self.project_data = project_data
         self.lang_code = lang_code 
+        self.names = data_manager.localized(lang_code)  # Precomputed display strings
 
         # self.user_progress is now accessed directly via self.data_manager.user_progress
         
@@ -179,7 +180,7 @@ class ProjectManagerWindow(BasePage):
             p_id = project.get('id')
             if not p_id: continue
             
-            p_name = self.data_manager.get_localized_name(project, self.lang_code)
+            p_name = self.names.project_names[p_id]
             
             # Create a tab for this project
             tab_widget = QWidget()
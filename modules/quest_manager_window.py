@@ -20,8 +20,13 @@ class QuestManagerWindow(BasePage):
         
         all_quest_ids = [q.get('id') for q in self.all_quests_data]
         self.quest_order = self.data_manager.user_progress.get('quest_order', all_quest_ids)
+        self._reindex_order()
         for q_id in all_quest_ids:
-            if q_id not in self.quest_order: self.quest_order.append(q_id)
+            if q_id not in self._order_pos: self._order_pos[q_id] = len(self.quest_order); self.quest_order.append(q_id)
+
+        # Diff-based refresh: what each quest frame currently shows, and the frame order in the layout
+        self._rendered = {}
+        self._layout_order = []
         
         # Header Controls
         # Search
@@ -73,6 +78,8 @@ class QuestManagerWindow(BasePage):
             title.setStyleSheet("font-weight: bold; font-size: 16px; border: none; color: #E5C07B;")
             title_vbox.addWidget(title)
             
+            quest_maps = quest.get('map') or []
+            if isinstance(quest_maps, str): quest_maps = [quest_maps]
             map_names = self.data_manager.get_quest_map_names(quest, lang_code=self.lang_code)
             if map_names:
                 map_str = ", ".join(map_names)
@@ -108,68 +115,88 @@ class QuestManagerWindow(BasePage):
                 layout.addLayout(obj_layout)
                 obj_widgets.append({'text': obj_text, 'checkbox': check_box, 'label': text_label})
                 
-            self.quest_widgets[q_id] = { 'frame': frame, 'title': title, 'track_chk': track_chk, 'done_btn': done_btn, 'active_btn': active_btn, 'objs': obj_widgets, 'btn_up': btn_up, 'btn_down': btn_down }
+            self.quest_widgets[q_id] = { 'frame': frame, 'title': title, 'track_chk': track_chk, 'done_btn': done_btn, 'active_btn': active_btn, 'objs': obj_widgets, 'btn_up': btn_up, 'btn_down': btn_down,
+                                     'search_name': quest.get('name', '').lower(), 'maps': quest_maps }
             done_btn.clicked.connect(lambda _, qid=q_id: self.toggle_done(qid))
             active_btn.clicked.connect(lambda _, qid=q_id: self.toggle_active(qid))
 
+    # Map filter entries -> quest map ids
+    MAP_FILTER_IDS = {
+        "Dam Battlegrounds": ["dam_battlegrounds"],
+        "Buried City": ["buried_city"],
+        "Spaceport": ["the_spaceport"],
+        "Blue Gate": ["the_blue_gate"],
+        "Stella Montis": ["stella_montis_upper", "stella_montis_lower", "stella_montis"]
+    }
+
+    def _reindex_order(self):
+        """Rebuilds the quest id -> custom order position map (kept in sync by move_quest)."""
+        self._order_pos = {}
+        for i, q_id in enumerate(self.quest_order): self._order_pos.setdefault(q_id, i)
+
     def rebuild_and_refresh_ui(self, _=None):
+        quests_prog = self.data_manager.user_progress['quests']
         for qid, widgets in self.quest_widgets.items():
-            prog = self.data_manager.user_progress['quests'].setdefault(qid, {})
+            prog = quests_prog.setdefault(qid, {})
             prog['is_tracked'] = widgets['track_chk'].isChecked()
             prog['objectives_completed'] = [obj['text'] for obj in widgets['objs'] if obj['checkbox'].isChecked()]
             
+        order_pos = self._order_pos
         def sort_key(q_id):
-            prog = self.data_manager.user_progress['quests'].get(q_id, {})
-            is_tracked = prog.get('is_tracked', False)
-            is_completed = prog.get('quest_completed', False)
-            order_index = self.quest_order.index(q_id) if q_id in self.quest_order else 999
-            return (not is_tracked, order_index, is_completed)
+            prog = quests_prog.get(q_id, {})
+            return (not prog.get('is_tracked', False), order_pos.get(q_id, 999), prog.get('quest_completed', False))
             
         sorted_quest_ids = sorted(self.quest_widgets.keys(), key=sort_key)
         show_completed = self.chk_show_completed.isChecked()
         
         search_text = self.search_input.text().lower()
         selected_map = self.map_filter.currentText()
+        target_maps = self.MAP_FILTER_IDS.get(selected_map, [])
+        active_id = self.data_manager.get_active_quest_id()
         
-        map_filter_map = {
-            "Dam Battlegrounds": ["dam_battlegrounds"],
-            "Buried City": ["buried_city"],
-            "Spaceport": ["the_spaceport"],
-            "Blue Gate": ["the_blue_gate"],
-            "Stella Montis": ["stella_montis_upper", "stella_montis_lower", "stella_montis"]
-        }
-        
-        visible_tracked_ids = []
-        
-        for i, q_id in enumerate(sorted_quest_ids):
+        # State per quest: [visible, complete, tracked, active, completed objectives, up enabled, down enabled]
+        states = {}
+        for q_id in sorted_quest_ids:
             widgets = self.quest_widgets[q_id]
-            prog = self.data_manager.user_progress['quests'].get(q_id, {})
+            prog = quests_prog.get(q_id, {})
             is_complete = prog.get('quest_completed', False)
-            is_tracked = prog.get('is_tracked', False)
-            
-            # Filter Check
-            quest_data = self.quest_data_map.get(q_id)
-            quest_name = quest_data.get('name', '').lower() if quest_data else ''
-            quest_maps = quest_data.get('map', []) if quest_data else []
-            if isinstance(quest_maps, str): quest_maps = [quest_maps]
-            
-            matches_search = search_text in quest_name
-            matches_map = True
-            if selected_map != "ALL":
-                target_maps = map_filter_map.get(selected_map, [])
-                matches_map = any(m in target_maps for m in quest_maps)
-            
-            should_show = (not is_complete or show_completed) and matches_search and matches_map
-            
-            self.content_layout.insertWidget(i, widgets['frame'])
-            widgets['frame'].setVisible(should_show)
-            
-            if should_show and is_tracked:
-                visible_tracked_ids.append(q_id)
-                
+            matches_map = selected_map == "ALL" or any(m in target_maps for m in widgets['maps'])
+            should_show = (not is_complete or show_completed) and search_text in widgets['search_name'] and matches_map
+            states[q_id] = [should_show, is_complete, prog.get('is_tracked', False), q_id == active_id, frozenset(prog.get('objectives_completed', [])), True, True]
+
+        visible_tracked_ids = [q_id for q_id in sorted_quest_ids if states[q_id][0] and states[q_id][2]]
+        if visible_tracked_ids:
+            states[visible_tracked_ids[0]][5] = False; states[visible_tracked_ids[-1]][6] = False
+
+        self._sync_layout_order(sorted_quest_ids)
+        for q_id in sorted_quest_ids:
+            state = tuple(states[q_id]); prev = self._rendered.get(q_id)
+            if state != prev:
+                self._render_quest(q_id, state, prev); self._rendered[q_id] = state
+
+    def _sync_layout_order(self, ordered_ids):
+        """Moves only the frames that are out of place."""
+        if ordered_ids == self._layout_order: return
+        for i, q_id in enumerate(ordered_ids):
+            frame = self.quest_widgets[q_id]['frame']
+            item = self.content_layout.itemAt(i)
+            if item is None or item.widget() is not frame: self.content_layout.insertWidget(i, frame)
+        self._layout_order = list(ordered_ids)
+
+    def _render_quest(self, q_id, state, prev):
+        """Applies a quest's state to its widgets, touching only the parts that changed since prev (None: everything)."""
+        visible, is_complete, is_tracked, is_active, completed_objs, up_enabled, down_enabled = state
+        changed = lambda i: prev is None or prev[i] != state[i]
+        widgets = self.quest_widgets[q_id]
+
+        if changed(0): widgets['frame'].setVisible(visible)
+        if changed(2):
             widgets['btn_up'].setVisible(is_tracked)
             widgets['btn_down'].setVisible(is_tracked)
-                
+        if changed(5): widgets['btn_up'].setEnabled(up_enabled)
+        if changed(6): widgets['btn_down'].setEnabled(down_enabled)
+
+        if changed(1):
             done_btn = widgets['done_btn']
             if is_complete:
                 widgets['title'].setStyleSheet("color: #5C6370; font-weight: bold; font-size: 16px; border: none; text-decoration: line-through;")
@@ -180,16 +207,15 @@ class QuestManagerWindow(BasePage):
                 done_btn.setText("Done"); done_btn.setObjectName("action_button_green")
                 widgets['track_chk'].setVisible(True)
             done_btn.style().polish(done_btn)
-            
-            active_id = self.data_manager.get_active_quest_id()
-            is_active = (q_id == active_id)
-            
-            completed_objs = prog.get('objectives_completed', [])
+            widgets['active_btn'].setVisible(not is_complete)
+
+        if changed(4):
             for obj_widget in widgets['objs']:
                 is_obj_complete = obj_widget['text'] in completed_objs
                 if obj_widget['checkbox'].isChecked() != is_obj_complete: obj_widget['checkbox'].setChecked(is_obj_complete)
                 obj_widget['label'].setStyleSheet("color: #5C6370; text-decoration: line-through;" if is_obj_complete else "color: #E0E6ED;")
 
+        if changed(3):
             active_btn = widgets['active_btn']
             if is_active:
                 widgets['frame'].setStyleSheet("#QuestFrame { background-color: #1A1F2B; border: 2px solid #FFD700; border-top: 4px solid #FFD700; border-radius: 5px; margin-top: 8px; }")
@@ -197,12 +223,6 @@ class QuestManagerWindow(BasePage):
             else:
                 widgets['frame'].setStyleSheet("#QuestFrame { background-color: #1A1F2B; border: 1px solid #333; border-top: 3px solid #4CAF50; border-radius: 5px; margin-top: 8px; }")
                 active_btn.setText("Set Active"); active_btn.setStyleSheet("")
-            active_btn.setVisible(not is_complete)
-
-        for q_id in visible_tracked_ids:
-            widgets = self.quest_widgets[q_id]
-            widgets['btn_up'].setEnabled(not (q_id == visible_tracked_ids[0]))
-            widgets['btn_down'].setEnabled(not (q_id == visible_tracked_ids[-1]))
 
     def move_quest(self, quest_id, direction):
         tracked_quests = [q for q in self.quest_order if self.data_manager.user_progress['quests'].get(q, {}).get('is_tracked', False)]
@@ -212,8 +232,9 @@ class QuestManagerWindow(BasePage):
         new_tracked_index = current_tracked_index + direction
         if 0 <= new_tracked_index < len(tracked_quests):
             target_quest_id = tracked_quests[new_tracked_index]
-            idx1 = self.quest_order.index(quest_id); idx2 = self.quest_order.index(target_quest_id)
+            idx1 = self._order_pos[quest_id]; idx2 = self._order_pos[target_quest_id]
             self.quest_order[idx1], self.quest_order[idx2] = self.quest_order[idx2], self.quest_order[idx1]
+            self._order_pos[quest_id], self._order_pos[target_quest_id] = idx2, idx1
             self.rebuild_and_refresh_ui(); self.start_save_timer()
 
     def toggle_active(self, q_id):
@@ -247,6 +268,7 @@ class QuestManagerWindow(BasePage):
     def reset_state(self):
         self.data_manager.user_progress['quests'] = {}
         self.quest_order = [q.get('id') for q in self.all_quests_data]
+        self._reindex_order()
         self.data_manager.user_progress['quest_order'] = self.quest_order
         for qid, widgets in self.quest_widgets.items():
             widgets['track_chk'].setChecked(False)
@@ -270,8 +292,9 @@ class QuestManagerWindow(BasePage):
         all_ids = [q.get('id') for q in self.all_quests_data]
         if not self.quest_order: 
             self.quest_order = all_ids
+        self._reindex_order()
         for q_id in all_ids:
-            if q_id not in self.quest_order: self.quest_order.append(q_id)
+            if q_id not in self._order_pos: self._order_pos[q_id] = len(self.quest_order); self.quest_order.append(q_id)
             
         # Update widgets WITHOUT triggering the write-back in rebuild_and_refresh_ui
         # We update the widgets to match the data, then call rebuild which will sync them back (no-op effectively)
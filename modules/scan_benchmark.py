@@ -0,0 +1,152 @@
+"""
+Offline scan benchmark: replays saved screenshots through the full ItemScanner pipeline.
+
+Each image is fed through a ReplayCaptureSource (the screenshot acts as the desktop, the cursor
+sits at its centre unless the manifest says otherwise), so capture, tooltip detection, preprocessing,
+OCR, matching and data aggregation all run exactly as in a live scan - on any platform, no Qt needed.
+
+Usage:
+    python -m modules.scan_benchmark [CORPUS_DIR] [--labels FILE] [--lang en] [--repeat 2] [--catalog-scale 10]
+                                     [--max-p95 MS] [--min-accuracy 0.9] [--output FILE]
+
+CORPUS_DIR defaults to the debug image folder (*_raw.png files written by "Save Debug Images").
+Labels come from a JSON {"file.png": "Item Name"} or CORPUS/manifest.json with
+{"entries": [{"file": ..., "name": ..., "cursor": [x, y], "scale": 1.0}]} (cursor/scale optional).
+--catalog-scale N pads the item list with synthetic distractor names to N times its size, to measure
+matching cost and accuracy against larger catalogs (compare the 'match' stage across runs).
+With --max-p95 / --min-accuracy the exit code is 1 when the run is slower / less accurate (CI gate).
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from types import SimpleNamespace
+
+from .constants import Constants
+from .data_manager import ItemDatabase, DataManager
+from .image_processor import ReplayCaptureSource
+from .scanner import ItemScanner
+from .ocr_vocabulary import ensure_ocr_vocabularies
+from .scan_stats import ScanSizeStats
+from .capture_geometry import CaptureGeometry
+from .scan_metrics import get_scan_metrics, percentiles
+from .tooltip_synth import inflate_catalog
+
+
+def load_manifest(corpus_dir, labels_path=None):
+    """{filename: {'name': ..., 'cursor': ..., 'scale': ...}} from a labels file or CORPUS/manifest.json."""
+    path = labels_path or os.path.join(corpus_dir, "manifest.json")
+    if not os.path.exists(path): return {}
+    with open(path, 'r', encoding='utf-8') as f: data = json.load(f)
+    if isinstance(data, dict) and 'entries' in data:
+        return {e['file']: e for e in data['entries'] if e.get('file')}
+    return {k: {'file': k, 'name': v} for k, v in data.items() if isinstance(v, str)}
+
+
+def list_corpus(corpus_dir, manifest):
+    if manifest: return sorted(f for f in manifest if os.path.exists(os.path.join(corpus_dir, f)))
+    files = sorted(f for f in os.listdir(corpus_dir) if f.lower().endswith('.png'))
+    raws = [f for f in files if f.endswith("_raw.png")]
+    return raws or files
+
+
+def make_scanner(lang="en", tesseract_path=None, mode="fixed", state_dir=None):
+    """An ItemScanner whose learned state (size wins, capture geometry) lives in state_dir, not the user's data folder."""
+    data_manager = DataManager(ItemDatabase().items)
+    scanner = ItemScanner(SimpleNamespace(tesseract_path=tesseract_path, once=False, debug=False), data_manager); ensure_ocr_vocabularies()
+    ocr_lang = next((tess for json_code, tess in Constants.LANGUAGES.values() if json_code == lang), 'eng')
+    scanner.update_settings(scanner.target_color, ocr_lang, lang, full_screen_mode=(mode == "full"), speculative_scan=(mode == "speculative"), adaptive_capture=False)
+    state_dir = state_dir or tempfile.mkdtemp(prefix="arc_scan_bench_")
+    scanner.size_stats = ScanSizeStats(os.path.join(state_dir, "scan_stats.json"))
+    scanner.capture_geometry = CaptureGeometry(os.path.join(state_dir, "capture_geometry.json"))
+    return scanner
+
+
+def run_benchmark(corpus_dir, manifest=None, lang="en", tesseract_path=None, mode="fixed", repeat=1, catalog_scale=1.0):
+    manifest = manifest or {}
+    files = list_corpus(corpus_dir, manifest)
+    if not files:
+        print(f"[WARN] No screenshots found in {corpus_dir}")
+        return None
+
+    scanner = make_scanner(lang, tesseract_path, mode)
+    distractors = inflate_catalog(scanner, catalog_scale)
+    metrics = get_scan_metrics(); metrics.clear()
+    labelled = [f for f in files if manifest.get(f, {}).get('name')]
+    results = {'meta': {'corpus': os.path.abspath(corpus_dir), 'images': len(files), 'labelled': len(labelled), 'lang': lang, 'mode': mode, 'repeat': repeat,
+                        'catalog_scale': catalog_scale, 'catalog_items': len(scanner._get_language_filtered_items()), 'distractors': distractors},
+               'passes': [], 'items': {f: [] for f in files}}
+
+    for run in range(repeat):
+        correct, found, wall = 0, 0, []
+        for filename in files:
+            entry = manifest.get(filename, {})
+            scanner.capture_source = ReplayCaptureSource.from_file(os.path.join(corpus_dir, filename), entry.get('cursor'), entry.get('scale', 1.0))
+            t0 = time.perf_counter(); result = scanner.scan_screen(); wall.append((time.perf_counter() - t0) * 1000)
+
+            item = result.get('item') if result else None
+            name = scanner.data_manager.get_localized_name(item, lang) if item else None
+            expected = entry.get('name')
+            if name: found += 1
+            if expected and name and name.lower() == expected.lower(): correct += 1
+            results['items'][filename].append({'name': name, 'expected': expected, 'ms': round(wall[-1], 2)})
+        results['passes'].append({'pass': run + 1, 'found': found, 'correct': correct, 'accuracy': (correct / len(labelled)) if labelled else None,
+                                  'wall_ms': percentiles(wall)})
+
+    results['summary'] = metrics.summary()
+    results['scans'] = metrics.snapshot()
+    scanner.close()
+    return results
+
+
+def print_report(results):
+    meta = results['meta']
+    print(f"\n=== Scan replay benchmark: {meta['images']} images ({meta['labelled']} labelled), lang={meta['lang']}, mode={meta['mode']}, "
+          f"catalog={meta['catalog_items']} items (x{meta['catalog_scale']:g}) ===")
+    for p in results['passes']:
+        acc = f"{p['accuracy']:.1%}" if p['accuracy'] is not None else "-"
+        print(f"pass {p['pass']}: found {p['found']}/{meta['images']}, accuracy {acc}, p50 {p['wall_ms']['p50']:.1f}ms, p95 {p['wall_ms']['p95']:.1f}ms")
+    print()
+    print(get_scan_metrics().format_table())
+
+    misses = [(f, r[0]) for f, r in results['items'].items() if r and r[0]['expected'] and (r[0]['name'] or '').lower() != r[0]['expected'].lower()]
+    if misses:
+        print(f"\n{len(misses)} wrong/missed image(s) in pass 1:")
+        for filename, r in misses[:15]: print(f"  {filename}: got {r['name']!r}, expected {r['expected']!r}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay saved screenshots through the scanner and report accuracy and stage latency.")
+    parser.add_argument('corpus', nargs='?', default=os.path.join(Constants.DATA_DIR, "debug_images"))
+    parser.add_argument('--labels', default=None, help="JSON {filename: item name} or manifest; defaults to CORPUS/manifest.json")
+    parser.add_argument('--lang', default="en", help="Data language code")
+    parser.add_argument('--mode', default="fixed", choices=("fixed", "speculative", "full"), help="Search strategy to replay")
+    parser.add_argument('--repeat', type=int, default=1, help="Passes over the corpus (later passes show OCR cache hits)")
+    parser.add_argument('--catalog-scale', type=float, default=1.0, help="Pad the item catalog with synthetic distractors to N times its size (1-100)")
+    parser.add_argument('--tesseract', default=None, help="Path to the tesseract executable")
+    parser.add_argument('--max-p95', type=float, default=None, help="Fail if the p95 total scan time exceeds this (ms)")
+    parser.add_argument('--min-accuracy', type=float, default=None, help="Fail if pass 1 accuracy is below this (0-1)")
+    parser.add_argument('--output', default=None, help="Write the full results as JSON")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.corpus):
+        print(f"[ERROR] Corpus directory not found: {args.corpus}"); return 1
+    results = run_benchmark(args.corpus, load_manifest(args.corpus, args.labels), args.lang, args.tesseract, args.mode, max(1, args.repeat), max(1.0, args.catalog_scale))
+    if results is None: return 1
+    print_report(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f: json.dump(results, f, indent=2)
+        print(f"\n[INFO] Results written to {args.output}")
+
+    status = 0
+    p95 = results['summary']['total']['p95']; accuracy = results['passes'][0]['accuracy']
+    if args.max_p95 is not None and p95 > args.max_p95:
+        print(f"[FAIL] p95 scan time {p95:.1f}ms exceeds {args.max_p95:.1f}ms"); status = 1
+    if args.min_accuracy is not None and accuracy is not None and accuracy < args.min_accuracy:
+        print(f"[FAIL] Accuracy {accuracy:.1%} below {args.min_accuracy:.1%}"); status = 1
+    return status
+
+
+if __name__ == '__main__': sys.exit(main())
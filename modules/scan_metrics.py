@@ -0,0 +1,116 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from .constants import Constants
+
+# Pipeline stages in display order
+STAGES = ("capture", "detect", "crop", "preprocess", "ocr", "match", "aggregate")
+
+
+class ScanTrace:
+    """
+    Timing spans of one scan_screen() call. Every attempt (learned area, 800px, 1200px) adds to the
+    same stages, so with parallel speculative attempts a stage holds their combined work, not wall time.
+    """
+    def __init__(self, mode=""):
+        self.started = time.time()
+        self.mode = mode
+        self.attempts = 0
+        self.stages = {}
+        self.flags = {'ocr_cache_hit': False}
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage):
+        t0 = time.perf_counter()
+        try: yield
+        finally: self.add(stage, (time.perf_counter() - t0) * 1000)
+
+    def add(self, stage, ms):
+        with self._lock: self.stages[stage] = self.stages.get(stage, 0.0) + ms
+
+    def flag(self, name, value=True):
+        with self._lock: self.flags[name] = value
+
+    def new_attempt(self):
+        with self._lock: self.attempts += 1
+
+    def to_dict(self, found):
+        with self._lock:
+            return {'time': datetime.fromtimestamp(self.started).isoformat(timespec='milliseconds'), 'mode': self.mode, 'found': bool(found),
+                    'attempts': self.attempts, 'total_ms': round((time.perf_counter() - self._t0) * 1000, 2),
+                    'stages': {k: round(v, 2) for k, v in self.stages.items()}, 'flags': dict(self.flags)}
+
+
+def timed(trace, stage):
+    """trace.span(stage), or a no-op when no trace is being recorded."""
+    return trace.span(stage) if trace is not None else nullcontext()
+
+
+def percentiles(values):
+    if not values: return {'count': 0, 'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+    ordered = sorted(values); n = len(ordered)
+    def pick(q): return round(ordered[min(n - 1, int(n * q))], 2)
+    return {'count': n, 'mean': round(sum(ordered) / n, 2), 'p50': pick(0.50), 'p95': pick(0.95), 'p99': pick(0.99)}
+
+
+class ScanMetrics:
+    """In-memory ring buffer of the most recent scan traces with percentile summaries."""
+    HISTORY = 500
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._scans = deque(maxlen=self.HISTORY)
+
+    def record(self, trace, found):
+        entry = trace.to_dict(found)
+        with self._lock: self._scans.append(entry)
+        return entry
+
+    def clear(self):
+        with self._lock: self._scans.clear()
+
+    def snapshot(self):
+        with self._lock: return list(self._scans)
+
+    def summary(self):
+        scans = self.snapshot()
+        stages = [s for s in STAGES if any(s in e['stages'] for e in scans)]
+        stages += sorted({k for e in scans for k in e['stages']} - set(stages))
+        return {
+            'scans': len(scans), 'found': sum(1 for e in scans if e['found']),
+            'total': percentiles([e['total_ms'] for e in scans]),
+            'stages': {s: percentiles([e['stages'][s] for e in scans if s in e['stages']]) for s in stages},
+            'ocr_cache_hit_rate': (sum(1 for e in scans if e['flags'].get('ocr_cache_hit')) / len(scans)) if scans else None,
+        }
+
+    def dump(self, path=None):
+        """Writes the summary and every buffered scan to JSON. Returns the path."""
+        path = path or os.path.join(Constants.DATA_DIR, f"scan_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, 'w', encoding='utf-8') as f: json.dump({'summary': self.summary(), 'scans': self.snapshot()}, f, indent=2)
+        return path
+
+    def format_table(self):
+        """Plain-text summary table (monospace) for the debug panel."""
+        s = self.summary()
+        if not s['scans']: return "No scans recorded yet."
+        rows = [f"{'stage':<11}{'n':>5}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)"]
+        for name, st in list(s['stages'].items()) + [('total', s['total'])]:
+            rows.append(f"{name:<11}{st['count']:>5}{st['p50']:>9.1f}{st['p95']:>9.1f}{st['p99']:>9.1f}")
+        rows.append(f"\n{s['scans']} scans, {s['found']} found, OCR cache hits {s['ocr_cache_hit_rate']:.0%}")
+        return "\n".join(rows)
+
+
+# --- SHARED INSTANCE ---
+_metrics = None
+
+def get_scan_metrics():
+    """Returns the process-wide ScanMetrics."""
+    global _metrics
+    if _metrics is None: _metrics = ScanMetrics()
+    return _metrics
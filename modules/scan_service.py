@@ -0,0 +1,82 @@
+import queue
+import itertools
+import threading
+import traceback
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class ScanService(QObject):
+    """
+    Long-lived scan thread fed by a request queue.
+
+    Every hotkey press gets a sequence number. A newer press supersedes anything queued or
+    in flight: queued requests are coalesced to the latest one, a running scan is aborted at
+    its next checkpoint (capture, OCR, 1200px fallback - a running Tesseract call itself
+    cannot be interrupted), and results whose sequence number is no longer the latest are
+    dropped so a stale scan never pops an overlay.
+    """
+    result_ready = pyqtSignal(int, object)   # (sequence, scan result or None)
+    scan_failed = pyqtSignal(int, str)       # (sequence, error message)
+
+    def __init__(self, scanner, debug=False, parent=None):
+        super().__init__(parent)
+        self.scanner = scanner
+        self.debug = debug
+        self._queue = queue.Queue()
+        self._seq = itertools.count(1)
+        self._latest = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ScanService", daemon=True)
+        self._thread.start()
+
+    def set_scanner(self, scanner):
+        """Swaps the ItemScanner (after a data reload). Takes effect from the next request."""
+        self.scanner = scanner
+
+    def request_scan(self, from_tray=False):
+        """Queues a scan of the current cursor position. Returns its sequence number."""
+        seq = next(self._seq)
+        self._latest = seq
+        self._queue.put((seq, from_tray))
+        return seq
+
+    def is_current(self, seq):
+        return seq == self._latest
+
+    def cancel(self):
+        """Supersedes every queued and running request without starting a new one."""
+        self._latest = next(self._seq)
+
+    # --- WORKER ---
+    def _run(self):
+        while not self._stop.is_set():
+            try: request = self._queue.get(timeout=0.5)
+            except queue.Empty: continue
+
+            # Coalesce: of everything queued in the meantime only the newest press matters
+            while request is not None:
+                try: request = self._queue.get_nowait()
+                except queue.Empty: break
+                if request is None: break
+            if request is None: break  # Shutdown sentinel
+
+            seq, from_tray = request
+            if seq != self._latest: continue
+
+            def superseded(seq=seq): return self._stop.is_set() or seq != self._latest
+            try:
+                result = self.scanner.scan_screen(full_screen=from_tray, should_abort=superseded)
+            except Exception as e:
+                traceback.print_exc()
+                if not superseded(): self.scan_failed.emit(seq, str(e))
+                continue
+
+            if superseded():
+                if self.debug: print(f"[DEBUG] Scan #{seq} superseded, result dropped.")
+                continue
+            self.result_ready.emit(seq, result)
+
+    def shutdown(self, timeout=2.0):
+        self._stop.set(); self.cancel()
+        self._queue.put(None)
+        self._thread.join(timeout)
@@ -0,0 +1,76 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from .constants import Constants
+
+
+class ScanSizeStats:
+    """
+    Remembers which search window size found the item in the user's recent scans
+    (persisted to scan_stats.json), so the scanner can try the usual winner first and only
+    run sizes in parallel when the fallback is actually needed often.
+    """
+    HISTORY = 50                # Successful scans remembered
+    PARALLEL_THRESHOLD = 0.25   # Speculate when non-first sizes win at least this often
+    MIN_SAMPLES = 5             # Below this, keep the default order and go parallel
+    SAVE_EVERY = 10             # Wins between writes of scan_stats.json...
+    SAVE_INTERVAL = 60.0        # ...or seconds since the last write
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(Constants.DATA_DIR, "scan_stats.json")
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._wins = deque(maxlen=self.HISTORY)
+        self._unsaved = 0; self._last_save = time.monotonic()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f: data = json.load(f)
+            self._wins.extend(int(s) for s in data.get('size_wins', []))
+        except (OSError, ValueError, TypeError): pass
+
+    def save(self):
+        with self._lock: data = {'size_wins': list(self._wins)}
+        try:
+            tmp = self.path + ".tmp"
+            with open(tmp, 'w', encoding='utf-8') as f: json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[WARN] Could not save scan stats: {e}")
+
+    def record_win(self, size):
+        """In memory; the file is written on a background thread when a save is due (see flush)."""
+        with self._lock:
+            self._wins.append(int(size)); self._unsaved += 1
+            due = self._unsaved >= self.SAVE_EVERY or time.monotonic() - self._last_save >= self.SAVE_INTERVAL
+        if due: threading.Thread(target=self.flush, name="ScanStatsSave", daemon=True).start()
+
+    def flush(self):
+        """Writes unsaved wins to disk (no-op when there are none)."""
+        with self._save_lock:
+            with self._lock:
+                if not self._unsaved: return
+                self._unsaved = 0; self._last_save = time.monotonic()
+            self.save()
+
+    def win_counts(self):
+        with self._lock: wins = list(self._wins)
+        counts = {}
+        for s in wins: counts[s] = counts.get(s, 0) + 1
+        return counts, len(wins)
+
+    def ordered_sizes(self, sizes):
+        """Sizes sorted by how often they won (ties keep the given order)."""
+        counts, _ = self.win_counts()
+        return sorted(sizes, key=lambda s: (-counts.get(s, 0), sizes.index(s)))
+
+    def plan(self, sizes):
+        """Returns (ordered_sizes, run_parallel)."""
+        ordered = self.ordered_sizes(sizes)
+        counts, total = self.win_counts()
+        if total < self.MIN_SAMPLES: return list(sizes), True
+        others = total - counts.get(ordered[0], 0)
+        return ordered, (others / total) >= self.PARALLEL_THRESHOLD
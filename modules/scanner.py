@@ -1,11 +1,12 @@
 import re
 import os
 import hashlib
-import pytesseract
+import threading
 from PIL import ImageEnhance
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from datetime import datetime
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # RapidFuzz / Difflib check
 try:
@@ -14,7 +15,27 @@ except ImportError:
     import difflib; _HAS_RAPIDFUZZ = False
 
 from .constants import Constants
-from .image_processor import ImageProcessor
+from .scan_stats import ScanSizeStats
+from .capture_geometry import CaptureGeometry
+from .ocr_vocabulary import OcrVocabulary
+from .scan_metrics import ScanTrace, get_scan_metrics, timed
+
+# --- DEFERRED IMPORTS ---
+# pytesseract and the capture/vision stack (image_processor -> cv2, mss, numpy) are imported on first use,
+# or earlier by the app's background pre-import thread, so they stay off the launch-to-tray path.
+pytesseract = None
+ImageProcessor = None
+_vision_lock = threading.Lock()
+
+def load_vision_modules():
+    """Imports pytesseract and ImageProcessor (cv2 / mss / numpy) once; safe to call from any thread."""
+    global pytesseract, ImageProcessor
+    if ImageProcessor is not None: return
+    with _vision_lock:
+        if ImageProcessor is not None: return
+        import pytesseract as _pytesseract
+        from .image_processor import ImageProcessor as _ImageProcessor
+        pytesseract = _pytesseract; ImageProcessor = _ImageProcessor
 
 
 def normalize_for_matching(text: str) -> str:
@@ -52,6 +73,10 @@ def fix_roman_numeral_ocr(text: str) -> str:
 
 
 class ItemScanner:
+    SEARCH_SIZES = (800, 1200)  # Cursor-centred search windows, tightest first
+    MATCH_SCORE = 65            # Minimum fuzzy score for a match
+    PRIOR_MATCH_SCORE = 80      # Score a rarity-shortlist match needs before the full item list is skipped
+
     def __init__(self, config, data_manager):
         """
         :param config: The app config object (contains tesseract path, debug flags).
@@ -66,6 +91,11 @@ class ItemScanner:
         self.json_lang_code = 'en'
         self.full_screen_mode = False 
         self.save_debug_images = False  # Default Off
+        self.speculative_scan = False   # Run search sizes concurrently (adaptive), see _scan_speculative
+        self.adaptive_capture = False   # Capture the learned tooltip rectangle first, see CaptureGeometry
+        self.preprocess_mode = "pil"    # "pil" (grayscale + contrast) or "cv2" (text-height normalisation + CLAHE/Otsu)
+        self.ocr_text_height = 32       # Target text line height in px for the cv2 mode
+        self.capture_source = None      # None = live screen, or a ReplayCaptureSource (image_processor.py) for saved screenshots
 
         # Item cache for performance
         self._cached_filtered_items: Optional[List[Tuple[str, dict]]] = None
@@ -74,18 +104,33 @@ class ItemScanner:
         # OCR result cache (LRU, max 10 entries)
         self._ocr_cache: OrderedDict[str, Optional[str]] = OrderedDict()
         self._ocr_cache_max_size = 10
+        self._ocr_cache_lock = threading.Lock()  # Speculative scans run _execute_scan concurrently
+
+        # Which search size finds items for this user (drives speculative order/parallelism)
+        self.size_stats = ScanSizeStats()
+        # Where tooltips appear relative to the cursor (drives the adaptive capture window)
+        self.capture_geometry = CaptureGeometry()
+        self._scan_pool = None
+
+        # Per-language Tesseract vocabulary (whitelist, user words/patterns), generated off the scan path (see ensure_ocr_vocabularies)
+        self._vocab_cache: Dict[str, Optional[OcrVocabulary]] = {}
+        self._vocab_lock = threading.Lock()
 
-        # Configure Tesseract Path if provided
-        if self.cmd_config.tesseract_path:
-            pytesseract.pytesseract.tesseract_cmd = self.cmd_config.tesseract_path
+        # Tesseract path (if provided) is applied once pytesseract is imported, see _ensure_vision
+        self._tesseract_configured = False
 
-    def update_settings(self, target_color, ocr_lang_code, json_lang_code, full_screen_mode=False, save_debug_images=False):
+    def update_settings(self, target_color, ocr_lang_code, json_lang_code, full_screen_mode=False, save_debug_images=False, speculative_scan=False, adaptive_capture=False,
+                        preprocess_mode="pil", ocr_text_height=32):
         """Updates scanner settings when the user changes preferences."""
         self.target_color = target_color
         self.ocr_lang_code = ocr_lang_code
         self.json_lang_code = json_lang_code
         self.full_screen_mode = full_screen_mode
         self.save_debug_images = save_debug_images
+        self.speculative_scan = speculative_scan
+        self.adaptive_capture = adaptive_capture
+        self.preprocess_mode = preprocess_mode
+        self.ocr_text_height = ocr_text_height
         
         # Invalidate item cache when language changes
         if self._cache_lang_code != json_lang_code:
@@ -140,11 +185,23 @@ class ItemScanner:
         self._cache_lang_code = lang_code
         return filtered_items
 
-    def _find_best_match(self, candidates: List[str], item_names: List[str], name_to_actual: dict) -> Tuple[Optional[str], float]:
+    def _find_best_match(self, candidates: List[str], item_names: List[str], name_to_actual: dict, rarity: Optional[str] = None) -> Tuple[Optional[str], float]:
         """
         Find the best matching item name from candidates.
-        Uses multiple matching strategies and picks the best overall result.
+        With a rarity prior (from the tooltip accent colour) the items of that rarity are searched first;
+        the whole list is only searched if none of them reaches PRIOR_MATCH_SCORE.
         """
+        if rarity:
+            shortlist = [name for name in item_names if (name_to_actual.get(name) or {}).get('rarity') == rarity]
+            if shortlist:
+                best_name, best_score = self._match_candidates(candidates, shortlist)
+                if self.cmd_config.debug:
+                    print(f"[DEBUG] Rarity prior '{rarity}': {len(shortlist)}/{len(item_names)} items, best '{best_name}' = {best_score:.1f}")
+                if best_score >= self.PRIOR_MATCH_SCORE: return best_name, best_score
+        return self._match_candidates(candidates, item_names)
+
+    def _match_candidates(self, candidates: List[str], item_names: List[str]) -> Tuple[Optional[str], float]:
+        """Uses multiple matching strategies and picks the best overall result."""
         best_name, best_score = None, 0
 
         # Create normalized versions of item names for secondary matching
@@ -208,33 +265,129 @@ class ItemScanner:
 
         return best_name, best_score
 
-    def scan_screen(self, full_screen: bool = False) -> Optional[Dict[str, Any]]:
+    def scan_screen(self, full_screen: bool = False, should_abort: Optional[Callable[[], bool]] = None, trace: Optional[ScanTrace] = None) -> Optional[Dict[str, Any]]:
         """
         Public wrapper for scanning.
-        Attempts to scan with a tight 800px window first.
-        If no match is found, falls back to a 1200px window.
+        Attempts the learned tooltip rectangle first (once enough tooltips were seen), then
+        a tight 800px window. If no match is found, falls back to a 1200px window.
+        should_abort is polled between stages; once it returns True the scan stops and returns None.
+        Stage timings of every call are recorded in the shared ScanMetrics (see scan_metrics.py);
+        pass a ScanTrace to also read them (and the 'match_score' flag) yourself.
         """
+        trace = trace or ScanTrace()
+        result = None
+        try:
+            self._ensure_vision()
+            result = self._scan(full_screen, should_abort, trace)
+        finally:
+            if should_abort and should_abort(): trace.flag('aborted')
+            entry = get_scan_metrics().record(trace, result is not None)
+            if self.cmd_config.debug: print(f"[DEBUG] Scan timings: {entry['stages']} total={entry['total_ms']}ms flags={entry['flags']}")
+        return result
+
+    def _scan(self, full_screen: bool, should_abort: Optional[Callable[[], bool]], trace: ScanTrace) -> Optional[Dict[str, Any]]:
         # If user setting says full screen mode is ON, override the parameter
         if self.full_screen_mode:
             full_screen = True
 
         if full_screen:
-            return self._execute_scan(full_screen=True)
+            trace.mode = "full_screen"
+            return self._execute_scan(full_screen=True, should_abort=should_abort, trace=trace)
+
+        # ATTEMPT 0: Learned cursor-relative rectangle (smaller than the fixed squares)
+        learned_rect = self.capture_geometry.learned_rect() if self.adaptive_capture else None
+        if learned_rect:
+            if self.cmd_config.debug: print(f"[DEBUG] Attempting scan in learned area {learned_rect}...")
+            trace.mode = "learned"
+            result = self._execute_scan(full_screen=False, capture_rect=learned_rect, should_abort=should_abort, trace=trace)
+            if result: return result
+            if should_abort and should_abort(): return None
+
+        if self.speculative_scan:
+            trace.mode = "speculative"
+            return self._scan_speculative(should_abort, trace)
         
         # ATTEMPT 1: Tight 800px scan
+        trace.mode = "fixed"
         if self.cmd_config.debug: print("[DEBUG] Attempting scan at 800px...")
-        result = self._execute_scan(full_screen=False, search_size=800)
+        result = self._execute_scan(full_screen=False, search_size=800, should_abort=should_abort, trace=trace)
         if result: 
+            self.size_stats.record_win(800)
             return result
+        if should_abort and should_abort(): return None
 
         # ATTEMPT 2: Fallback to 1200px
         if self.cmd_config.debug: print("[DEBUG] No match at 800px. Retrying with 1200px...")
-        return self._execute_scan(full_screen=False, search_size=1200)
+        result = self._execute_scan(full_screen=False, search_size=1200, should_abort=should_abort, trace=trace)
+        if result: self.size_stats.record_win(1200)
+        return result
+
+    def _scan_speculative(self, should_abort: Optional[Callable[[], bool]] = None, trace: Optional[ScanTrace] = None) -> Optional[Dict[str, Any]]:
+        """
+        Tries every search size, ordered by how often each one found the item for this user.
+        While the fallback sizes win often enough (or there is no history yet) all sizes are
+        processed concurrently and the first confident match cancels the others; otherwise
+        they run one after another in the learned order.
+        """
+        sizes, parallel = self.size_stats.plan(list(self.SEARCH_SIZES))
+        if self.cmd_config.debug: print(f"[DEBUG] Speculative scan: sizes={sizes}, parallel={parallel}")
+
+        if not parallel:
+            for size in sizes:
+                result = self._execute_scan(full_screen=False, search_size=size, should_abort=should_abort, trace=trace)
+                if result:
+                    self.size_stats.record_win(size)
+                    return result
+                if should_abort and should_abort(): return None
+            return None
+
+        won = threading.Event()
+        def abort(): return won.is_set() or bool(should_abort and should_abort())
 
-    def _execute_scan(self, full_screen: bool = False, search_size: int = 800) -> Optional[Dict[str, Any]]:
+        if self._scan_pool is None:
+            # 2x so a superseded scan still finishing its OCR call never blocks the next one
+            self._scan_pool = ThreadPoolExecutor(max_workers=len(self.SEARCH_SIZES) * 2, thread_name_prefix="SpeculativeScan")
+        futures = {self._scan_pool.submit(self._execute_scan, False, size, abort, None, trace): size for size in sizes}
+        for future in as_completed(futures):
+            try: result = future.result()
+            except Exception as e:
+                print(f"[WARN] Scan at {futures[future]}px failed: {e}"); continue
+            if result:
+                won.set()
+                self.size_stats.record_win(futures[future])
+                if self.cmd_config.debug: print(f"[DEBUG] Speculative scan won at {futures[future]}px.")
+                return result
+        return None
+
+    def _get_ocr_vocabulary(self) -> Optional[OcrVocabulary]:
+        """Vocabulary for the current data language (None until its files exist; they are never generated here)."""
+        lang = self.json_lang_code or 'en'
+        with self._vocab_lock:
+            if lang not in self._vocab_cache: self._vocab_cache[lang] = OcrVocabulary.load(lang)
+            return self._vocab_cache[lang]
+
+    def reload_ocr_vocabulary(self):
+        """Drops the loaded vocabularies so the next scan picks up newly generated files."""
+        with self._vocab_lock: self._vocab_cache.clear()
+
+    def _ensure_vision(self):
+        load_vision_modules()
+        if not self._tesseract_configured:
+            if self.cmd_config.tesseract_path: pytesseract.pytesseract.tesseract_cmd = self.cmd_config.tesseract_path
+            self._tesseract_configured = True
+
+    def close(self):
+        """Stops the speculative scan pool (running OCR calls finish in the background) and writes the learned scan state."""
+        if self._scan_pool is not None:
+            self._scan_pool.shutdown(wait=False, cancel_futures=True); self._scan_pool = None
+        self.size_stats.flush(); self.capture_geometry.flush()
+
+    def _execute_scan(self, full_screen: bool = False, search_size: int = 800, should_abort: Optional[Callable[[], bool]] = None,
+                      capture_rect: Optional[Tuple[int, int, int, int]] = None, trace: Optional[ScanTrace] = None) -> Optional[Dict[str, Any]]:
         """
         Actual implementation of the scanning process.
         """
+        if trace is not None: trace.new_attempt()
         # Prepare Debug Paths
         debug_path = None
         debug_prefix = None
@@ -242,12 +395,19 @@ class ItemScanner:
             debug_path = os.path.join(Constants.DATA_DIR, "debug_images")
             os.makedirs(debug_path, exist_ok=True)
             debug_prefix = datetime.now().strftime("%Y%m%d_%H%M%S")
+            if capture_rect: debug_prefix += "_learned"
+            elif not full_screen: debug_prefix += f"_{search_size}"  # Speculative sizes run at the same time
 
         # 1. Capture Image
         # Pass the search_size to the processor
-        img = ImageProcessor.capture_and_process(self.target_color, full_screen=full_screen, debug_path=debug_path, debug_prefix=debug_prefix, search_area_size=search_size)
+        detection = {}
+        img = ImageProcessor.capture_and_process(self.target_color, full_screen=full_screen, debug_path=debug_path, debug_prefix=debug_prefix, search_area_size=search_size,
+                                                 capture_rect=capture_rect, detection=detection, source=self.capture_source)
+        if self.cmd_config.debug and detection.get('pixels'): print(f"[DEBUG] Captured {detection['pixels']:,} px")
+        if trace is not None:
+            for stage, ms in detection.get('timings', {}).items(): trace.add(stage, ms)
         
-        if img is None:
+        if img is None or (should_abort and should_abort()):
             return None
         
         # --- DEBUG: SAVE RAW TOOLTIP IMAGE (Cropped Result) ---
@@ -259,38 +419,26 @@ class ItemScanner:
                 print(f"Failed to save debug cropped image: {e}")
         # ---------------------------------------
 
-        # --- OPTIMIZATION: Crop to Header (with minimum height for small tooltips) ---
-        w, h = img.size
-        if self.cmd_config.debug:
-            print(f"[DEBUG] Tooltip size: {w}x{h}")
+        best_name = self.recognize_tooltip(img, should_abort=should_abort, debug_path=debug_path, debug_prefix=debug_prefix, trace=trace)
+        if not best_name:
+            return None
 
-        if h > 100:
-            # For small/medium tooltips, use a larger percentage to not cut off the name
-            # For larger tooltips, 30% is enough to get just the header
-            # 400px+ are the big detailed tooltips where 30% works fine
-            crop_percent = 0.50 if h < 400 else 0.30
-            crop_height = max(100, int(h * crop_percent))  # At least 100px for the name
-            if self.cmd_config.debug:
-                print(f"[DEBUG] Cropping to {crop_height}px ({crop_percent*100:.0f}% of {h})")
-            img = img.crop((0, 0, w, crop_height))
-        else:
-            if self.cmd_config.debug:
-                print(f"[DEBUG] Tooltip too small to crop, using full height")
-        # ----------------------------------------------
-        
-        # --- FIX: Trim edges to remove artifacts from screen boundaries ---
-        # When tooltips are near screen edges, we sometimes capture gray bars or
-        # UI elements that corrupt the OCR. Trim a few pixels from all edges.
-        w, h = img.size
-        edge_trim = 10 if w > 100 else 5  # Smaller trim for narrow images
-        if w > edge_trim * 2 and h > edge_trim * 2:
-            img = img.crop((edge_trim, 0, w - edge_trim, h))  # Trim left and right edges
-        # -----------------------------------------------------------------
+        # Aggregate Data
+        self._record_capture_geometry(detection)
+        with timed(trace, "aggregate"): return self._aggregate_item_data(best_name)
+
+    def recognize_tooltip(self, img, should_abort: Optional[Callable[[], bool]] = None, debug_path: Optional[str] = None, debug_prefix: Optional[str] = None,
+                          trace: Optional[ScanTrace] = None) -> Optional[str]:
+        """
+        Reads the item name from a cropped tooltip image (PIL) and returns the matched item name, or None.
+        Everything after the screen capture: header crop, preprocessing, OCR (cached) and fuzzy matching.
+        """
+        self._ensure_vision()
+        # Rarity from the tooltip accent colour (soft prior for matching, see _find_best_match)
+        with timed(trace, "detect"): rarity = ImageProcessor.classify_accent(img, Constants.RARITY_COLORS)
+        if self.cmd_config.debug and rarity: print(f"[DEBUG] Tooltip accent suggests rarity '{rarity}'")
 
-        # 3. Enhance Image for OCR
-        img = img.convert('L')  # Convert to Grayscale
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(2.0)  # High Contrast
+        with timed(trace, "preprocess"): img = self.prepare_for_ocr(img)
         
         # --- DEBUG: SAVE PROCESSED HEADER IMAGE ---
         if self.save_debug_images and debug_path and debug_prefix:
@@ -305,16 +453,18 @@ class ItemScanner:
         img_bytes = img.tobytes()
         img_hash = hashlib.md5(img_bytes).hexdigest()
         
-        if img_hash in self._ocr_cache:
-            cached_item_name = self._ocr_cache[img_hash]
+        with self._ocr_cache_lock:
+            cache_hit = img_hash in self._ocr_cache
+            if cache_hit:
+                cached_item_name = self._ocr_cache[img_hash]
+                # Move to end (LRU behavior)
+                self._ocr_cache.move_to_end(img_hash)
+        if cache_hit:
+            if trace is not None: trace.flag('ocr_cache_hit')
             if self.cmd_config.debug:
                 print(f"[DEBUG] OCR Cache HIT: {cached_item_name}")
-            # Move to end (LRU behavior)
-            self._ocr_cache.move_to_end(img_hash)
-            if cached_item_name is None:
-                return None
-            # Return cached result by re-aggregating data
-            return self._aggregate_item_data(cached_item_name)
+            # Return cached result (the caller re-aggregates the data)
+            return cached_item_name
         # -----------------------------------------------------
         
         # 4. Setup Language / Tesseract Config (WITH SAFE ENGLISH WHITELIST)
@@ -330,34 +480,115 @@ class ItemScanner:
                 print(f"[WARN] Language file for '{self.ocr_lang_code}' not found. Falling back to 'eng'.")
             lang = 'eng'
 
-        # Apply whitelist ONLY if English is selected
-        if lang == 'eng':
+        # Restrict Tesseract to the characters/words of the item names when the requested model is loaded,
+        # otherwise keep the generic whitelist for English only
+        vocab = self._get_ocr_vocabulary() if lang == self.ocr_lang_code else None
+        if vocab and vocab.chars:
+            tess_extra = " " + vocab.tesseract_args()
+        elif lang == 'eng':
             # Whitelist: a-z, A-Z, 0-9, Hyphen, Period, Parentheses
             whitelist = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-.() "
-            tess_config = f"--psm 6 -c tessedit_char_whitelist={whitelist}"
+            tess_extra = f" -c tessedit_char_whitelist={whitelist}"
         else:
-            tess_config = "--psm 6"
+            tess_extra = ""
+
+        # 5. Localise the item-name line(s) (projection profiles) so Tesseract reads one short strip
+        with timed(trace, "crop"): title = ImageProcessor.find_title_lines(img)
+        title_img = None
+        if title:
+            (x1, y1, x2, y2), line_count = title
+            title_img = img.crop((x1, y1, x2, y2))
+            if self.cmd_config.debug:
+                print(f"[DEBUG] Title strip: {x2 - x1}x{y2 - y1}px, {line_count} line(s) (header {img.size[0]}x{img.size[1]}px)")
+            if self.save_debug_images and debug_path and debug_prefix:
+                try: title_img.save(os.path.join(debug_path, f"{debug_prefix}_title_strip.png"))
+                except Exception as e: print(f"Failed to save debug title image: {e}")
+
+        # 6. Run OCR + Fuzzy Match: single-line mode on the strip, block mode on the whole header only when no strip was found
+        #    (one OCR call per capture, as before the strip crop)
+        attempts = [(title_img, 7 if line_count == 1 else 6)] if title_img is not None else [(img, 6)]
+
+        best_name, best_score = None, 0
+        for ocr_img, psm in attempts:
+            if should_abort and should_abort(): return None
+            try:
+                with timed(trace, "ocr"): raw_text = pytesseract.image_to_string(ocr_img, lang=lang, config=f"--psm {psm}{tess_extra}")
+                lines = raw_text.splitlines()
+            except Exception as e:
+                print(f"[Error] OCR Failed: {e}")
+                return None
+
+            if should_abort and should_abort(): return None
+            with timed(trace, "match"): best_name, best_score = self._match_ocr_lines(lines, rarity)
+            if best_name: break
+
+        if trace is not None and best_name: trace.flag('match_score', round(best_score, 1))
+
+        # --- OCR CACHE: Store result ---
+        with self._ocr_cache_lock:
+            self._ocr_cache[img_hash] = best_name
+            if len(self._ocr_cache) > self._ocr_cache_max_size:
+                self._ocr_cache.popitem(last=False)  # Remove oldest entry
+        # -------------------------------
+        return best_name
+
+    def prepare_for_ocr(self, img):
+        """Crops a tooltip image to its header and applies the configured preprocessing. Returns a PIL 'L' image."""
+        self._ensure_vision()
+        # --- OPTIMIZATION: Crop to Header (with minimum height for small tooltips) ---
+        w, h = img.size
+        if self.cmd_config.debug:
+            print(f"[DEBUG] Tooltip size: {w}x{h}")
+
+        if h > 100:
+            # For small/medium tooltips, use a larger percentage to not cut off the name
+            # For larger tooltips, 30% is enough to get just the header
+            # 400px+ are the big detailed tooltips where 30% works fine
+            crop_percent = 0.50 if h < 400 else 0.30
+            crop_height = max(100, int(h * crop_percent))  # At least 100px for the name
+            if self.cmd_config.debug:
+                print(f"[DEBUG] Cropping to {crop_height}px ({crop_percent*100:.0f}% of {h})")
+            img = img.crop((0, 0, w, crop_height))
+        else:
+            if self.cmd_config.debug:
+                print(f"[DEBUG] Tooltip too small to crop, using full height")
+        # ----------------------------------------------
         
-        # 5. Run OCR
-        try:
-            raw_text = pytesseract.image_to_string(img, lang=lang, config=tess_config)
-            lines = raw_text.splitlines()
-        except Exception as e:
-            print(f"[Error] OCR Failed: {e}")
-            return None
+        # --- FIX: Trim edges to remove artifacts from screen boundaries ---
+        # When tooltips are near screen edges, we sometimes capture gray bars or
+        # UI elements that corrupt the OCR. Trim a few pixels from all edges.
+        w, h = img.size
+        edge_trim = 10 if w > 100 else 5  # Smaller trim for narrow images
+        if w > edge_trim * 2 and h > edge_trim * 2:
+            img = img.crop((edge_trim, 0, w - edge_trim, h))  # Trim left and right edges
+        # -----------------------------------------------------------------
 
-        if not lines: 
-            return None
-            
-        # 6. Clean Text
-        # I have kept the period . and parens () but moved the dash - to the end so it doesn't crash.
-        cleaned = [re.sub(r'[^a-zA-Z0-9\s.\(\)-]', '', l).strip() for l in lines if len(l.strip()) >= 3]
+        # --- Enhance Image for OCR ---
+        if self.preprocess_mode == "cv2":
+            # Text-height normalisation + CLAHE + Otsu (see ImageProcessor.preprocess_for_ocr)
+            img = ImageProcessor.preprocess_for_ocr(img, target_text_height=self.ocr_text_height)
+        else:
+            img = img.convert('L')  # Convert to Grayscale
+            enhancer = ImageEnhance.Contrast(img)
+            img = enhancer.enhance(2.0)  # High Contrast
+        return img
+
+    def _match_ocr_lines(self, lines: List[str], rarity: Optional[str] = None) -> Tuple[Optional[str], float]:
+        """Cleans raw OCR lines and fuzzy-matches them against the item names. Returns (name or None, score)."""
+        # Clean Text: keep only characters that occur in this language's item names
+        vocab = self._get_ocr_vocabulary()
+        if vocab and vocab.chars:
+            cleaned = [vocab.clean_line(l) for l in lines if len(l.strip()) >= 3]
+        else:
+            # I have kept the period . and parens () but moved the dash - to the end so it doesn't crash.
+            cleaned = [re.sub(r'[^a-zA-Z0-9\s.\(\)-]', '', l).strip() for l in lines if len(l.strip()) >= 3]
         
         # --- DEBUG PRINT ADDED HERE ---
         print(f"[DEBUG] OCR Raw Text: {cleaned}")
         # ------------------------------
+        if not cleaned: return None, 0
         
-        # 7. Fuzzy Match against Database (LANGUAGE-FILTERED)
+        # Fuzzy Match against Database (LANGUAGE-FILTERED)
         # Only search against item names in the currently selected language
         filtered_items = self._get_language_filtered_items()
         item_names = [name for name, _ in filtered_items]
@@ -375,26 +606,22 @@ class ItemScanner:
         if self.cmd_config.debug:
             print(f"[DEBUG] Candidates after Roman numeral fix: {search_candidates}")
         
-        best_name, best_score = self._find_best_match(search_candidates, item_names, name_to_item)
+        best_name, best_score = self._find_best_match(search_candidates, item_names, name_to_item, rarity)
 
         # Apply minimum threshold
-        if best_score < 65:  # Slightly lowered from 70 since we have better matching now
+        if best_score < self.MATCH_SCORE:  # Slightly lowered from 70 since we have better matching now
             best_name = None
 
         if self.cmd_config.debug: 
             print(f"[DEBUG] Best Match: '{best_name}' with score {best_score}")
+        return best_name, best_score
 
-        # --- OCR CACHE: Store result ---
-        self._ocr_cache[img_hash] = best_name
-        if len(self._ocr_cache) > self._ocr_cache_max_size:
-            self._ocr_cache.popitem(last=False)  # Remove oldest entry
-        # -------------------------------
-
-        if not best_name:
-            return None
-
-        # 8. Aggregate Data
-        return self._aggregate_item_data(best_name)
+    def _record_capture_geometry(self, detection: dict) -> None:
+        """Feeds a successfully matched tooltip box into the capture window history."""
+        if not self.adaptive_capture or not detection.get('box'): return
+        # A box clipped by the capture area (learned rectangle or fixed square) would only teach it to stay too small
+        if detection.get('edge'): return
+        self.capture_geometry.record(detection['box'], detection.get('scale', 1.0))
 
     def _aggregate_item_data(self, item_name: str) -> Optional[Dict[str, Any]]:
         """
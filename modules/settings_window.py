@@ -16,6 +16,7 @@ from .constants import Constants
 from .ui_components import ModernToggle, SettingsCard, HotkeyButton
 from .base_page import BasePage
 from .overlay_ui import OverlayRenderer
+from .scan_metrics import get_scan_metrics
 
 class SettingsWindow(BasePage):
     # Signals
@@ -76,7 +77,9 @@ class SettingsWindow(BasePage):
         self.tabs.addTab(self.setup_item_overlay_tab(), "Item Overlay")
         self.tabs.addTab(self.setup_quest_overlay_tab(), "Quest Overlay")
         self.tabs.addTab(self.setup_updates_tab(), "Updates")
+        self.tabs.addTab(self.setup_diagnostics_tab(), "Diagnostics")
         self.tabs.addTab(self.setup_about_tab(), "About")
+        self.tabs.currentChanged.connect(lambda i: self._refresh_scan_metrics() if self.tabs.tabText(i) == "Diagnostics" else None)
 
         self.footer_layout.addStretch()
 
@@ -120,6 +123,10 @@ class SettingsWindow(BasePage):
         row_lang.addStretch()
         row_lang.addWidget(self.lang_combo)
         l_pref.addLayout(row_lang)
+
+        self.chk_start_minimized = ModernToggle("Start minimized to tray")
+        self.chk_start_minimized.setToolTip("Only the tray icon and hotkeys start; the Progress Hub opens from the tray or its hotkey.\nDefault: OFF")
+        l_pref.addWidget(self.chk_start_minimized)
         layout.addWidget(card_pref)
 
         # --- CARD 2: HOTKEYS ---
@@ -232,6 +239,24 @@ class SettingsWindow(BasePage):
         self.chk_ultrawide.setToolTip("Enable this if the scanner doesn't find items due to monitor scaling.\nIt scans the entire screen.")
         l_scan.addWidget(self.chk_ultrawide)
 
+        self.chk_speculative_scan = ModernToggle("Parallel Scan (800px + 1200px at once)")
+        self.chk_speculative_scan.setToolTip("Scans the small and the large search area at the same time and uses whichever finds the item first.\nLearns which size usually works for you and only runs both in parallel when the large one is needed often.\nHelps with large UI scales. Default: OFF")
+        l_scan.addWidget(self.chk_speculative_scan)
+
+        self.chk_adaptive_capture = ModernToggle("Learn Tooltip Area (smaller, faster captures)")
+        self.chk_adaptive_capture.setToolTip("Remembers where tooltips appear around your cursor and only captures that area once enough items were scanned.\nFalls back to the normal search area if nothing is found there (one extra capture on a miss). Default: OFF")
+        l_scan.addWidget(self.chk_adaptive_capture)
+
+        row_pre = QHBoxLayout()
+        row_pre.addWidget(QLabel("OCR Preprocessing:", styleSheet="color: #E0E6ED; font-size: 13px; border:none; background:transparent;"))
+        self.cmb_ocr_preprocess = QComboBox()
+        self.cmb_ocr_preprocess.addItem("Standard (Contrast)", "pil")
+        self.cmb_ocr_preprocess.addItem("Adaptive (OpenCV)", "cv2")
+        self.cmb_ocr_preprocess.setToolTip("Adaptive rescales the item name to a fixed text height and binarises it (CLAHE + Otsu).\nCan help on 4K displays or very small UI scales.")
+        self.cmb_ocr_preprocess.setStyleSheet("QComboBox { background: #2C313C; color: #E0E6ED; border: 1px solid #3E4451; padding: 5px; border-radius: 4px; }")
+        row_pre.addWidget(self.cmb_ocr_preprocess); row_pre.addStretch()
+        l_scan.addLayout(row_pre)
+
         self.chk_debug_save = ModernToggle("Save Debug Images (to Pictures/ArcCompanion_Debug)")
         self.chk_debug_save.setToolTip("Saves the raw screenshot and the processed OCR image for troubleshooting.\nDefault: OFF")
         l_scan.addWidget(self.chk_debug_save)
@@ -356,6 +381,10 @@ class SettingsWindow(BasePage):
         data_lbl_layout.addWidget(self.last_updated_lbl)
 
         row_data.addLayout(data_lbl_layout); row_data.addStretch(); data_check_btn = QPushButton("Sync Game Data"); data_check_btn.setFixedWidth(180); data_check_btn.setFixedHeight(30); data_check_btn.setObjectName("action_button_green"); data_check_btn.setCursor(Qt.CursorShape.PointingHandCursor); data_check_btn.setStyleSheet("QPushButton { font-size: 12px; }"); data_check_btn.clicked.connect(self.request_data_update.emit); row_data.addWidget(data_check_btn); l_upd.addLayout(row_data)
+
+        self.chk_prefetch_icons = ModernToggle("Download all item icons after data sync")
+        self.chk_prefetch_icons.setToolTip("Fetches every item image in the background once a sync finishes, so the Item Database never waits on downloads.")
+        l_upd.addWidget(self.chk_prefetch_icons)
         
         # Attribution
         attr_layout = QVBoxLayout(); attr_layout.setSpacing(2)
@@ -392,6 +421,49 @@ class SettingsWindow(BasePage):
         layout.addStretch()
         return page
 
+    # --- DIAGNOSTICS TAB ---
+    def setup_diagnostics_tab(self):
+        page = QWidget(); layout = QVBoxLayout(page); layout.setContentsMargins(10, 10, 10, 10); layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
+        layout.addWidget(QLabel("Scan Performance", objectName="Header"))
+        card = SettingsCard(); l_card = QVBoxLayout(card); l_card.setContentsMargins(15, 15, 15, 15); l_card.setSpacing(12)
+
+        info_label = QLabel("Stage timings of the recent scans in this session (milliseconds).\nShows whether a slow scan comes from the screen capture, Tesseract (ocr) or the data lookup (aggregate).")
+        info_label.setWordWrap(True); info_label.setStyleSheet("color: #ABB2BF; font-size: 13px; border: none; background: transparent;")
+        l_card.addWidget(info_label)
+
+        self.lbl_scan_metrics = QLabel()
+        self.lbl_scan_metrics.setFont(QFont("Consolas", 10)); self.lbl_scan_metrics.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.lbl_scan_metrics.setStyleSheet("color: #E0E6ED; background: #21252B; border: 1px solid #3E4451; border-radius: 4px; padding: 8px;")
+        l_card.addWidget(self.lbl_scan_metrics)
+
+        btn_style = "QPushButton { background-color: #3E4451; color: white; border: 1px solid #555; border-radius: 4px; font-weight: bold; font-size: 13px; } QPushButton:hover { background-color: #4B5363; border-color: #777; }"
+        btn_layout = QHBoxLayout()
+        for text, slot in (("Refresh", self._refresh_scan_metrics), ("Export JSON", self._export_scan_metrics), ("Clear", self._clear_scan_metrics)):
+            btn = QPushButton(text); btn.setFixedSize(130, 32); btn.setCursor(Qt.CursorShape.PointingHandCursor); btn.setStyleSheet(btn_style); btn.clicked.connect(slot)
+            btn_layout.addWidget(btn)
+        btn_layout.addStretch()
+        l_card.addLayout(btn_layout)
+
+        layout.addWidget(card)
+        layout.addStretch()
+        self._refresh_scan_metrics()
+        return page
+
+    def _refresh_scan_metrics(self): self.lbl_scan_metrics.setText(get_scan_metrics().format_table())
+
+    def _clear_scan_metrics(self): get_scan_metrics().clear(); self._refresh_scan_metrics()
+
+    def _export_scan_metrics(self):
+        default = os.path.join(Constants.DATA_DIR, f"scan_metrics_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json")
+        path, _ = QFileDialog.getSaveFileName(self, "Export Scan Timings", default, "JSON Files (*.json)")
+        if not path: return
+        try:
+            get_scan_metrics().dump(path)
+            QMessageBox.information(self, "Export Successful", f"Scan timings written to:\n{path}")
+        except OSError as e:
+            QMessageBox.warning(self, "Export Failed", f"Could not write scan timings:\n{e}")
+
     # --- ITEM OVERLAY TAB ---
     def setup_item_overlay_tab(self):
         page = QWidget()
@@ -432,6 +504,18 @@ class SettingsWindow(BasePage):
         wrapper.addWidget(self.cmb_anchor)
         l_app.addLayout(wrapper)
 
+        # Renderer
+        wrapper = QHBoxLayout()
+        wrapper.addWidget(QLabel("Renderer:", styleSheet="color: #E0E6ED; font-size: 13px; min-width: 80px; border:none; background:transparent;"))
+        self.cmb_renderer = QComboBox()
+        self.cmb_renderer.addItem("Standard (Widgets)", "widgets")
+        self.cmb_renderer.addItem("Fast (Painted)", "painted")
+        self.cmb_renderer.setToolTip("Fast draws the whole overlay in a single custom-painted widget instead of one label per line.")
+        self.cmb_renderer.setStyleSheet("QComboBox { background: #2C313C; color: #E0E6ED; border: 1px solid #3E4451; padding: 5px; border-radius: 4px; }")
+        self.cmb_renderer.currentIndexChanged.connect(self.update_preview)
+        wrapper.addWidget(self.cmb_renderer)
+        l_app.addLayout(wrapper)
+
         left_col.addWidget(card_app)
 
         # Modifiers Card
@@ -840,6 +924,7 @@ class SettingsWindow(BasePage):
                              order.append(item.data(Qt.ItemDataRole.UserRole))
                          return ",".join(order)
                     if key == 'anchor_mode': return self.p.cmb_anchor.currentText()
+                    if key == 'renderer': return self.p.cmb_renderer.currentData() or fallback
                 return self.p.cfg.get(section, key, fallback)
             def getfloat(self, s, k, f=0.0): return self.p.cfg.getfloat(s,k,f)
             def getboolean(self, section, key, fallback=True):
@@ -867,6 +952,7 @@ class SettingsWindow(BasePage):
         lang_code = self.cfg.get_language()
         for name, (json_code, tess_code) in Constants.LANGUAGES.items():
             if tess_code == lang_code or json_code == lang_code: self.lang_combo.setCurrentText(name); break
+        self.chk_start_minimized.setChecked(self.cfg.get_start_minimized())
 
         color_str = self.cfg.get_ocr_color()
         try: parts = [int(x.strip()) for x in color_str.split(',')]; (self.spin_r.setValue(parts[0]), self.spin_g.setValue(parts[1]), self.spin_b.setValue(parts[2])) if len(parts) == 3 else self._reset_ocr_color()
@@ -882,6 +968,9 @@ class SettingsWindow(BasePage):
         if idx >= 0: self.cmb_anchor.setCurrentIndex(idx)
         else: self.cmb_anchor.setCurrentIndex(0)
 
+        idx = self.cmb_renderer.findData(self.cfg.get_overlay_renderer())
+        self.cmb_renderer.setCurrentIndex(idx if idx >= 0 else 0)
+
         self.slider_offset_x.setValue(self.cfg.get_item_offset_x() // 50)
         self.slider_offset_y.setValue(self.cfg.get_item_offset_y() // 50)
         self.chk_future_hideout.setChecked(self.cfg.get_show_future_hideout())
@@ -891,6 +980,10 @@ class SettingsWindow(BasePage):
 
         self.chk_ultrawide.setChecked(self.cfg.get_full_screen_scan())
         self.chk_debug_save.setChecked(self.cfg.get_save_debug_images())
+        self.chk_speculative_scan.setChecked(self.cfg.get_speculative_scan())
+        self.chk_adaptive_capture.setChecked(self.cfg.get_adaptive_capture())
+        self.cmb_ocr_preprocess.setCurrentIndex(max(0, self.cmb_ocr_preprocess.findData(self.cfg.get_ocr_preprocess())))
+        self.chk_prefetch_icons.setChecked(self.cfg.get_prefetch_icons())
 
 
 
@@ -950,6 +1043,7 @@ class SettingsWindow(BasePage):
             if tess_code == lang:
                 self.lang_combo.setCurrentText(name)
                 break
+        self.chk_start_minimized.setChecked(self.cfg.DEFAULT_START_MINIMIZED)
 
         # Hotkeys
         self.hotkey_btn.set_hotkey(self.cfg.DEFAULT_HOTKEY_PRICE)
@@ -960,6 +1054,9 @@ class SettingsWindow(BasePage):
         self._reset_ocr_color()
         self.chk_ultrawide.setChecked(self.cfg.DEFAULT_FULL_SCREEN)
         self.chk_debug_save.setChecked(self.cfg.DEFAULT_DEBUG_SAVE)
+        self.chk_speculative_scan.setChecked(self.cfg.DEFAULT_SPECULATIVE_SCAN)
+        self.chk_adaptive_capture.setChecked(self.cfg.DEFAULT_ADAPTIVE_CAPTURE)
+        self.cmb_ocr_preprocess.setCurrentIndex(max(0, self.cmb_ocr_preprocess.findData(self.cfg.DEFAULT_OCR_PREPROCESS)))
 
     def _reset_item_overlay_tab(self):
         self.item_font_size.setValue(self.cfg.DEFAULT_ITEM_FONT)
@@ -968,6 +1065,7 @@ class SettingsWindow(BasePage):
         self.slider_offset_y.setValue(self.cfg.DEFAULT_ITEM_OFFSET_Y)
         self.item_opacity.setValue(self.cfg.DEFAULT_ITEM_OPACITY)
         self.cmb_anchor.setCurrentText(self.cfg.DEFAULT_ANCHOR_MODE)
+        self.cmb_renderer.setCurrentIndex(max(0, self.cmb_renderer.findData(self.cfg.DEFAULT_OVERLAY_RENDERER)))
 
         self.chk_future_hideout.setChecked(self.cfg.DEFAULT_SHOW_FUTURE_HIDEOUT)
         self.chk_future_project.setChecked(self.cfg.DEFAULT_SHOW_FUTURE_PROJECT)
@@ -998,11 +1096,16 @@ class SettingsWindow(BasePage):
         if display_name in Constants.LANGUAGES:
             lang_code = Constants.LANGUAGES[display_name][1]; self.cfg.set_language(lang_code); target = os.path.join(Constants.TESSDATA_DIR, f"{lang_code}.traineddata")
             if lang_code != 'eng' and not os.path.exists(target): QMessageBox.information(self, "Download Required", f"Downloading language data for {display_name}..."); self.request_lang_download.emit(lang_code)
+        self.cfg.set_start_minimized(self.chk_start_minimized.isChecked())
 
         color_str = f"{self.spin_r.value()}, {self.spin_g.value()}, {self.spin_b.value()}"
         self.cfg.set_ocr_color(color_str)
         self.cfg.set_full_screen_scan(self.chk_ultrawide.isChecked())
         self.cfg.set_save_debug_images(self.chk_debug_save.isChecked())
+        self.cfg.set_speculative_scan(self.chk_speculative_scan.isChecked())
+        self.cfg.set_adaptive_capture(self.chk_adaptive_capture.isChecked())
+        self.cfg.set_ocr_preprocess(self.cmb_ocr_preprocess.currentData())
+        self.cfg.set_prefetch_icons(self.chk_prefetch_icons.isChecked())
 
         new_order = []
         section_states = {}
@@ -1026,6 +1129,7 @@ class SettingsWindow(BasePage):
         )
         self.cfg.set('ItemOverlay', 'show_completed_hideout_reqs', self.chk_completed_hideout.isChecked())
         self.cfg.set('ItemOverlay', 'show_completed_project_reqs', self.chk_completed_project.isChecked())
+        self.cfg.set_overlay_renderer(self.cmb_renderer.currentData())
 
         self.cfg.set_quest_overlay_settings(
             self.quest_font_size.value(),
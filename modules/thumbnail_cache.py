@@ -0,0 +1,83 @@
+import os
+import time
+import tempfile
+from PIL import Image
+from .constants import Constants
+
+# Every size the UI asks for: 16 (inline), 32 (overlay item cards), 40 (grid cards),
+# 56 (overlay header), 64 (default loader size), 90 (inspector panel)
+THUMB_SIZES = (16, 32, 40, 56, 64, 90)
+
+ITEM_IMAGES_DIR = os.path.join(Constants.DATA_DIR, "images", "items")
+THUMBS_DIR = os.path.join(Constants.DATA_DIR, "images", "thumbs")
+
+
+def thumbnail_path(src_path, size):
+    """Path of the pre-scaled variant of src_path: images/thumbs/<size>/<file name incl. extension>.png (foo.png and foo.webp stay apart)."""
+    return os.path.join(THUMBS_DIR, str(size), f"{os.path.basename(src_path)}.png")
+
+
+def find_thumbnail(src_path, size):
+    """Returns the pre-scaled file for this size, or None if it was not generated."""
+    if size not in THUMB_SIZES: return None
+    path = thumbnail_path(src_path, size)
+    return path if os.path.exists(path) else None
+
+
+def generate_for_file(src_path, sizes=THUMB_SIZES, force=False):
+    """
+    Writes all thumbnail sizes for one image. Matches Qt's KeepAspectRatio + SmoothTransformation:
+    the result fits inside size x size (up- or downscaled). Skips variants newer than the source.
+    Returns the number of files written.
+    """
+    try: src_mtime = os.path.getmtime(src_path)
+    except OSError: return 0
+
+    todo = []
+    for size in sizes:
+        dest = thumbnail_path(src_path, size)
+        if force or not os.path.exists(dest) or os.path.getmtime(dest) < src_mtime: todo.append((size, dest))
+    if not todo: return 0
+
+    written = 0
+    try:
+        with Image.open(src_path) as img:
+            img = img.convert("RGBA")
+            w, h = img.size
+            if w <= 0 or h <= 0: return 0
+            for size, dest in todo:
+                scale = min(size / w, size / h)
+                tw, th = max(1, round(w * scale)), max(1, round(h * scale))
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                # Unique temp file: the startup/post-sync generators and the image fetch workers may write the same thumbnail at once
+                fd, tmp = tempfile.mkstemp(prefix=os.path.basename(dest) + ".", suffix=".tmp", dir=os.path.dirname(dest))
+                try:
+                    with os.fdopen(fd, 'wb') as f: img.resize((tw, th), Image.LANCZOS).save(f, format="PNG", optimize=False)
+                    os.replace(tmp, dest)
+                except Exception:
+                    try: os.remove(tmp)
+                    except OSError: pass
+                    raise
+                written += 1
+    except Exception as e:
+        print(f"[WARN] Thumbnail generation failed for {os.path.basename(src_path)}: {e}")
+    return written
+
+
+def generate_thumbnails(images_dir=None, sizes=THUMB_SIZES, progress_callback=None):
+    """
+    Generates pre-scaled variants for every item image (run after data sync).
+    Up-to-date thumbnails are skipped, so repeated runs are cheap.
+    """
+    images_dir = images_dir or ITEM_IMAGES_DIR
+    if not os.path.isdir(images_dir): return 0
+
+    files = [f for f in os.listdir(images_dir) if f.lower().endswith(('.png', '.webp', '.jpg', '.jpeg'))]
+    start = time.perf_counter(); written = 0
+    for i, filename in enumerate(files, start=1):
+        written += generate_for_file(os.path.join(images_dir, filename), sizes)
+        if progress_callback and (i % 25 == 0 or i == len(files)): progress_callback(i, len(files))
+
+    if written:
+        print(f"[INFO] Generated {written} thumbnails for {len(files)} images in {time.perf_counter() - start:.2f}s.")
+    return written
@@ -0,0 +1,246 @@
+"""
+Synthetic tooltip generator for OCR / matching benchmarks.
+
+Renders a tooltip-like screenshot for every item name (and language) in data/items/*.json:
+a cream box in the scanner's target colour with a rarity-coloured border, the item name as the
+title and placeholder text lines below, placed next to the cursor on a noisy "game" background.
+Variation: UI scale factors, pixel noise, background bleed (tooltip translucency) and random placement.
+
+Usage:
+    python -m modules.tooltip_synth OUT_DIR [--langs en,de] [--scales 1.0,1.5] [--noise 0.03] [--bleed 0.08]
+                                   [--variants 3] [--limit 100] [--font arial.ttf] [--lang-font ja=msgothic.ttc]
+
+Every language goes to OUT_DIR/<lang>/ with a manifest.json
+{"entries": [{"file", "name", "lang", "item_id", "rarity", "cursor", "scale", "box"}]} that
+modules.scan_benchmark (and modules.ocr_benchmark with --crops) read directly:
+    python -m modules.scan_benchmark OUT_DIR/de --lang de
+
+Matching cost against catalog size: both benchmarks take --catalog-scale N, which pads the scanner's
+item list with synthetic distractor names (see inflate_catalog) up to N times the real catalog.
+"""
+import os
+import sys
+import json
+import random
+import argparse
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from .constants import Constants
+
+DEFAULT_TARGET_COLOR = (249, 238, 223)
+TEXT_COLOR = (35, 35, 38)
+BODY_COLOR = (120, 116, 108)
+_FALLBACK_FONTS = ("arial.ttf", "segoeui.ttf", "DejaVuSans.ttf", "NotoSans-Regular.ttf", "LiberationSans-Regular.ttf")
+_font_cache = {}
+
+
+def load_catalog(items_dir=None):
+    """[{'id', 'names': {lang: name}, 'rarity'}] from the item JSON files."""
+    items_dir = items_dir or Constants.ITEMS_DIR
+    catalog = []
+    for filename in sorted(os.listdir(items_dir)):
+        if not filename.endswith('.json'): continue
+        try:
+            with open(os.path.join(items_dir, filename), 'r', encoding='utf-8') as f: item = json.load(f)
+        except (OSError, ValueError): continue
+        names = item.get('name')
+        if isinstance(names, str): names = {'en': names}
+        if not isinstance(names, dict) or not names: continue
+        catalog.append({'id': item.get('id', filename[:-5]), 'names': {k: str(v) for k, v in names.items() if v}, 'rarity': item.get('rarity', 'Common')})
+    return catalog
+
+
+def get_font(size, path=None):
+    key = (path, size)
+    if key not in _font_cache:
+        font = None
+        for candidate in ([path] if path else []) + list(_FALLBACK_FONTS):
+            try: font = ImageFont.truetype(candidate, size); break
+            except OSError: continue
+        if font is None:
+            try: font = ImageFont.load_default(size=size)
+            except TypeError: font = ImageFont.load_default()  # Pillow < 10.1 has no scalable default font
+        _font_cache[key] = font
+    return _font_cache[key]
+
+
+def _hex_to_rgb(hex_color):
+    c = hex_color.lstrip('#')
+    return tuple(int(c[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def _wrap(draw, text, font, max_width):
+    """Splits the name over at most two lines, like the in-game tooltip."""
+    if draw.textlength(text, font=font) <= max_width or ' ' not in text: return [text]
+    words = text.split(' ')
+    for i in range(len(words) - 1, 0, -1):
+        first = ' '.join(words[:i])
+        if draw.textlength(first, font=font) <= max_width: return [first, ' '.join(words[i:])]
+    return [text]
+
+
+def _background(rng, size):
+    """Dark, blotchy 'game scene' background."""
+    h, w = size[1], size[0]
+    base = rng.integers(15, 70, size=3)
+    grad = np.linspace(0, rng.integers(10, 60), h)[:, None, None]
+    img = np.clip(base[None, None, :] + grad + rng.normal(0, 6, (h, w, 3)), 0, 255)
+    for _ in range(rng.integers(4, 12)):
+        x1, y1 = rng.integers(0, w), rng.integers(0, h)
+        x2, y2 = min(w, x1 + rng.integers(40, 300)), min(h, y1 + rng.integers(40, 300))
+        img[y1:y2, x1:x2] = np.clip(img[y1:y2, x1:x2] * 0.5 + rng.integers(20, 120, size=3) * 0.5, 0, 255)
+    return img
+
+
+def render_tooltip(name, rarity="Common", font_path=None, scale=1.0, target_color=DEFAULT_TARGET_COLOR, noise=0.03, bleed=0.0, canvas=1200, rng=None):
+    """
+    Returns (PIL RGB screenshot, cursor (x, y), tooltip box (left, top, right, bottom)).
+    The cursor sits at the canvas centre, like the fixed-size captures of the scanner.
+    """
+    rng = rng or np.random.default_rng()
+    s = float(scale)
+    title_font = get_font(max(8, int(22 * s)), font_path)
+    pad, border = int(14 * s), max(2, int(3 * s))
+
+    probe = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    lines = _wrap(probe, name, title_font, int(380 * s))
+    line_h = int(title_font.size * 1.3) if hasattr(title_font, 'size') else int(26 * s)
+    text_w = max(int(probe.textlength(l, font=title_font)) for l in lines)
+    body_lines = int(rng.integers(3, 7))
+    w = max(int(260 * s), text_w + 2 * pad)
+    h = pad * 2 + line_h * len(lines) + int(10 * s) + body_lines * int(18 * s) + pad
+
+    # Tooltip box
+    tip = Image.new("RGB", (w, h), target_color)
+    draw = ImageDraw.Draw(tip)
+    y = pad
+    for line in lines:
+        draw.text((pad, y), line, font=title_font, fill=TEXT_COLOR); y += line_h
+    y += int(10 * s)
+    for _ in range(body_lines):
+        bar_w = int(rng.integers(int(w * 0.3), w - 2 * pad))
+        draw.rectangle((pad, y + int(4 * s), pad + bar_w, y + int(12 * s)), fill=BODY_COLOR); y += int(18 * s)
+
+    # Placement next to the cursor (right/below by default, flipped like the game near edges)
+    cx = cy = canvas // 2
+    off = int(rng.integers(12, 40) * s)
+    left = cx + off if rng.random() < 0.7 else cx - off - w
+    top = cy + off if rng.random() < 0.6 else cy - off - h
+    left = int(np.clip(left, border, canvas - w - border)); top = int(np.clip(top, border, canvas - h - border))
+
+    screen = _background(rng, (canvas, canvas))
+    accent = _hex_to_rgb(Constants.RARITY_COLORS.get(rarity, Constants.RARITY_COLORS["Common"]))
+    screen[top - border:top + h + border, left - border:left + w + border] = accent
+    region = screen[top:top + h, left:left + w]
+    screen[top:top + h, left:left + w] = np.asarray(tip, dtype=np.float64) * (1.0 - bleed) + region * bleed
+    if noise > 0: screen = screen + rng.normal(0, noise * 255, screen.shape)
+
+    img = Image.fromarray(np.clip(screen, 0, 255).astype(np.uint8), "RGB")
+    return img, (cx, cy), (left, top, left + w, top + h)
+
+
+def generate(out_dir, langs=None, font_path=None, lang_fonts=None, scales=(1.0,), noise=0.03, bleed=0.0, variants=1, limit=None, seed=0,
+             target_color=DEFAULT_TARGET_COLOR, canvas=1200, crops=False, items_dir=None):
+    """Renders the corpus; returns {lang: image count}."""
+    catalog = load_catalog(items_dir)
+    if limit: catalog = catalog[:limit]
+    langs = langs or [code for code, _ in Constants.LANGUAGES.values()]
+    lang_fonts = lang_fonts or {}
+    rng = np.random.default_rng(seed); pick = random.Random(seed)
+    counts = {}
+
+    for lang in langs:
+        lang_dir = os.path.join(out_dir, lang); os.makedirs(lang_dir, exist_ok=True)
+        if crops: os.makedirs(os.path.join(lang_dir, "crops"), exist_ok=True)
+        entries, crop_entries = [], []
+        for item in catalog:
+            name = item['names'].get(lang)
+            if not name: continue
+            for v in range(variants):
+                scale = pick.choice(scales)
+                img, cursor, box = render_tooltip(name, item['rarity'], lang_fonts.get(lang, font_path), scale, target_color, noise,
+                                                  bleed * rng.random() if bleed else 0.0, canvas, rng)
+                filename = f"{item['id']}_{v}_raw.png"
+                img.save(os.path.join(lang_dir, filename))
+                entries.append({'file': filename, 'name': name, 'lang': lang, 'item_id': item['id'], 'rarity': item['rarity'],
+                                'cursor': list(cursor), 'scale': scale, 'box': list(box)})
+                if crops:
+                    crop_name = f"{item['id']}_{v}_tooltip_result.png"
+                    l, t, r, b = box; m = 5 + max(2, int(3 * scale))  # Detection padding + border, like find_color_region
+                    img.crop((l - m, t - m, r + m, b + m)).save(os.path.join(lang_dir, "crops", crop_name))
+                    crop_entries.append({'file': crop_name, 'name': name, 'lang': lang, 'item_id': item['id'], 'rarity': item['rarity']})
+
+        meta = {'seed': seed, 'scales': list(scales), 'noise': noise, 'bleed': bleed, 'variants': variants, 'canvas': canvas,
+                'font': lang_fonts.get(lang, font_path), 'target_color': list(target_color)}
+        with open(os.path.join(lang_dir, "manifest.json"), 'w', encoding='utf-8') as f:
+            json.dump({'generator': meta, 'entries': entries}, f, ensure_ascii=False, indent=1)
+        if crops:
+            with open(os.path.join(lang_dir, "crops", "manifest.json"), 'w', encoding='utf-8') as f:
+                json.dump({'generator': meta, 'entries': crop_entries}, f, ensure_ascii=False, indent=1)
+        counts[lang] = len(entries)
+        print(f"[INFO] {lang}: {len(entries)} tooltips -> {lang_dir}")
+    return counts
+
+
+def distractor_names(real_names, count, seed=0):
+    """count unique fake item names recombined from the words of real_names (never equal to a real name)."""
+    rng = random.Random(seed)
+    words = sorted({w for name in real_names for w in name.split()})
+    taken = {n.lower() for n in real_names}; names = []
+    if not words: return names
+    attempts = 0
+    while len(names) < count:
+        attempts += 1
+        name = " ".join(rng.choice(words) for _ in range(rng.choice((1, 2, 2, 3))))
+        if attempts > count * 20: name = f"{name} {len(names)}"  # Small vocabulary: force uniqueness
+        if name.lower() in taken: continue
+        taken.add(name.lower()); names.append(name)
+    return names
+
+
+def inflate_catalog(scanner, scale, seed=0):
+    """
+    Pads the scanner's language-filtered item list with distractor items until it is `scale` times the real size,
+    so _find_best_match runs against a larger catalog. Call after update_settings (a language change resets it).
+    Distractors get ids 'synthetic_<n>' and rarities drawn from the real catalog. Returns the number added.
+    """
+    scanner._cached_filtered_items = None  # Rebuild from the real items (no compounding across calls)
+    real = list(scanner._get_language_filtered_items())
+    count = int(len(real) * (scale - 1))
+    if count <= 0: return 0
+    rng = random.Random(seed)
+    rarities = [item.get('rarity', 'Common') for _, item in real] or ['Common']
+    extra = [(name, {'id': f"synthetic_{i}", 'name': name, 'rarity': rng.choice(rarities)})
+             for i, name in enumerate(distractor_names([name for name, _ in real], count, seed))]
+    scanner._cached_filtered_items = real + extra
+    return len(extra)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render synthetic tooltip screenshots with a manifest for the scan/OCR benchmarks.")
+    parser.add_argument('out_dir')
+    parser.add_argument('--langs', default=None, help="Comma separated data language codes (default: all supported)")
+    parser.add_argument('--scales', default="1.0", help="Comma separated UI scale factors, picked per image")
+    parser.add_argument('--noise', type=float, default=0.03, help="Gaussian pixel noise (fraction of 255)")
+    parser.add_argument('--bleed', type=float, default=0.0, help="Max background bleed through the tooltip (0-1)")
+    parser.add_argument('--variants', type=int, default=1, help="Images per item and language (corpus size multiplier)")
+    parser.add_argument('--limit', type=int, default=None, help="Only the first N items")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--canvas', type=int, default=1200, help="Screenshot size in px (cursor at the centre)")
+    parser.add_argument('--font', default=None, help="TrueType font for all languages")
+    parser.add_argument('--lang-font', action='append', default=[], metavar="LANG=PATH", help="Font override per language (e.g. CJK)")
+    parser.add_argument('--target-color', default=",".join(map(str, DEFAULT_TARGET_COLOR)), help="Tooltip background R,G,B")
+    parser.add_argument('--crops', action='store_true', help="Also write the cropped tooltips (ocr_benchmark corpus) to <lang>/crops")
+    args = parser.parse_args(argv)
+
+    lang_fonts = dict(spec.split('=', 1) for spec in args.lang_font if '=' in spec)
+    counts = generate(args.out_dir, [l.strip() for l in args.langs.split(',')] if args.langs else None, args.font, lang_fonts,
+                      tuple(float(s) for s in args.scales.split(',')), args.noise, args.bleed, max(1, args.variants), args.limit, args.seed,
+                      tuple(int(c) for c in args.target_color.split(',')), args.canvas, args.crops)
+    print(f"[INFO] Generated {sum(counts.values())} tooltips in {len(counts)} languages.")
+    return 0 if counts else 1
+
+
+if __name__ == '__main__': sys.exit(main())
@@ -11,6 +11,21 @@ import os
 import sys
 import ctypes
 from PyQt6.QtCore import QObject, QEvent
+from .thumbnail_cache import find_thumbnail
+
+def load_item_pixmap(src_path, size):
+    """
+    Loads an item image at size x size (KeepAspectRatio).
+    Uses the pre-scaled thumbnail generated at sync time when available, so no resampling
+    happens on the GUI thread; falls back to scaling the full-size file.
+    """
+    thumb = find_thumbnail(src_path, size)
+    if thumb:
+        pix = QPixmap(thumb)
+        if not pix.isNull(): return pix
+    pix = QPixmap(src_path)
+    if pix.isNull(): return pix
+    return pix.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
 
 def ensure_window_within_screen(x, y, border_tolerance=20):
     """
@@ -1,8 +1,8 @@
 from PyQt6.QtCore import QObject, pyqtSignal
-import requests
 import json
 import os
 from .constants import Constants
+from .http_client import get_http_client
 
 class UpdateChecker(QObject):
     """
@@ -14,6 +14,13 @@ class UpdateChecker(QObject):
     download_progress = pyqtSignal(int, int, str)
     update_complete = pyqtSignal(bool, str)
 
+    COMMITS_API_URL = "https://api.github.com/repos/RaidTheory/arcraiders-data/commits/main"
+    REPO_API_URL = "https://api.github.com/repos/RaidTheory/arcraiders-data"
+    REPO_ZIP_URL = "https://github.com/RaidTheory/arcraiders-data/archive/refs/heads/main.zip"
+
+    # Last commit date seen by any checker in this process (startup check -> download reuses it)
+    _last_remote_date = None
+
     def __init__(self):
         super().__init__()
         self.local_versions = self._load_local_versions()
@@ -32,12 +39,11 @@ class UpdateChecker(QObject):
     def get_remote_commit_date(self):
         """Fetches the latest commit date from the GitHub repository."""
         try:
-            repo_api_url = "https://api.github.com/repos/RaidTheory/arcraiders-data/commits/main"
-            response = requests.get(repo_api_url, timeout=10)
-            response.raise_for_status()
-            commit_data = response.json()
+            # Conditional request: an unchanged repo answers 304 and we reuse the cached body
+            commit_data = get_http_client().get_json(self.COMMITS_API_URL, timeout=10)
             # ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ
             date_str = commit_data['commit']['committer']['date']
+            UpdateChecker._last_remote_date = date_str
             return date_str
         except Exception as e:
             print(f"Error fetching remote date: {e}")
@@ -65,11 +71,11 @@ class UpdateChecker(QObject):
 
     def run_check(self):
         """Checks if we can reach GitHub, then offers a full refresh since versions.json is deprecated."""
+        import requests  # Deferred: only needed once an update check actually runs
         self.checking_for_updates.emit()
         # Just check connection for the manual button
         try:
-            repo_api_url = "https://api.github.com/repos/RaidTheory/arcraiders-data"
-            requests.get(repo_api_url, timeout=10).raise_for_status()
+            get_http_client().get(self.REPO_API_URL, timeout=10).raise_for_status()
             self.update_check_finished.emit([{'path': 'FULL_SYNC', 'sha': 'zip'}], "Connection established. A full data refresh is available.")
         except requests.exceptions.RequestException as e:
             self.update_check_finished.emit([], f"Error: Could not connect to GitHub. ({e})")
@@ -101,11 +107,13 @@ class UpdateChecker(QObject):
 
         self.download_progress.emit(0, 100, "Downloading latest game data ZIP...")
         
-        repo_url = "https://github.com/RaidTheory/arcraiders-data/archive/refs/heads/main.zip"
         data_dir = Path(Constants.DATA_DIR)
 
+        # Reuse the date from the startup check instead of hitting the commits API again
+        remote_date = UpdateChecker._last_remote_date or self.get_remote_commit_date()
+
         try:
-            resp = requests.get(repo_url, timeout=60)
+            resp = get_http_client().get(self.REPO_ZIP_URL, timeout=60)
             resp.raise_for_status()
             
             self.download_progress.emit(50, 100, "Extracting updates...")
@@ -154,10 +162,24 @@ class UpdateChecker(QObject):
             fix_count = DatabaseFixer.apply_fixes(Constants.DATA_DIR)
             print(f"[INFO] Applied {fix_count} database fixes.")
 
+            # --- PRE-SCALE ITEM ICONS ---
+            from .thumbnail_cache import generate_thumbnails
+            self.download_progress.emit(90, 100, "Generating thumbnails...")
+            generate_thumbnails()
+
+            # --- OCR VOCABULARIES ---
+            from .ocr_vocabulary import generate_ocr_vocabularies
+            self.download_progress.emit(95, 100, "Building OCR vocabularies...")
+            generate_ocr_vocabularies()
+
+            # --- COMPILE STARTUP SNAPSHOT ---
+            from .data_manager import build_game_data_snapshot
+            self.download_progress.emit(98, 100, "Compiling game data...")
+            build_game_data_snapshot()
+
             self.update_complete.emit(True, f"Successfully synced {updated_count} files from GitHub. Please restart.")
             
             # Save the remote timestamp as local version
-            remote_date = self.get_remote_commit_date()
             if remote_date:
                 self.save_local_data_date(remote_date)
 
@@ -177,24 +199,15 @@ class UpdateChecker(QObject):
 
         self.download_progress.emit(0, 100, f"Downloading {filename}...")
         
+        def on_progress(downloaded, total_size):
+            # Emit progress as percentage if we know total size
+            if total_size > 0:
+                percent = int((downloaded / total_size) * 100)
+                self.download_progress.emit(percent, 100, f"Downloading {filename}")
+
         try:
             os.makedirs(Constants.TESSDATA_DIR, exist_ok=True)
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            block_size = 8192
-            downloaded = 0
-            
-            with open(target_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=block_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        # Emit progress as percentage if we know total size
-                        if total_size > 0:
-                            percent = int((downloaded / total_size) * 100)
-                            self.download_progress.emit(percent, 100, f"Downloading {filename}")
+            get_http_client().download_to_file(url, target_path, timeout=30, progress_callback=on_progress)
             
             self.update_complete.emit(True, f"Successfully downloaded {filename}")
             